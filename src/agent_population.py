@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Columnar Agent Population
+
+Stores large agent populations column-wise instead of as one
+AgentSpecification dataclass per agent:
+
+- the four genetic traits live in one trait-major float32 array, so every
+  trait is a contiguous column (``population.trait("risk_tolerance")``)
+- roles are interned into a small category table and stored as int32 codes
+- specializations, responsibilities and collaboration partners are interned
+  as one tuple-of-tuples per distinct combination, also stored as int32
+  codes; -1 means the defaults derived from the role, which is what agents
+  built from a bare trait matrix get
+
+That is 24 bytes per agent instead of several hundred. AgentSpecification
+objects are materialized on demand, and the population converts to and from
+the existing dataclasses and EcosystemDesign without losing any field
+(``from_ecosystem`` / ``to_ecosystem``).
+
+Traits are stored as float32, so values read back through a view may differ
+from the original Python floats in the eighth significant digit.
+"""
+
+import dataclasses
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from meta_agent_demonstration import AgentSpecification, CollaborationGraph, EcosystemDesign
+
+TRAIT_NAMES = ("risk_tolerance", "innovation_factor", "quality_obsession", "collaboration_style")
+
+# (specializations, responsibilities, collaboration_partners) of an agent
+_Details = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+
+class AgentPopulation:
+    """Columnar, growable store of agent genetic traits and roles."""
+
+    def __init__(self, capacity: int = 0):
+        self._traits = np.empty((len(TRAIT_NAMES), max(capacity, 1)), dtype=np.float32)
+        self._role_codes = np.empty(max(capacity, 1), dtype=np.int32)
+        self._detail_codes = np.empty(max(capacity, 1), dtype=np.int32)
+        self._agent_ids: Optional[List[str]] = None
+        self._size = 0
+        self.roles: List[str] = []
+        self._role_index: Dict[str, int] = {}
+        self.details: List[_Details] = []
+        self._detail_index: Dict[_Details, int] = {}
+        # The design from_ecosystem read, without its agents; to_ecosystem's default template
+        self.ecosystem_template: Optional[EcosystemDesign] = None
+
+    @classmethod
+    def from_traits(cls, traits: np.ndarray, roles: Union[str, Sequence[str]],
+                    agent_ids: Optional[Sequence[str]] = None) -> "AgentPopulation":
+        """
+        Build a population from a (4, n) trait matrix in TRAIT_NAMES order.
+
+        ``roles`` is either one role for every agent or one role per agent.
+        """
+        traits = np.asarray(traits, dtype=np.float32)
+        if traits.ndim != 2 or traits.shape[0] != len(TRAIT_NAMES):
+            raise ValueError(f"traits must have shape ({len(TRAIT_NAMES)}, n), got {traits.shape}")
+        size = traits.shape[1]
+        population = cls(size)
+        population._traits[:, :size] = traits
+        if isinstance(roles, str):
+            population._role_codes[:size] = population.intern_role(roles)
+        else:
+            if len(roles) != size:
+                raise ValueError(f"expected {size} roles, got {len(roles)}")
+            population._role_codes[:size] = [population.intern_role(role) for role in roles]
+        population._detail_codes[:size] = -1
+        if agent_ids is not None:
+            population._agent_ids = list(agent_ids)
+        population._size = size
+        return population
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[AgentSpecification]) -> "AgentPopulation":
+        specs = list(specs)
+        traits = np.array([[spec.genetic_traits[name] for spec in specs] for name in TRAIT_NAMES],
+                          dtype=np.float32).reshape(len(TRAIT_NAMES), len(specs))
+        population = cls.from_traits(traits, [spec.role for spec in specs], [spec.agent_id for spec in specs])
+        population._detail_codes[:len(specs)] = [population.intern_details(spec) for spec in specs]
+        return population
+
+    @classmethod
+    def from_ecosystem(cls, ecosystem_design: EcosystemDesign) -> "AgentPopulation":
+        population = cls.from_specs(ecosystem_design.agent_specifications)
+        population.ecosystem_template = dataclasses.replace(ecosystem_design, agent_specifications=[])
+        return population
+
+    @classmethod
+    def concat(cls, populations: Sequence["AgentPopulation"]) -> "AgentPopulation":
+        merged = cls(sum(len(population) for population in populations))
+        for population in populations:
+            merged.extend(population)
+        return merged
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.view(int(index))
+        return self.select(index)
+
+    def __iter__(self) -> Iterator[AgentSpecification]:
+        for index in range(self._size):
+            yield self.view(index)
+
+    @property
+    def traits(self) -> np.ndarray:
+        """(4, n) float32 view of all traits, one contiguous row per trait."""
+        return self._traits[:, :self._size]
+
+    @property
+    def role_codes(self) -> np.ndarray:
+        return self._role_codes[:self._size]
+
+    @property
+    def detail_codes(self) -> np.ndarray:
+        return self._detail_codes[:self._size]
+
+    @property
+    def nbytes(self) -> int:
+        return self.traits.nbytes + self.role_codes.nbytes + self.detail_codes.nbytes
+
+    def trait(self, name: str) -> np.ndarray:
+        return self._traits[TRAIT_NAMES.index(name), :self._size]
+
+    def intern_role(self, role: str) -> int:
+        code = self._role_index.get(role)
+        if code is None:
+            code = self._role_index[role] = len(self.roles)
+            self.roles.append(role)
+        return code
+
+    def intern_details(self, spec: AgentSpecification) -> int:
+        return self._intern_detail_tuple(
+            (tuple(spec.specializations), tuple(spec.responsibilities), tuple(spec.collaboration_partners))
+        )
+
+    def role_code(self, role: str) -> int:
+        """Category code of ``role``; -1 when no agent has it."""
+        return self._role_index.get(role, -1)
+
+    def agent_id(self, index: int) -> str:
+        if self._agent_ids is not None:
+            return self._agent_ids[index]
+        return f"agent-{index + 1}"
+
+    def view(self, index: int) -> AgentSpecification:
+        """Materialize one agent as an AgentSpecification."""
+        if not -self._size <= index < self._size:
+            raise IndexError(f"agent index {index} out of range for population of {self._size}")
+        index %= self._size
+        role = self.roles[self._role_codes[index]]
+        code = self._detail_codes[index]
+        if code >= 0:
+            specializations, responsibilities, partners = self.details[code]
+        else:
+            specializations, responsibilities, partners = (role,), (f"Primary responsibility for {role}",), ()
+        return AgentSpecification(
+            agent_id=self.agent_id(index),
+            role=role,
+            genetic_traits={name: float(self._traits[row, index]) for row, name in enumerate(TRAIT_NAMES)},
+            specializations=list(specializations),
+            responsibilities=list(responsibilities),
+            collaboration_partners=list(partners)
+        )
+
+    def to_specs(self) -> List[AgentSpecification]:
+        return list(self)
+
+    def to_ecosystem(self, template: Optional[EcosystemDesign] = None) -> EcosystemDesign:
+        """
+        EcosystemDesign with this population as its agents.
+
+        Every field but the agents comes from ``template``, by default the
+        design the population was read from. A collaboration graph is rebuilt
+        for the current agents when the template has one.
+        """
+        template = template or self.ecosystem_template
+        if template is None:
+            raise ValueError("population was not built from an EcosystemDesign; pass a template")
+        agents = self.to_specs()
+        graph = CollaborationGraph.from_agents(agents) if template.collaboration_graph is not None else None
+        return dataclasses.replace(template, total_agents=len(agents), agent_specifications=agents,
+                                   collaboration_graph=graph)
+
+    def select(self, index) -> "AgentPopulation":
+        """New population holding the agents picked by a slice, mask or index array."""
+        positions = np.arange(self._size)[index]
+        selected = AgentPopulation(len(positions))
+        selected._traits[:, :len(positions)] = self.traits[:, positions]
+        selected._role_codes[:len(positions)] = self.role_codes[positions]
+        selected._detail_codes[:len(positions)] = self.detail_codes[positions]
+        selected.roles, selected._role_index = list(self.roles), dict(self._role_index)
+        selected.details, selected._detail_index = list(self.details), dict(self._detail_index)
+        selected.ecosystem_template = self.ecosystem_template
+        selected._agent_ids = [self.agent_id(position) for position in positions]
+        selected._size = len(positions)
+        return selected
+
+    def append(self, spec: AgentSpecification) -> None:
+        self._reserve(self._size + 1)
+        self._traits[:, self._size] = [spec.genetic_traits[name] for name in TRAIT_NAMES]
+        self._role_codes[self._size] = self.intern_role(spec.role)
+        self._detail_codes[self._size] = self.intern_details(spec)
+        self._append_ids([spec.agent_id])
+        self._size += 1
+
+    def extend(self, agents: Union["AgentPopulation", Iterable[AgentSpecification]]) -> None:
+        if not isinstance(agents, AgentPopulation):
+            agents = AgentPopulation.from_specs(agents)
+        start, end = self._size, self._size + len(agents)
+        self._reserve(end)
+        self._traits[:, start:end] = agents.traits
+        # Re-map the other population's role codes onto this population's categories
+        code_map = np.array([self.intern_role(role) for role in agents.roles] or [0], dtype=np.int32)
+        self._role_codes[start:end] = code_map[agents.role_codes]
+        # Same for detail codes; -1 (role defaults) picks the trailing -1
+        detail_map = np.array([self._intern_detail_tuple(details) for details in agents.details] + [-1], dtype=np.int32)
+        self._detail_codes[start:end] = detail_map[agents.detail_codes]
+        if self._agent_ids is not None or agents._agent_ids is not None:
+            self._append_ids([agents.agent_id(index) for index in range(len(agents))])
+        self._size = end
+
+    def _intern_detail_tuple(self, details: _Details) -> int:
+        code = self._detail_index.get(details)
+        if code is None:
+            code = self._detail_index[details] = len(self.details)
+            self.details.append(details)
+        return code
+
+    def _append_ids(self, agent_ids: List[str]) -> None:
+        if self._agent_ids is None:
+            self._agent_ids = [self.agent_id(index) for index in range(self._size)]
+        self._agent_ids.extend(agent_ids)
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= self._traits.shape[1]:
+            return
+        capacity = max(capacity, self._traits.shape[1] * 2)
+        traits = np.empty((len(TRAIT_NAMES), capacity), dtype=np.float32)
+        traits[:, :self._size] = self.traits
+        role_codes = np.empty(capacity, dtype=np.int32)
+        role_codes[:self._size] = self.role_codes
+        detail_codes = np.empty(capacity, dtype=np.int32)
+        detail_codes[:self._size] = self.detail_codes
+        self._traits, self._role_codes, self._detail_codes = traits, role_codes, detail_codes
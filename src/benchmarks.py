@@ -0,0 +1,807 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Benchmarks
+
+Reproducible benchmark suite for the meta-agent system. Run directly:
+
+    python src/benchmarks.py                          # every scenario
+    python src/benchmarks.py task_latency batch_throughput --samples 5
+    python src/benchmarks.py --output run.json --compare baseline.json
+
+Scenarios:
+- task_latency: single-task handle_task and analyze_task latency per TaskScope
+- batch_throughput: handle_tasks throughput over a mixed-scope corpus
+- result_memory: retained memory and serialized size of one result per TaskScope
+- scope_templates: per-task allocation and latency with shared frozen
+  per-scope templates vs. rebuilding the static payloads every call
+- incremental_replanning: replan_task vs. handle_task over repeated small
+  edits of one task description per TaskScope
+- result_serialization: asdict + json.dumps vs. the result encoders (JSON,
+  msgpack) on a 100-agent ecosystem
+- collaboration_graph: CollaborationGraph build and query time for large ecosystems
+- role_allocation: AgentEcosystemDesigner role allocation with batched trait
+  generation vs. one _create_specialist_agent call per agent
+- keyword_matching: compiled single-pass matcher vs. the original repeated
+  substring scans, on the multi-KB migration briefs under workflow_examples/
+- score_batch: TaskScopeAnalyzer.score_batch vs. per-task
+  _calculate_scope_score(_extract_scope_indicators(...)) scoring
+- delivery_risk: DeliveryRiskSimulator seconds per 10^6 Monte Carlo samples
+  of each TaskScope's roadmap
+- genetic_evolution: seconds per generation for large trait populations
+- optimization_rules: RuleEngine tick latency for thousands of compiled
+  threshold/trend rules over a 10^5-agent PerformanceStream
+- performance_stream: PerformanceStream event ingest rate and metric query
+  latency for 10^5 agents
+- result_store: ResultStore ingest rate and point-query latency (--store-tasks,
+  up to 10^6)
+- roadmap_scheduler: RoadmapScheduler full schedule, critical path and
+  incremental duration updates on a 10^5-phase merged program
+- service_load: p50/p99 latency of GenesisService under an open-loop load
+  test at a target request rate (--rps)
+- trait_index: TraitIndex range / nearest-neighbor queries vs. a linear scan
+  over AgentSpecification trait dicts
+
+Task-driven scenarios use SyntheticTaskGenerator, which builds descriptions
+from the analyzer's own keyword vocabularies in controllable MICRO→MEGA
+proportions. With the same --seed the corpus, coordinator seed and agent
+counts are identical from run to run, so JSON outputs can be diffed.
+
+Stage latency is simulated with a VirtualClock, so scenarios measure the
+pipeline's own compute cost and report simulated end-to-end latency
+alongside it; pass --real-clock to block on the meta-agents' delays instead.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dataclasses import asdict
+
+from meta_agent_demonstration import (
+    CollaborationGraph, GenesisMetaCoordinator, PipelineResult, RealClock, StageMetrics, TaskScope, TaskScopeAnalyzer, VirtualClock,
+    decode_result_msgpack, encode_result_json, encode_result_msgpack, result_to_dict
+)
+
+DEMO_TASKS = [
+    "Fix a null pointer exception in the user login validation method",
+    "Build a REST API for user management with authentication and basic CRUD operations",
+    "Create a complete e-commerce platform with inventory management, payment processing, and analytics dashboard",
+    "Design and implement a global multi-tenant SaaS platform for enterprise resource planning with real-time analytics",
+    "Develop a revolutionary quantum-computing-based artificial intelligence framework for breakthrough scientific discovery"
+]
+
+WORKFLOW_EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "workflow_examples"
+
+
+def load_workflow_briefs() -> List[str]:
+    """Load the workflow example documents as long task descriptions."""
+    return [path.read_text(encoding="utf-8") for path in sorted(WORKFLOW_EXAMPLES_DIR.glob("*.md"))]
+
+
+class SyntheticTaskGenerator:
+    """
+    Seeded generator of realistic task descriptions with a known TaskScope.
+
+    Descriptions combine an action, a subject and keywords drawn from the
+    analyzer's own indicator and specialization vocabularies; the keyword
+    budget is picked per target scope and every candidate is checked against
+    the real scope formula, so the requested proportions are exact.
+    """
+
+    DEFAULT_PROPORTIONS = {
+        TaskScope.MICRO: 0.30,
+        TaskScope.SMALL: 0.25,
+        TaskScope.MEDIUM: 0.20,
+        TaskScope.LARGE: 0.15,
+        TaskScope.MEGA: 0.10
+    }
+
+    # How many distinct vocabulary keywords to weave in for each target scope
+    KEYWORD_BUDGETS = {
+        TaskScope.MICRO: (0, 1),
+        TaskScope.SMALL: (2, 4),
+        TaskScope.MEDIUM: (4, 7),
+        TaskScope.LARGE: (7, 11),
+        TaskScope.MEGA: (11, 18)
+    }
+
+    ACTIONS = ("Fix", "Build", "Design", "Implement", "Refactor", "Migrate", "Create", "Develop", "Modernize")
+    SUBJECTS = (
+        "the order history page", "a reporting service", "the customer onboarding flow",
+        "the billing module", "a notification pipeline", "the search experience",
+        "an internal admin tool", "the mobile checkout", "a document workflow"
+    )
+    CONTEXTS = (
+        "for the operations team", "before the quarterly release", "used by partner companies",
+        "with clear acceptance criteria", "across two regions", "for the finance department"
+    )
+
+    def __init__(self, seed: int = 0, proportions: Optional[Dict[TaskScope, float]] = None):
+        self.rng = random.Random(seed)
+        self.proportions = dict(proportions or self.DEFAULT_PROPORTIONS)
+        if sum(self.proportions.values()) <= 0:
+            raise ValueError("proportions must contain a positive weight")
+        self.analyzer = TaskScopeAnalyzer()
+        self.vocabulary = sorted({
+            keyword.rstrip("*")
+            for keywords in {**TaskScopeAnalyzer.SCOPE_INDICATOR_KEYWORDS, **TaskScopeAnalyzer.SPECIALIZATION_KEYWORDS}.values()
+            for keyword in keywords
+        })
+
+    def generate(self, count: int) -> Iterator[Tuple[TaskScope, str]]:
+        scopes, weights = zip(*self.proportions.items())
+        for _ in range(count):
+            scope = self.rng.choices(scopes, weights)[0]
+            yield scope, self.describe(scope)
+
+    def describe(self, scope: TaskScope, attempts: int = 200) -> str:
+        """One description whose analyzed scope is ``scope``."""
+        low, high = self.KEYWORD_BUDGETS[scope]
+        description = ""
+        for _ in range(attempts):
+            keywords = self.rng.sample(self.vocabulary, self.rng.randint(low, high))
+            description = " ".join([
+                self.rng.choice(self.ACTIONS), self.rng.choice(self.SUBJECTS),
+                *(["with", ", ".join(keywords)] if keywords else []),
+                self.rng.choice(self.CONTEXTS)
+            ])
+            indicators = self.analyzer._extract_scope_indicators(description)
+            if self.analyzer._determine_scope_category(self.analyzer._calculate_scope_score(indicators)) == scope:
+                return description
+        raise RuntimeError(f"could not generate a {scope.value} description in {attempts} attempts")
+
+    def corpus(self, per_scope: int) -> Dict[TaskScope, List[str]]:
+        return {scope: [self.describe(scope) for _ in range(per_scope)] for scope in TaskScope}
+
+
+def _quietly(function: Callable, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _substring_scan(task_description: str) -> Dict[str, int]:
+    # The original matcher: one `word in text` scan per keyword and family
+    task_lower = task_description.lower()
+    families = {**TaskScopeAnalyzer.SCOPE_INDICATOR_KEYWORDS, **TaskScopeAnalyzer.SPECIALIZATION_KEYWORDS}
+    return {
+        family: sum(1 for word in keywords if word.rstrip("*") in task_lower)
+        for family, keywords in families.items()
+    }
+
+
+def _compiled_scan(task_description: str) -> Dict[str, int]:
+    hits = TaskScopeAnalyzer.keyword_matcher.match(task_description)
+    return {family: len(keywords) for family, keywords in hits.items()}
+
+
+def _time_per_call(function: Callable[[str], object], inputs: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in inputs:
+            function(text)
+    return (time.perf_counter() - start) / (repeat * len(inputs))
+
+
+def benchmark_task_latency(seed: int = 0, samples: int = 3, clock: Optional[RealClock] = None) -> Dict[str, Any]:
+    corpus = SyntheticTaskGenerator(seed).corpus(samples)
+    metrics = StageMetrics()
+    coordinator = GenesisMetaCoordinator(seed=seed, metrics=metrics, clock=clock or VirtualClock(seed=seed))
+    results: Dict[str, Any] = {}
+    for scope, descriptions in corpus.items():
+        handle_latencies, analyze_latencies = [], []
+        for description in descriptions:
+            start = time.perf_counter()
+            _quietly(coordinator.task_analyzer.analyze_task, description)
+            analyze_latencies.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            _quietly(coordinator.handle_task, description)
+            handle_latencies.append(time.perf_counter() - start)
+        results[scope.value] = {
+            "handle_task_p50_seconds": _percentile(handle_latencies, 0.5),
+            "handle_task_max_seconds": max(handle_latencies),
+            "analyze_task_p50_seconds": _percentile(analyze_latencies, 0.5),
+        }
+    # End-to-end latency on the clock's time line (simulated unless --real-clock)
+    for scope, task_metrics in metrics.snapshot()["task"].items():
+        results[scope]["pipeline_mean_seconds"] = task_metrics["wall_sum"] / task_metrics["count"]
+    return results
+
+
+def benchmark_batch_throughput(seed: int = 0, batch_size: int = 40, workers: Optional[int] = None,
+                               clock: Optional[RealClock] = None) -> Dict[str, Any]:
+    descriptions = [description for _, description in SyntheticTaskGenerator(seed).generate(batch_size)]
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=clock or VirtualClock(seed=seed))
+    start = time.perf_counter()
+    outcomes = list(coordinator.handle_tasks(descriptions, workers=workers, ordered=False))
+    elapsed = time.perf_counter() - start
+    return {
+        "tasks": batch_size,
+        "workers": workers or "cpu_count",
+        "failures": sum(not outcome.ok for outcome in outcomes),
+        "tasks_per_second": batch_size / elapsed,
+    }
+
+
+def benchmark_result_memory(seed: int = 0, clock: Optional[RealClock] = None) -> Dict[str, Any]:
+    generator = SyntheticTaskGenerator(seed)
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=clock or VirtualClock(seed=seed))
+    results: Dict[str, Any] = {}
+    for scope in TaskScope:
+        description = generator.describe(scope)
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        result = _quietly(coordinator.handle_task, description)
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[scope.value] = {
+            "agents": result["ecosystem_design"]["total_agents"],
+            "retained_bytes": retained,
+            "json_bytes": len(encode_result_json(result).encode("utf-8")),
+        }
+    return results
+
+
+def _without_shared_templates(coordinator: GenesisMetaCoordinator) -> GenesisMetaCoordinator:
+    """Rebind every @shared_template method of the meta-agents to its original builder."""
+    for agent in vars(coordinator).values():
+        for name, attribute in vars(type(agent)).items():
+            # staticmethod/classmethod objects also expose __wrapped__; templates are plain functions
+            if isinstance(attribute, types.FunctionType) and hasattr(attribute, "__wrapped__"):
+                setattr(agent, name, types.MethodType(attribute.__wrapped__, agent))
+    return coordinator
+
+
+def benchmark_scope_templates(seed: int = 0, tasks: int = 200) -> Dict[str, Any]:
+    corpus = SyntheticTaskGenerator(seed).corpus(tasks)
+    results: Dict[str, Any] = {}
+    for scope, descriptions in corpus.items():
+        scope_results = {}
+        for variant, shared in (("shared", True), ("rebuilt", False)):
+            coordinator = GenesisMetaCoordinator(seed=seed, clock=VirtualClock(seed=seed))
+            if not shared:
+                _without_shared_templates(coordinator)
+            start = time.perf_counter()
+            _quietly(lambda: [coordinator.handle_task(description) for description in descriptions])
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            kept = _quietly(lambda: [coordinator.handle_task(description) for description in descriptions])
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            scope_results[variant] = {
+                "retained_bytes_per_task": retained / len(kept),
+                "peak_bytes": peak,
+                "us_per_task": elapsed / len(descriptions) * 1e6,
+            }
+        scope_results["retained_saving"] = 1 - (scope_results["shared"]["retained_bytes_per_task"]
+                                                / scope_results["rebuilt"]["retained_bytes_per_task"])
+        results[scope.value] = scope_results
+    return results
+
+
+def benchmark_incremental_replanning(seed: int = 0, edits: int = 50) -> Dict[str, Any]:
+    generator = SyntheticTaskGenerator(seed)
+    results: Dict[str, Any] = {}
+    for scope in TaskScope:
+        description = generator.describe(scope)
+        revisions = [f"{description} (revision {revision})" for revision in range(edits)]
+        scope_results = {}
+        for variant in ("full", "incremental"):
+            clock = VirtualClock(seed=seed)
+            coordinator = GenesisMetaCoordinator(seed=seed, clock=clock)
+            if variant == "full":
+                run = lambda revision: coordinator.handle_task(revision)
+            else:
+                run = lambda revision: coordinator.replan_task(revision, task_id=scope.value)
+            start = time.perf_counter()
+            outputs = _quietly(lambda: [run(revision) for revision in revisions])
+            elapsed = time.perf_counter() - start
+            scope_results[variant] = {
+                "us_per_edit": elapsed / edits * 1e6,
+                "simulated_seconds_per_edit": clock.summary()["mean_seconds"],
+            }
+            if variant == "incremental":
+                scope_results[variant]["stages_reused_per_edit"] = (
+                    sum(len(output["incremental"]["reused"]) for output in outputs) / edits
+                )
+        scope_results["simulated_cost_fraction"] = (scope_results["incremental"]["simulated_seconds_per_edit"]
+                                                    / scope_results["full"]["simulated_seconds_per_edit"])
+        results[scope.value] = scope_results
+    return results
+
+
+def _pipeline_result(seed: int, agents: int) -> PipelineResult:
+    """A PipelineResult for a MEGA task whose ecosystem is resized to ``agents`` specialists."""
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=VirtualClock(seed=seed))
+    description = SyntheticTaskGenerator(seed).describe(TaskScope.MEGA)
+    result = _quietly(lambda: PipelineResult.from_dict(coordinator.handle_task(description)))
+    roles = [agent.role for agent in result.ecosystem_design.agent_specifications]
+    result.ecosystem_design.agent_specifications = [
+        coordinator.ecosystem_designer._create_specialist_agent(f"specialist-{index + 1}", role)
+        for index, role in zip(range(agents), itertools.cycle(roles))
+    ]
+    result.ecosystem_design.total_agents = agents
+    return result
+
+
+def benchmark_result_serialization(seed: int = 0, agents: int = 100, repeat: int = 200) -> Dict[str, Any]:
+    result = _pipeline_result(seed, agents)
+    stages = {name: getattr(result, name) for name in GenesisMetaCoordinator.PIPELINE_STAGES}
+
+    def legacy_json() -> str:
+        legacy = {"task_description": result.task_description}
+        legacy.update((name, asdict(stage)) for name, stage in stages.items())
+        legacy["meta_coordination_summary"] = result.meta_coordination_summary
+        return json.dumps(legacy, default=str)
+
+    def timed(function: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) / repeat * 1e6
+
+    report: Dict[str, Any] = {
+        "agents": agents,
+        "asdict_json_us": timed(legacy_json),
+        "result_to_dict_us": timed(lambda: result_to_dict(result)),
+        "encode_json_us": timed(lambda: encode_result_json(result)),
+        "asdict_json_bytes": len(legacy_json().encode("utf-8")),
+        "encode_json_bytes": len(encode_result_json(result).encode("utf-8")),
+    }
+    try:
+        packed = encode_result_msgpack(result)
+    except ImportError:
+        return report
+    report.update({
+        "encode_msgpack_us": timed(lambda: encode_result_msgpack(result)),
+        "decode_msgpack_us": timed(lambda: decode_result_msgpack(packed)),
+        "msgpack_bytes": len(packed),
+    })
+    return report
+
+
+def benchmark_collaboration_graph(seed: int = 0, sizes: Tuple[int, ...] = (1_000, 10_000, 100_000)) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    roles = [role for role in CollaborationGraph.ROLE_AFFINITIES] + ["Data Science"]
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        agent_ids = [f"agent-{index + 1}" for index in range(size)]
+        agent_roles = [rng.choice(roles) for _ in range(size)]
+        compatibility = [rng.random() for _ in range(size)]
+        start = time.perf_counter()
+        graph = CollaborationGraph.build(agent_ids, agent_roles, compatibility)
+        build_seconds = time.perf_counter() - start
+        queries = [(rng.choice(agent_ids), rng.choice(agent_ids)) for _ in range(20)]
+        start = time.perf_counter()
+        hops = [len(graph.shortest_path(source, target)) - 1 for source, target in queries]
+        path_seconds = (time.perf_counter() - start) / len(queries)
+        start = time.perf_counter()
+        for agent_id in agent_ids[:1000]:
+            graph.neighbors(agent_id)
+        results[str(size)] = {
+            "edges": graph.edge_count,
+            "build_seconds": build_seconds,
+            "shortest_path_seconds": path_seconds,
+            "max_path_hops": max(hops),
+            "neighbors_us": (time.perf_counter() - start) / min(size, 1000) * 1e6,
+        }
+    return results
+
+
+def benchmark_role_allocation(seed: int = 0, sizes: Tuple[int, ...] = (100, 10_000, 100_000)) -> Dict[str, Any]:
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=VirtualClock(seed=seed))
+    designer = coordinator.ecosystem_designer
+    analysis = _quietly(lambda: coordinator.task_analyzer.analyze_task(SyntheticTaskGenerator(seed).describe(TaskScope.MEGA)))
+    rng = random.Random(seed)
+
+    def best_ms(function: Callable[[], Any], repeat: int = 3) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1e3
+
+    designer._create_agent_specifications(max(sizes), analysis, rng)  # warm up
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        roles = [agent.role for agent in designer._create_agent_specifications(size, analysis, rng)]
+        results[str(size)] = {
+            "roles": len(set(roles)),
+            "batched_ms": best_ms(lambda: designer._create_agent_specifications(size, analysis, rng)),
+            "per_agent_ms": best_ms(lambda: [designer._create_specialist_agent(f"specialist-{index + 1}", role, rng)
+                                             for index, role in enumerate(roles)]),
+        }
+    return results
+
+
+def benchmark_keyword_matching(repeat: int = 20) -> Dict[str, float]:
+    briefs = load_workflow_briefs()
+    keyword_count = sum(len(keywords) for keywords in TaskScopeAnalyzer.keyword_matcher.families.values())
+    substring = _time_per_call(_substring_scan, briefs, repeat)
+    compiled = _time_per_call(_compiled_scan, briefs, repeat)
+    false_hits = 0
+    for brief in briefs:
+        substring_hits, compiled_hits = _substring_scan(brief), _compiled_scan(brief)
+        false_hits += sum(max(0, substring_hits[family] - compiled_hits[family]) for family in compiled_hits)
+    return {
+        "descriptions": len(briefs),
+        "keywords": keyword_count,
+        "avg_description_bytes": sum(len(brief.encode("utf-8")) for brief in briefs) / len(briefs),
+        "substring_us_per_description": substring * 1e6,
+        "substring_us_per_keyword": substring * 1e6 / keyword_count,
+        "compiled_us_per_description": compiled * 1e6,
+        "short_substring_us_per_description": _time_per_call(_substring_scan, DEMO_TASKS, repeat * 100) * 1e6,
+        "short_compiled_us_per_description": _time_per_call(_compiled_scan, DEMO_TASKS, repeat * 100) * 1e6,
+        "substring_only_hits": false_hits,
+    }
+
+
+def benchmark_score_batch(seed: int = 0, batch_size: int = 100_000, distinct: int = 2_000) -> Dict[str, float]:
+    """score_batch against the per-task scoring it replaces (analyze_task minus its simulated stage delay)."""
+    analyzer = TaskScopeAnalyzer(VirtualClock())
+    pool = [description for _, description in SyntheticTaskGenerator(seed).generate(distinct)]
+    descriptions = list(itertools.islice(itertools.cycle(pool), batch_size))
+    
+    start = time.perf_counter()
+    analyzer.score_batch(descriptions)
+    batch_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for description in descriptions:
+        analyzer._determine_scope_category(analyzer._calculate_scope_score(analyzer._extract_scope_indicators(description)))
+    per_task_seconds = time.perf_counter() - start
+    
+    return {
+        "batch_size": batch_size,
+        "score_batch_per_second": batch_size / batch_seconds,
+        "per_task_per_second": batch_size / per_task_seconds,
+        "speedup": per_task_seconds / batch_seconds,
+    }
+
+
+def benchmark_delivery_risk(seed: int = 0, samples: int = 1_000_000) -> Dict[str, Any]:
+    from delivery_risk import DeliveryRiskSimulator
+
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=VirtualClock(seed=seed))
+    simulator = DeliveryRiskSimulator(samples=samples, seed=seed)
+    generator = SyntheticTaskGenerator(seed)
+    results: Dict[str, Any] = {}
+    for scope in TaskScope:
+        result = _quietly(coordinator.handle_task, generator.describe(scope))
+        start = time.perf_counter()
+        estimate = simulator.simulate_result(result)
+        results[scope.value] = {
+            "seconds": time.perf_counter() - start,
+            "nominal_days": estimate.nominal_days,
+            "p50_days": estimate.percentiles["p50"],
+            "p90_days": estimate.percentiles["p90"],
+        }
+    return results
+
+
+def benchmark_genetic_evolution(population_size: int = 1_000_000, generations: int = 5) -> Dict[str, float]:
+    import numpy as np
+    from genetic_evolution import GeneticEvolutionEngine
+    
+    traits = np.random.default_rng(0).uniform(0.3, 0.9, (4, population_size)).astype(np.float32)
+    engine = GeneticEvolutionEngine(mutation_rate=0.05, crossover_frequency=0.35, seed=0)
+    start = time.perf_counter()
+    result = engine.evolve(traits, generations)
+    return {
+        "population_size": population_size,
+        "seconds_per_generation": (time.perf_counter() - start) / generations,
+        "final_mean_fitness": result.history[-1].mean_fitness,
+    }
+
+
+def benchmark_trait_index(agents: int = 200_000, ecosystem_size: int = 100, scan_sample: int = 20_000) -> Dict[str, float]:
+    import numpy as np
+    from agent_population import AgentPopulation
+    from trait_index import TraitIndex
+
+    rng = np.random.default_rng(0)
+    roles = ["Security Specialist", "Backend Development", "Quality Leadership", "Frontend Development"]
+    index = TraitIndex()
+    start = time.perf_counter()
+    for _ in range(agents // ecosystem_size):
+        traits = rng.random((4, ecosystem_size), dtype=np.float32)
+        index.add_population(AgentPopulation.from_traits(traits, [roles[code] for code in rng.integers(0, 4, ecosystem_size)]))
+    ingest_seconds = time.perf_counter() - start
+    query = {"roles": "Security Specialist", "quality_obsession": (0.9, None), "risk_tolerance": (None, 0.3)}
+
+    start = time.perf_counter()
+    matches = index.count(**query)
+    count_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    index.range_query(limit=100, **query)
+    range_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    index.nearest([0.2, 0.5, 0.95, 0.7], k=10, roles="Quality Leadership")
+    nearest_seconds = time.perf_counter() - start
+
+    # Today's approach: a Python scan over AgentSpecification dicts, timed on a sample and scaled up
+    specs = AgentPopulation.concat([index._main.population, index._delta]).select(slice(scan_sample)).to_specs()
+    start = time.perf_counter()
+    [spec for spec in specs if spec.role == "Security Specialist" and spec.genetic_traits["quality_obsession"] >= 0.9
+     and spec.genetic_traits["risk_tolerance"] <= 0.3]
+    scan_seconds = (time.perf_counter() - start) * len(index) / len(specs)
+    return {
+        "agents": len(index),
+        "ingest_agents_per_second": len(index) / ingest_seconds,
+        "matches": matches,
+        "count_seconds": count_seconds,
+        "range_query_first_100_seconds": range_seconds,
+        "nearest_10_seconds": nearest_seconds,
+        "linear_scan_seconds": scan_seconds,
+    }
+
+
+def benchmark_performance_stream(seed: int = 0, agents: int = 100_000, events: int = 1_000_000,
+                                 queries: int = 10_000) -> Dict[str, float]:
+    from performance_stream import EVENT_KINDS, PerformanceStream
+
+    rng = random.Random(seed)
+    stream = PerformanceStream()
+    agent_ids = [f"specialist-{index + 1}" for index in range(agents)]
+    for index, agent_id in enumerate(agent_ids):
+        stream.register_agent(agent_id, f"team-{index % 20}")
+    batch = [(rng.choice(agent_ids), rng.choice(EVENT_KINDS), rng.random(), index * 0.01, rng.choice(agent_ids))
+             for index in range(events)]
+    start = time.perf_counter()
+    stream.record_many(batch)
+    ingest_seconds = time.perf_counter() - start
+
+    names = [(name, {"agent_id": rng.choice(agent_ids)}) for name in PerformanceStream.AGENT_METRICS]
+    names += [(name, {"team": "team-3"}) for name in PerformanceStream.TEAM_METRICS]
+    names += [(name, {}) for name in PerformanceStream.ECOSYSTEM_METRICS]
+    start = time.perf_counter()
+    for name, scope in itertools.islice(itertools.cycle(names), queries):
+        stream.metric(name, **scope)
+    query_seconds = time.perf_counter() - start
+    return {
+        "agents": agents,
+        "events_per_second": events / ingest_seconds,
+        "metric_query_us": query_seconds / queries * 1e6,
+    }
+
+
+def benchmark_optimization_rules(seed: int = 0, agents: int = 100_000, rules: int = 2_000, ticks: int = 5) -> Dict[str, float]:
+    from optimization_rules import CONDITIONS, Rule, RuleEngine
+    from performance_stream import PerformanceStream
+
+    rng = random.Random(seed)
+    stream = PerformanceStream()
+    for index in range(agents):
+        stream.register_agent(f"specialist-{index + 1}", f"team-{index % 20}")
+    metrics = [*PerformanceStream.AGENT_METRICS, *PerformanceStream.TEAM_METRICS, *PerformanceStream.ECOSYSTEM_METRICS]
+    rule_set = []
+    for _ in range(rules):
+        condition = rng.choice(CONDITIONS)
+        threshold = rng.random() if condition in ("below", "above") else rng.randint(1, 4)
+        rule_set.append(Rule(rng.choice(metrics), condition, threshold, "Benchmark", "Benchmark rule", "None",
+                             min_fraction=rng.random()))
+    start = time.perf_counter()
+    engine = RuleEngine(rule_set)
+    compile_seconds = time.perf_counter() - start
+
+    tick_seconds, fired = [], 0
+    for tick in range(ticks):
+        stream.record_many((f"specialist-{index + 1}", kind, rng.random(), tick * 60.0)
+                           for index in range(agents) for kind in ("task_completed", "quality_score", "collaboration"))
+        start = time.perf_counter()
+        fired = len(engine.tick(stream))
+        tick_seconds.append(time.perf_counter() - start)
+    return {
+        "rules": rules,
+        "agents": agents,
+        "compile_ms": compile_seconds * 1e3,
+        "tick_ms": _percentile(tick_seconds, 0.5) * 1e3,
+        "fired_last_tick": fired,
+    }
+
+
+def benchmark_result_store(seed: int = 0, tasks: int = 10_000, distinct: int = 50, queries: int = 200) -> Dict[str, float]:
+    from result_store import ResultStore
+
+    coordinator = GenesisMetaCoordinator(seed=seed, clock=VirtualClock(seed=seed))
+    templates = [_quietly(coordinator.handle_task, description)
+                 for _, description in SyntheticTaskGenerator(seed).generate(distinct)]
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.sqlite")
+        start = time.perf_counter()
+        with ResultStore(path) as store:
+            store.add_many(dict(templates[index % distinct], task_description=f"{templates[index % distinct]['task_description']} #{index}")
+                           for index in range(tasks))
+        ingest_seconds = time.perf_counter() - start
+
+        with ResultStore(path, readonly=True) as store:
+            def timed(query: Callable[[], Any]) -> float:
+                start = time.perf_counter()
+                for _ in range(queries):
+                    query()
+                return (time.perf_counter() - start) / queries * 1e6
+
+            return {
+                "tasks": tasks,
+                "ingest_tasks_per_second": tasks / ingest_seconds,
+                "database_bytes": os.path.getsize(path),
+                "get_task_us": timed(lambda: store.get_task(rng.randint(1, tasks))),
+                "find_by_description_us": timed(lambda: store.find_tasks(task_description=f"{templates[0]['task_description']} #0")),
+                "find_tasks_by_scope_us": timed(lambda: store.find_tasks(scope=TaskScope.MEGA, min_agents=60, limit=10)),
+                "find_agents_by_traits_us": timed(lambda: store.find_agents(role="Security Specialist", limit=10,
+                                                                           quality_obsession=(0.9, None),
+                                                                           risk_tolerance=(None, 0.3))),
+                "load_result_us": timed(lambda: store.load_result(rng.randint(1, tasks))),
+            }
+
+
+def benchmark_roadmap_scheduler(seed: int = 0, phases: int = 100_000, updates: int = 200) -> Dict[str, Any]:
+    from roadmap_scheduler import RoadmapScheduler
+
+    rng = random.Random(seed)
+    specialist = GenesisMetaCoordinator().tech_specialist
+    roadmaps = {scope: specialist._create_implementation_roadmap(scope) for scope in TaskScope}
+    scheduler = RoadmapScheduler()
+    ends: List[str] = []
+    while len(scheduler) < phases:
+        # Each ecosystem starts after the end of up to two earlier ones
+        after = rng.sample(ends, min(len(ends), rng.randint(0, 2)))
+        added = scheduler.add_roadmap(roadmaps[rng.choice(list(TaskScope))], namespace=f"ecosystem-{len(ends)}", after=after)
+        ends.append(added[-1])
+
+    start = time.perf_counter()
+    makespan = scheduler.makespan
+    full_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    critical_path = scheduler.critical_path()
+    critical_path_seconds = time.perf_counter() - start
+    names = [schedule.phase for schedule in scheduler.schedule()]
+    update_seconds = []
+    for _ in range(updates):
+        phase, days = rng.choice(names), rng.uniform(1, 60)
+        start = time.perf_counter()
+        scheduler.update_duration(phase, days)
+        update_seconds.append(time.perf_counter() - start)
+    return {
+        "phases": len(scheduler),
+        "makespan_days": makespan,
+        "critical_path_phases": len(critical_path),
+        "full_schedule_ms": full_seconds * 1e3,
+        "critical_path_ms": critical_path_seconds * 1e3,
+        "update_p50_ms": _percentile(update_seconds, 0.50) * 1e3,
+        "update_p99_ms": _percentile(update_seconds, 0.99) * 1e3,
+    }
+
+
+def benchmark_service_load(seed: int = 0, rps: float = 200.0, duration: float = 3.0,
+                           clock: Optional[RealClock] = None) -> Dict[str, Any]:
+    from genesis_service import GenesisService, load_test
+
+    descriptions = [description for _, description in SyntheticTaskGenerator(seed).generate(200)]
+
+    async def run() -> Dict[str, Any]:
+        service = GenesisService(GenesisMetaCoordinator(seed=seed, clock=clock or VirtualClock(seed=seed)), port=0)
+        await service.start()
+        try:
+            report = await load_test(*service.address, descriptions, rps, duration, seed)
+            report["mean_batch_size"] = service.batched_tasks / max(service.batches, 1)
+            return report
+        finally:
+            await service.stop()
+
+    return _quietly(asyncio.run, run())
+
+
+def _clock(args: argparse.Namespace) -> RealClock:
+    return RealClock() if args.real_clock else VirtualClock(seed=args.seed)
+
+
+SCENARIOS: Dict[str, Callable[[argparse.Namespace], Dict[str, Any]]] = {
+    "task_latency": lambda args: benchmark_task_latency(args.seed, args.samples, _clock(args)),
+    "batch_throughput": lambda args: benchmark_batch_throughput(args.seed, args.batch_size, args.workers, _clock(args)),
+    "result_memory": lambda args: benchmark_result_memory(args.seed, _clock(args)),
+    "scope_templates": lambda args: benchmark_scope_templates(args.seed),
+    "incremental_replanning": lambda args: benchmark_incremental_replanning(args.seed),
+    "result_serialization": lambda args: benchmark_result_serialization(args.seed),
+    "collaboration_graph": lambda args: benchmark_collaboration_graph(args.seed),
+    "role_allocation": lambda args: benchmark_role_allocation(args.seed),
+    "keyword_matching": lambda args: benchmark_keyword_matching(),
+    "score_batch": lambda args: benchmark_score_batch(args.seed),
+    "delivery_risk": lambda args: benchmark_delivery_risk(args.seed),
+    "genetic_evolution": lambda args: benchmark_genetic_evolution(),
+    "roadmap_scheduler": lambda args: benchmark_roadmap_scheduler(args.seed),
+    "service_load": lambda args: benchmark_service_load(args.seed, args.rps, clock=_clock(args)),
+    "trait_index": lambda args: benchmark_trait_index(),
+    "optimization_rules": lambda args: benchmark_optimization_rules(args.seed),
+    "performance_stream": lambda args: benchmark_performance_stream(args.seed),
+    "result_store": lambda args: benchmark_result_store(args.seed, args.store_tasks),
+}
+
+
+def _flatten(report: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, value in report.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Human-readable relative change of every numeric metric present in both reports."""
+    before, after = _flatten(baseline["scenarios"]), _flatten(current["scenarios"])
+    lines = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)) and old:
+            lines.append(f"{key}: {old:.6g} -> {new:.6g} ({(new - old) / old:+.1%})")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Agent Genesis benchmark suite")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic corpus and coordinator")
+    parser.add_argument("--samples", type=int, default=3, help="tasks per scope for task_latency")
+    parser.add_argument("--batch-size", type=int, default=40, help="tasks for batch_throughput")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for batch_throughput")
+    parser.add_argument("--store-tasks", type=int, default=10_000, help="tasks ingested by result_store (up to 10^6)")
+    parser.add_argument("--rps", type=float, default=200.0, help="target request rate for service_load")
+    parser.add_argument("--real-clock", action="store_true", help="block on stage latency instead of simulating it")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to diff against")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "samples": args.samples,
+            "batch_size": args.batch_size,
+            "clock": "real" if args.real_clock else "virtual",
+        },
+        "scenarios": {},
+    }
+    for name in args.scenarios or SCENARIOS:
+        print(f"⏱️  Running {name}...", file=sys.stderr)
+        report["scenarios"][name] = SCENARIOS[name](args)
+        for key, value in _flatten(report["scenarios"][name]).items():
+            print(f"   {name}.{key}: {value:.6g}" if isinstance(value, float) else f"   {name}.{key}: {value}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            print("\n📊 Change against baseline:")
+            for line in compare_reports(json.load(f), report):
+                print(f"   {line}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Service
+
+Local HTTP front end for GenesisMetaCoordinator, built on asyncio streams
+only. Run it with:
+
+    python src/genesis_service.py serve --port 8080
+    python src/genesis_service.py load-test --port 8080 --rps 200 --duration 10
+
+Endpoints:
+
+- POST /tasks: body ``{"task_description": "..."}``; responds with the
+  handle_task result as JSON
+- GET /health: queue depth, in-flight tasks and whether the queue is full
+- GET /metrics: StageMetrics.render_prometheus() plus service counters
+
+Submissions go into a bounded queue; when it is full the request is answered
+429 with Retry-After instead of being buffered. A dispatcher drains the queue
+in micro-batches: it waits up to ``max_batch_delay`` for a batch to fill,
+answers identical descriptions within a batch with one pipeline run, matches
+the batch's keywords in one KeywordMatcher.match_batch pass (the hit matrix
+behind TaskScopeAnalyzer.score_batch), and starts each task only once one of
+``max_in_flight`` slots is free, so a slow pipeline shows up as a full queue
+rather than unbounded memory. On stop() every request still waiting for a
+result is answered 503.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from meta_agent_demonstration import GenesisMetaCoordinator, StageMetrics, VirtualClock, encode_result_json
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"
+}
+
+Response = Tuple[int, bytes]
+
+
+class GenesisService:
+    """Asyncio HTTP server that micro-batches task submissions onto one coordinator."""
+
+    MAX_BODY_BYTES = 64 * 1024
+
+    def __init__(self, coordinator: Optional[GenesisMetaCoordinator] = None, host: str = "127.0.0.1",
+                 port: int = 8080, queue_size: int = 256, max_batch_size: int = 32,
+                 max_batch_delay: float = 0.005, max_in_flight: int = 64):
+        self.coordinator = coordinator or GenesisMetaCoordinator()
+        if self.coordinator.metrics is None:
+            self.coordinator.metrics = StageMetrics()
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.max_in_flight = max_in_flight
+        self.responses: Dict[int, int] = {}
+        self.batches = 0
+        self.batched_tasks = 0
+        self.in_flight = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Client futures not yet answered, and open connections, so stop() can release both
+        self._waiting: Set[asyncio.Future] = set()
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self._stopping = False
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The bound (host, port); useful after starting on port 0."""
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="genesis-task")
+        self._dispatcher = asyncio.ensure_future(self._dispatch())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._server.close()
+        self._dispatcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._dispatcher
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # Queued, batched and running submissions will not be answered by a pipeline run now
+        for future in self._waiting:
+            if not future.done():
+                future.set_result((503, _error("service is shutting down")))
+        await asyncio.sleep(0)  # let handlers write those responses
+        for writer in list(self._connections):
+            writer.close()
+        await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        print(f"🌐 Genesis Service: listening on http://{self.address[0]}:{self.address[1]}", file=sys.stderr)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self.queue_size,
+            "queue_full": self._queue.full(),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+        }
+
+    def render_metrics(self) -> str:
+        lines = [
+            "# HELP genesis_service_responses_total HTTP responses by status code.",
+            "# TYPE genesis_service_responses_total counter",
+            *(f'genesis_service_responses_total{{code="{code}"}} {count}' for code, count in sorted(self.responses.items())),
+            "# HELP genesis_service_queue_depth Task submissions waiting for a batch.",
+            "# TYPE genesis_service_queue_depth gauge",
+            f"genesis_service_queue_depth {self._queue.qsize()}",
+            "# HELP genesis_service_in_flight Tasks currently running through the pipeline.",
+            "# TYPE genesis_service_in_flight gauge",
+            f"genesis_service_in_flight {self.in_flight}",
+            "# HELP genesis_service_batches_total Micro-batches dispatched.",
+            "# TYPE genesis_service_batches_total counter",
+            f"genesis_service_batches_total {self.batches}",
+            "# HELP genesis_service_batched_tasks_total Submissions dispatched in micro-batches.",
+            "# TYPE genesis_service_batched_tasks_total counter",
+            f"genesis_service_batched_tasks_total {self.batched_tasks}",
+        ]
+        return self.coordinator.metrics.render_prometheus() + "\n".join(lines) + "\n"
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                request = await _read_request(reader, self.MAX_BODY_BYTES)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if body is None:
+                    status, payload, content_type = 413, _error("request body too large"), "application/json"
+                else:
+                    status, payload, content_type = await self._route(method, path, body)
+                self.responses[status] = self.responses.get(status, 0) + 1
+                keep_alive = headers.get("connection", "").lower() != "close" and not self._stopping
+                writer.write(_response(status, payload, content_type, keep_alive))
+                await writer.drain()
+                if not keep_alive or status == 413:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, bytes, str]:
+        path = path.split("?", 1)[0]
+        routes = {"/tasks": "POST", "/health": "GET", "/metrics": "GET"}
+        if path not in routes:
+            return 404, _error(f"no route for {path}"), "application/json"
+        if method != routes[path]:
+            return 405, _error(f"{path} accepts {routes[path]} only"), "application/json"
+        if path == "/health":
+            return 200, json.dumps(self.health()).encode("utf-8"), "application/json"
+        if path == "/metrics":
+            return 200, self.render_metrics().encode("utf-8"), "text/plain; version=0.0.4"
+        try:
+            task_description = json.loads(body)["task_description"]
+            if not isinstance(task_description, str) or not task_description.strip():
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            return 400, _error('expected a JSON body {"task_description": "..."}'), "application/json"
+        status, payload = await self._submit(task_description)
+        return status, payload, "application/json"
+
+    async def _submit(self, task_description: str) -> Response:
+        if self._stopping:
+            return 503, _error("service is shutting down")
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((task_description, future))
+        except asyncio.QueueFull:
+            return 429, _error("task queue is full, retry later")
+        self._waiting.add(future)
+        try:
+            return await future
+        finally:
+            self._waiting.discard(future)
+
+    async def _dispatch(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.max_batch_delay)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self.batches += 1
+            self.batched_tasks += len(batch)
+
+            waiting: Dict[str, List[asyncio.Future]] = {}
+            for task_description, future in batch:
+                waiting.setdefault(task_description, []).append(future)
+            # One batched keyword pass for the whole batch instead of one per pipeline run
+            keyword_hits = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.coordinator.task_analyzer.keyword_matcher.match_batch, list(waiting)
+            )
+            for (task_description, futures), hits in zip(waiting.items(), keyword_hits):
+                await self._slots.acquire()
+                asyncio.ensure_future(self._run_task(task_description, hits, futures))
+
+    async def _run_task(self, task_description: str, keyword_hits: Dict[str, Any], futures: List[asyncio.Future]) -> None:
+        # Stays the answer if the run is cancelled by stop()
+        response: Response = (503, _error("service is shutting down"))
+        self.in_flight += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.coordinator.handle_task, task_description, keyword_hits
+            )
+            response = (200, encode_result_json(result).encode("utf-8"))
+        except Exception as exc:
+            response = (500, _error(f"{type(exc).__name__}: {exc}"))
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            for future in futures:
+                if not future.done():
+                    future.set_result(response)
+
+
+async def _read_request(reader: asyncio.StreamReader, max_body: int) -> Optional[Tuple[str, str, Dict[str, str], Optional[bytes]]]:
+    """One HTTP/1.1 request, or None at end of stream; the body is None when it exceeds ``max_body``."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > max_body:
+        return method, path, headers, None
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def _response(status: int, payload: bytes, content_type: str, keep_alive: bool) -> bytes:
+    head = (f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+    if status in (429, 503):
+        head += "Retry-After: 1\r\n"
+    return head.encode("latin-1") + b"\r\n" + payload
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+async def _post_task(connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter], host: str,
+                     task_description: str) -> int:
+    reader, writer = connection
+    body = json.dumps({"task_description": task_description}).encode("utf-8")
+    writer.write(f"POST /tasks HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def load_test(host: str, port: int, task_descriptions: List[str], rps: float, duration: float,
+                    seed: int = 0) -> Dict[str, Any]:
+    """
+    Open-loop load test: submit tasks at ``rps`` for ``duration`` seconds.
+
+    Requests are sent on schedule whether or not earlier ones have finished
+    (a new keep-alive connection is opened whenever none is idle), and
+    latency is measured from the scheduled send time, so a backed-up server
+    cannot hide its queueing delay by slowing the generator down.
+    """
+    rng = random.Random(seed)
+    loop = asyncio.get_running_loop()
+    idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    errors = 0
+
+    async def one_request(scheduled: float, task_description: str) -> None:
+        nonlocal errors
+        connection = idle.pop() if idle else None
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(host, port)
+            status = await _post_task(connection, host, task_description)
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            errors += 1
+            if connection is not None:
+                connection[1].close()
+            return
+        idle.append(connection)
+        statuses[status] = statuses.get(status, 0) + 1
+        if status == 200:
+            latencies.append(loop.time() - scheduled)
+
+    total = int(rps * duration)
+    start = loop.time()
+    requests = []
+    for index in range(total):
+        scheduled = start + index / rps
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        requests.append(asyncio.ensure_future(one_request(scheduled, rng.choice(task_descriptions))))
+    await asyncio.gather(*requests)
+    elapsed = loop.time() - start
+    for _, writer in idle:
+        writer.close()
+
+    latencies.sort()
+    return {
+        "target_rps": rps,
+        "achieved_rps": statuses.get(200, 0) / elapsed if elapsed else 0.0,
+        "requests": total,
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(429, 0),
+        "errors": errors + sum(count for status, count in statuses.items() if status not in (200, 429)),
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+
+def main(argv: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="Agent Genesis HTTP service")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the HTTP service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--queue-size", type=int, default=256, help="submissions buffered before answering 429")
+    serve.add_argument("--max-batch-size", type=int, default=32)
+    serve.add_argument("--max-batch-delay", type=float, default=0.005, help="seconds to wait for a batch to fill")
+    serve.add_argument("--max-in-flight", type=int, default=64, help="tasks running through the pipeline at once")
+    serve.add_argument("--virtual-clock", action="store_true", help="simulate stage latency instead of waiting")
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--verbose", action="store_true", help="keep the meta-agents' progress output")
+    load = commands.add_parser("load-test", help="drive a running service at a target request rate")
+    load.add_argument("--host", default="127.0.0.1")
+    load.add_argument("--port", type=int, default=8080)
+    load.add_argument("--rps", type=float, default=100.0)
+    load.add_argument("--duration", type=float, default=10.0)
+    load.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "load-test":
+        from benchmarks import SyntheticTaskGenerator
+        descriptions = [description for _, description in SyntheticTaskGenerator(args.seed).generate(200)]
+        report = asyncio.run(load_test(args.host, args.port, descriptions, args.rps, args.duration, args.seed))
+        print(json.dumps(report, indent=2))
+        return report
+
+    coordinator = GenesisMetaCoordinator(seed=args.seed, clock=VirtualClock(seed=args.seed) if args.virtual_clock else None)
+    service = GenesisService(coordinator, args.host, args.port, args.queue_size, args.max_batch_size,
+                             args.max_batch_delay, args.max_in_flight)
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if not args.verbose:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(service.serve_forever())
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Island-Model Evolution
+
+Splits one trait population into islands that evolve in parallel worker
+processes, each with its own GeneticEvolutionEngine configured from its own
+genetic evolution plan (mutation_rate and crossover_frequency as produced by
+EvolutionStrategyPlanner._plan_genetic_evolution).
+
+The (4, n) trait matrix and the fitness vector live in shared memory. Every
+``migration_interval`` generations the workers pause and the coordinator
+copies each island's best individuals over the worst individuals of the next
+island (ring topology) directly in shared memory, so migration never
+pickles populations. Only small per-generation statistics cross the pipes.
+"""
+
+import multiprocessing
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from agent_population import TRAIT_NAMES
+from genetic_evolution import FitnessFunction, GeneticEvolutionEngine, GenerationStats, default_fitness
+from meta_agent_demonstration import AgentEcosystemDesigner, EcosystemDesign
+
+
+def seed_traits_from_ecosystem(ecosystem_design: EcosystemDesign, size: int, jitter: float = 0.02,
+                               seed: Optional[int] = None) -> np.ndarray:
+    """
+    A (4, size) population resampled from the ecosystem's specialist agents.
+
+    Each individual copies the traits of a randomly chosen agent from
+    ``_create_specialist_agent`` plus Gaussian jitter, clipped to [0, 1].
+    """
+    agents = ecosystem_design.agent_specifications
+    if not agents:
+        agents = [AgentEcosystemDesigner()._create_specialist_agent("specialist-1", "Full-stack")]
+    founders = np.array([[agent.genetic_traits[name] for agent in agents] for name in TRAIT_NAMES], dtype=np.float32)
+    rng = np.random.default_rng(seed)
+    traits = founders[:, rng.integers(0, founders.shape[1], size=size)]
+    traits += rng.normal(0.0, jitter, size=traits.shape).astype(np.float32)
+    return np.clip(traits, 0.0, 1.0, out=traits)
+
+
+@dataclass
+class IslandEvolutionResult:
+    traits: np.ndarray
+    fitness: np.ndarray
+    island_bounds: List[int]
+    island_history: List[List[GenerationStats]] = field(default_factory=list)
+    migrations: int = 0
+
+
+class IslandEvolutionRunner:
+    """Evolves islands of one population in parallel processes with periodic migration."""
+
+    def __init__(self, plans: Sequence[Dict[str, Any]], migration_interval: int = 10, migrants: int = 8,
+                 fitness: FitnessFunction = default_fitness, seed: Optional[int] = None, **engine_options):
+        if not plans:
+            raise ValueError("at least one island plan is required")
+        if migrants < 0:
+            raise ValueError("migrants must not be negative")
+        self.plans = list(plans)
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.fitness = fitness
+        self.seed = seed
+        self.engine_options = engine_options
+
+    @classmethod
+    def from_plan(cls, genetic_evolution_plan: Dict[str, Any], islands: int, **kwargs) -> "IslandEvolutionRunner":
+        return cls([genetic_evolution_plan] * islands, **kwargs)
+
+    def run(self, traits: np.ndarray, generations: int) -> IslandEvolutionResult:
+        traits = np.asarray(traits, dtype=np.float32)
+        size = traits.shape[1]
+        if len(self.plans) > size:
+            raise ValueError(f"{len(self.plans)} islands need at least as many individuals, got {size}")
+        bounds = [int(bound) for bound in np.linspace(0, size, len(self.plans) + 1)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(self.plans))
+
+        trait_memory = shared_memory.SharedMemory(create=True, size=max(traits.nbytes, 1))
+        fitness_memory = shared_memory.SharedMemory(create=True, size=max(size * 4, 1))
+        workers, pipes = [], []
+        try:
+            shared_traits = np.ndarray(traits.shape, dtype=np.float32, buffer=trait_memory.buf)
+            shared_fitness = np.ndarray((size,), dtype=np.float32, buffer=fitness_memory.buf)
+            shared_traits[:] = traits
+
+            for island, plan in enumerate(self.plans):
+                parent_end, worker_end = multiprocessing.Pipe()
+                worker = multiprocessing.Process(
+                    target=_island_worker,
+                    args=(worker_end, trait_memory.name, fitness_memory.name, traits.shape, bounds[island],
+                          bounds[island + 1], plan, self.fitness, int(seeds[island].generate_state(1)[0]),
+                          self.engine_options),
+                    daemon=True
+                )
+                worker.start()
+                worker_end.close()
+                workers.append(worker)
+                pipes.append(parent_end)
+
+            history: List[List[GenerationStats]] = [[] for _ in self.plans]
+            migrations, done = 0, 0
+            while done < generations:
+                epoch = min(self.migration_interval, generations - done)
+                for island, pipe in enumerate(pipes):
+                    try:
+                        pipe.send(("evolve", epoch, done))
+                    except OSError:
+                        raise RuntimeError(f"island {island} exited unexpectedly") from None
+                for island, pipe in enumerate(pipes):
+                    try:
+                        status, payload = pipe.recv()
+                    except (EOFError, ConnectionError):
+                        raise RuntimeError(f"island {island} exited unexpectedly") from None
+                    if status == "error":
+                        raise RuntimeError(f"island {island} failed: {payload}")
+                    history[island].extend(payload)
+                done += epoch
+                if done < generations and len(self.plans) > 1 and self.migrants:
+                    self._migrate(shared_traits, shared_fitness, bounds)
+                    migrations += 1
+
+            return IslandEvolutionResult(
+                traits=shared_traits.copy(),
+                fitness=shared_fitness.copy(),
+                island_bounds=bounds,
+                island_history=history,
+                migrations=migrations
+            )
+        finally:
+            for pipe in pipes:
+                try:
+                    pipe.send(("stop",))
+                except (BrokenPipeError, OSError):
+                    pass
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+            for memory in (trait_memory, fitness_memory):
+                memory.close()
+                memory.unlink()
+
+    def _migrate(self, traits: np.ndarray, fitness: np.ndarray, bounds: List[int]) -> None:
+        """Ring migration: island i's best replace island i+1's worst, in place."""
+        islands = len(bounds) - 1
+        emigrants = []
+        for island in range(islands):
+            start, end = bounds[island], bounds[island + 1]
+            count = min(self.migrants, end - start)
+            best = start + np.argpartition(fitness[start:end], end - start - count)[end - start - count:] if count else []
+            emigrants.append((traits[:, best].copy(), fitness[best].copy()))
+        for island in range(islands):
+            target = (island + 1) % islands
+            start, end = bounds[target], bounds[target + 1]
+            migrant_traits, migrant_fitness = emigrants[island]
+            count = min(migrant_traits.shape[1], end - start)
+            worst = start + np.argpartition(fitness[start:end], count - 1)[:count] if count else []
+            traits[:, worst] = migrant_traits[:, :count]
+            fitness[worst] = migrant_fitness[:count]
+
+
+def _island_worker(pipe, trait_memory_name: str, fitness_memory_name: str, shape, start: int, end: int,
+                   plan: Dict[str, Any], fitness: FitnessFunction, seed: int, engine_options: Dict[str, Any]) -> None:
+    trait_memory = shared_memory.SharedMemory(name=trait_memory_name)
+    fitness_memory = shared_memory.SharedMemory(name=fitness_memory_name)
+    traits = shared_fitness = None
+    try:
+        traits = np.ndarray(shape, dtype=np.float32, buffer=trait_memory.buf)[:, start:end]
+        shared_fitness = np.ndarray((shape[1],), dtype=np.float32, buffer=fitness_memory.buf)[start:end]
+        engine = GeneticEvolutionEngine.from_plan(plan, fitness=fitness, seed=seed, **engine_options)
+        while True:
+            message = pipe.recv()
+            if message[0] == "stop":
+                break
+            _, generations, offset = message
+            try:
+                result = engine.evolve(traits, generations)
+                traits[:] = result.traits
+                shared_fitness[:] = result.fitness
+                for stats in result.history:
+                    stats.generation += offset
+                pipe.send(("ok", result.history[1:]))
+            except Exception as exc:
+                pipe.send(("error", f"{type(exc).__name__}: {exc}"))
+    finally:
+        del traits, shared_fitness
+        trait_memory.close()
+        fitness_memory.close()
@@ -14,14 +14,45 @@ The system includes:
 - Agent Performance Monitor (excellence analytics)
 
 Each meta-agent collaborates to create optimal agent ecosystems for any task.
+
+Run without arguments for the demonstration, or stream tasks through it:
+
+    python src/meta_agent_demonstration.py tasks.txt --workers 8 --quiet > results.jsonl
+    cat tasks.jsonl | python src/meta_agent_demonstration.py - --ordered --quiet
 """
 
+import argparse
 import json
+import os
+import re
+import sys
 import time
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+import io
+import copy
+import gzip
+import bisect
+import pstats
+import shelve
+import cProfile
+import asyncio
+import hashlib
+import threading
+import contextlib
+import functools
+import itertools
+import contextvars
+from collections import deque, OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Set, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
 import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the bulk scoring paths need it
+    np = None
 
 
 class TaskScope(Enum):
@@ -61,6 +92,7 @@ class EcosystemDesign:
     workflow_design: Dict[str, str]
     success_metrics: Dict[str, str]
     evolution_strategy: Dict[str, str]
+    collaboration_graph: Optional["CollaborationGraph"] = None
 
 
 @dataclass
@@ -88,28 +120,491 @@ class PerformanceMonitoring:
     performance_metrics: Dict[str, float]
     optimization_recommendations: List[Dict[str, Any]]
     continuous_improvement_plan: Dict[str, Any]
+    stream_namespace: Optional[str] = None
+
+
+@dataclass
+class PipelineResult:
+    task_description: str
+    task_analysis: TaskAnalysisResult
+    ecosystem_design: EcosystemDesign
+    technology_stack: TechnologyStack
+    evolution_strategy: EvolutionStrategy
+    performance_monitoring: PerformanceMonitoring
+    meta_coordination_summary: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """The handle_task result dict for this pipeline run."""
+        return result_to_dict(self)
+    
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "PipelineResult":
+        """Rebuild the dataclasses from a handle_task result or a decoded JSON/msgpack record."""
+        analysis = dict(result["task_analysis"])
+        analysis["scope_category"] = _task_scope(analysis["scope_category"])
+        ecosystem = dict(result["ecosystem_design"])
+        ecosystem["agent_specifications"] = [
+            AgentSpecification(**agent) if isinstance(agent, dict) else agent
+            for agent in ecosystem["agent_specifications"]
+        ]
+        if isinstance(ecosystem.get("collaboration_graph"), dict):
+            ecosystem["collaboration_graph"] = CollaborationGraph.from_dict(ecosystem["collaboration_graph"])
+        return cls(
+            task_description=result["task_description"],
+            task_analysis=TaskAnalysisResult(**analysis),
+            ecosystem_design=EcosystemDesign(**ecosystem),
+            technology_stack=TechnologyStack(**result["technology_stack"]),
+            evolution_strategy=EvolutionStrategy(**result["evolution_strategy"]),
+            performance_monitoring=PerformanceMonitoring(**result["performance_monitoring"]),
+            meta_coordination_summary=result["meta_coordination_summary"]
+        )
+
+
+def _task_scope(value: Any) -> TaskScope:
+    if isinstance(value, TaskScope):
+        return value
+    if value.startswith("TaskScope."):
+        # Records written with json.dumps(default=str) before enums were encoded by value
+        return TaskScope[value[len("TaskScope."):]]
+    return TaskScope(value)
+
+
+def _require_numpy(feature: str) -> None:
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy (pip install numpy)")
+
+
+@dataclass
+class BatchTaskOutcome:
+    index: int
+    task_description: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    from_cache: bool = False
+    stage_metrics: Optional["StageMetrics"] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class InvalidTaskInput:
+    """An input line that holds no task description; handle_tasks reports it as a failed outcome."""
+    line: str
+    error: str
+    
+    def outcome(self, index: int) -> BatchTaskOutcome:
+        return BatchTaskOutcome(index=index, task_description=self.line, error=self.error)
+
+
+class KeywordMatcher:
+    """
+    Single-pass keyword matcher for several keyword families at once.
+
+    The text is split into word tokens by one compiled regex scan and each
+    distinct token is looked up in a precomputed table, so "ui" no longer
+    matches inside "build" nor "api" inside "capital". Hyphenated tokens also
+    match their parts ("multi-tenant" hits "multi-tenant", "multi" and
+    "tenant"), a trailing plural "s" is ignored, and keywords ending in "*"
+    match as word prefixes ("auth*" hits "authentication").
+    """
+    
+    _TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+    # hit_matrix splits a whole chunk of texts at once: every byte that cannot be
+    # part of a token becomes a space, and the texts are joined by a NUL piece
+    _TEXT_SEPARATOR = "\x00"
+    _TOKEN_BYTES = bytes(
+        byte if chr(byte).isascii() and (chr(byte).isalnum() or chr(byte) in "-\x00") else ord(" ")
+        for byte in range(256)
+    ).lower()
+    HIT_MATRIX_CHUNK = 8192
+    
+    def __init__(self, families: Dict[str, Iterable[str]]):
+        self.families = {family: tuple(keywords) for family, keywords in families.items()}
+        # Every accepted surface form ("api", "apis", ...) -> the (family, keyword) hits it produces
+        self._surface_forms: Dict[str, List[Tuple[str, str]]] = {}
+        self._prefixes: Dict[str, List[Tuple[str, str]]] = {}
+        for family, keywords in self.families.items():
+            for keyword in keywords:
+                if keyword.endswith("*"):
+                    self._prefixes.setdefault(keyword[:-1], []).append((family, keyword))
+                    continue
+                for form in (keyword, keyword + "s"):
+                    self._surface_forms.setdefault(form, []).append((family, keyword))
+        self._stems = tuple(self._prefixes)
+    
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Return the distinct keywords of every family found in ``text``."""
+        hits: Dict[str, Set[str]] = {family: set() for family in self.families}
+        for family, keyword in self._matched_entries(text):
+            hits[family].add(keyword)
+        return hits
+    
+    def match_batch(self, texts: Iterable[str]) -> List[Dict[str, Set[str]]]:
+        """match() for many texts, tokenized together through hit_matrix when NumPy is available."""
+        if np is None:
+            return [self.match(text) for text in texts]
+        families = tuple(self.families)
+        indptr, indices, columns = self.hit_matrix(texts, families)
+        indices = indices.tolist()
+        batch = []
+        for start, stop in zip(indptr[:-1].tolist(), indptr[1:].tolist()):
+            hits: Dict[str, Set[str]] = {family: set() for family in families}
+            for column in indices[start:stop]:
+                family, keyword = columns[column]
+                hits[family].add(keyword)
+            batch.append(hits)
+        return batch
+    
+    def hit_matrix(self, texts: Iterable[str], families: Iterable[str]) -> Tuple["np.ndarray", "np.ndarray", List[Tuple[str, str]]]:
+        """
+        Build a sparse (CSR) text x keyword hit matrix restricted to ``families``.
+
+        Returns ``(indptr, indices, columns)`` where row ``i`` holds the column
+        indices ``indices[indptr[i]:indptr[i + 1]]`` of the distinct
+        ``(family, keyword)`` pairs listed in ``columns``.
+        """
+        _require_numpy("KeywordMatcher.hit_matrix")
+        families = tuple(families)
+        columns = [(family, keyword) for family in families for keyword in self.families[family]]
+        column_index = {entry: position for position, entry in enumerate(columns)}
+        
+        # Every distinct piece seen so far -> its id; id 0 is the text separator
+        vocabulary: Dict[bytes, int] = {self._TEXT_SEPARATOR.encode(): 0}
+        token_columns: List[List[int]] = [[]]
+        row_counts: List["np.ndarray"] = []
+        chunk_indices: List["np.ndarray"] = []
+        texts = iter(texts)
+        while True:
+            chunk = list(itertools.islice(texts, self.HIT_MATRIX_CHUNK))
+            if not chunk:
+                break
+            counts, indices = self._chunk_hits(chunk, vocabulary, token_columns, column_index)
+            row_counts.append(counts)
+            chunk_indices.append(indices)
+        
+        indptr = np.zeros(sum(len(counts) for counts in row_counts) + 1, dtype=np.int64)
+        if row_counts:
+            np.cumsum(np.concatenate(row_counts), out=indptr[1:])
+            return indptr, np.concatenate(chunk_indices), columns
+        return indptr, np.zeros(0, dtype=np.int64), columns
+    
+    def _chunk_hits(self, chunk: List[str], vocabulary: Dict[bytes, int], token_columns: List[List[int]],
+                    column_index: Dict[Tuple[str, str], int]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Per-text hit counts and the texts' distinct column indices, row by row, for one chunk."""
+        corpus = f" {self._TEXT_SEPARATOR} ".join(chunk).lower()
+        if corpus.count(self._TEXT_SEPARATOR) != len(chunk) - 1:
+            # A text contains the separator itself; fall back to one scan per text
+            rows = [sorted({column_index[entry] for entry in self._matched_entries(text) if entry in column_index})
+                    for text in chunk]
+            return (np.asarray([len(row) for row in rows], dtype=np.int64),
+                    np.asarray([index for row in rows for index in row], dtype=np.int64))
+        
+        # One C-level split for the whole chunk. A piece is a token unless it has stray
+        # hyphens ("--api-"); each distinct piece is resolved to columns once, through
+        # the token regex, so it hits what its tokens would.
+        pieces = corpus.encode("utf-8").translate(self._TOKEN_BYTES).split()
+        for piece in set(pieces).difference(vocabulary):
+            vocabulary[piece] = len(token_columns)
+            token_columns.append(sorted({
+                column_index[entry]
+                for token in self._TOKEN_PATTERN.findall(piece.decode("ascii"))
+                for entry in self._token_entries(token) if entry in column_index
+            }))
+        codes = np.fromiter(map(vocabulary.__getitem__, pieces), dtype=np.int64, count=len(pieces))
+        widths = np.fromiter(map(len, token_columns), dtype=np.int64, count=len(token_columns))
+        offsets = np.zeros(len(token_columns) + 1, dtype=np.int64)
+        np.cumsum(widths, out=offsets[1:])
+        flat_columns = np.fromiter(itertools.chain.from_iterable(token_columns), dtype=np.int64, count=int(offsets[-1]))
+        
+        # Expand every token occurrence into its columns, then keep distinct (row, column) pairs
+        rows = np.cumsum(codes == 0)
+        occurrence_widths = widths[codes]
+        total = int(occurrence_widths.sum())
+        starts = np.repeat(offsets[codes] - (np.cumsum(occurrence_widths) - occurrence_widths), occurrence_widths)
+        hit_columns = flat_columns[starts + np.arange(total)]
+        hit = np.zeros((len(chunk), len(column_index)), dtype=bool)
+        hit[np.repeat(rows, occurrence_widths), hit_columns] = True
+        return np.count_nonzero(hit, axis=1), np.nonzero(hit)[1]
+    
+    def _matched_entries(self, text: str) -> Iterator[Tuple[str, str]]:
+        tokens = set(self._TOKEN_PATTERN.findall(text.lower()))
+        for compound in [token for token in tokens if "-" in token]:
+            tokens.update(compound.split("-"))
+        
+        for token in tokens.intersection(self._surface_forms):
+            yield from self._surface_forms[token]
+        if self._stems:
+            for token in [token for token in tokens if token.startswith(self._stems)]:
+                for stem, entries in self._prefixes.items():
+                    if token.startswith(stem):
+                        yield from entries
+    
+    def _token_entries(self, token: str) -> Iterator[Tuple[str, str]]:
+        """The entries _matched_entries yields for one token, including a compound's parts."""
+        for part in ([token] + token.split("-") if "-" in token else [token]):
+            yield from self._surface_forms.get(part, ())
+            if self._stems and part.startswith(self._stems):
+                for stem, entries in self._prefixes.items():
+                    if part.startswith(stem):
+                        yield from entries
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for shared templates.
+
+    copy.copy() returns the template itself; thaw() and copy.deepcopy()
+    return a mutable deep copy made of plain dicts and lists.
+    """
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is a shared template; thaw() it for a mutable copy")
+    
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self) -> "FrozenDict":
+        return self
+    
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        plain = memo[id(self)] = {}
+        for key, value in dict.items(self):
+            plain[key] = copy.deepcopy(value, memo)
+        return plain
+    
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+    
+    def thaw(self) -> Dict[str, Any]:
+        return {key: thaw(value) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """Read-only list for shared templates; copied like FrozenDict."""
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is a shared template; thaw() it for a mutable copy")
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    
+    def __copy__(self) -> "FrozenList":
+        return self
+    
+    def __deepcopy__(self, memo) -> List[Any]:
+        plain = memo[id(self)] = []
+        plain.extend(copy.deepcopy(value, memo) for value in self)
+        return plain
+    
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+    
+    def thaw(self) -> List[Any]:
+        return [thaw(value) for value in self]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to FrozenDict and FrozenList."""
+    if isinstance(value, dict):
+        # dict.items skips a copy-on-write view's unsharing: its nested templates are frozen already
+        return value if type(value) is FrozenDict else FrozenDict((key, freeze(item)) for key, item in dict.items(value))
+    if isinstance(value, (list, tuple)):
+        return value if type(value) is FrozenList else FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen template; other values are returned as is."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value.thaw()
+    return value
+
+
+def copy_on_write(value: Any) -> Any:
+    """Mutable copy-on-write view of a frozen template; other values are returned as is."""
+    if type(value) is FrozenDict:
+        return CopyOnWriteDict(value)
+    if type(value) is FrozenList:
+        return CopyOnWriteList(value)
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """
+    Mutable view of a FrozenDict template that copies only what is written.
+
+    It starts as a shallow copy of the template's top level. A nested
+    template is replaced by its own copy-on-write view the first time it is
+    read through this dict, so a write anywhere copies just the containers
+    on the path to it; the shared template never changes.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is FrozenDict or type(value) is FrozenList:
+            value = copy_on_write(value)
+            dict.__setitem__(self, key, value)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+    
+    def pop(self, key, *default):
+        return copy_on_write(dict.pop(self, key, *default))
+    
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, copy_on_write(value)
+    
+    def values(self):
+        self._unshare()
+        return dict.values(self)
+    
+    def items(self):
+        self._unshare()
+        return dict.items(self)
+    
+    def copy(self) -> "CopyOnWriteDict":
+        return CopyOnWriteDict(self)
+    
+    def _unshare(self) -> None:
+        for key in [key for key, value in dict.items(self) if type(value) is FrozenDict or type(value) is FrozenList]:
+            self[key]
+
+
+class CopyOnWriteList(list):
+    """Mutable view of a FrozenList template; like CopyOnWriteDict, nested templates are copied when read."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._unshare()
+            return list.__getitem__(self, index)
+        value = list.__getitem__(self, index)
+        if type(value) is FrozenDict or type(value) is FrozenList:
+            value = copy_on_write(value)
+            list.__setitem__(self, index, value)
+        return value
+    
+    def __iter__(self):
+        self._unshare()
+        return list.__iter__(self)
+    
+    def __reversed__(self):
+        self._unshare()
+        return list.__reversed__(self)
+    
+    def pop(self, index=-1):
+        return copy_on_write(list.pop(self, index))
+    
+    def copy(self) -> "CopyOnWriteList":
+        return CopyOnWriteList(self)
+    
+    def _unshare(self) -> None:
+        for index, value in enumerate(list.__iter__(self)):
+            if type(value) is FrozenDict or type(value) is FrozenList:
+                list.__setitem__(self, index, copy_on_write(value))
+
+
+def shared_template(builder):
+    """
+    Build a static design payload once per argument tuple and share it frozen.
+
+    The decorated method must depend only on its (hashable) arguments, such
+    as the TaskScope. The payload is frozen once and every call returns a
+    CopyOnWriteDict view of it: results share the template's nested
+    contents instead of rebuilding the literal, and a caller that modifies
+    its result copies only the containers it writes to.
+    The original builder stays reachable as ``__wrapped__``.
+    """
+    templates: Dict[Tuple[Any, ...], Any] = {}
+    
+    @functools.wraps(builder)
+    def template(self, *args):
+        try:
+            frozen = templates[args]
+        except KeyError:
+            frozen = templates[args] = freeze(builder(self, *args))
+        return copy_on_write(frozen)
+    return template
 
 
 class TaskScopeAnalyzer:
     """Analyzes tasks to determine scope, complexity, and requirements."""
     
-    def analyze_task(self, task_description: str) -> TaskAnalysisResult:
+    # Keyword families feeding the scope indicators, with the hit count that saturates each one
+    SCOPE_INDICATOR_KEYWORDS = {
+        "complexity_keywords": ("complex", "enterprise", "system", "architecture", "integration", "platform", "framework", "analytics", "dashboard", "management", "processing", "saas", "multi-tenant", "global"),
+        "scale_indicators": ("large", "massive", "enterprise", "global", "platform", "complete", "comprehensive", "full", "entire", "revolutionary", "breakthrough"),
+        "integration_requirements": ("api", "integration", "microservices", "distributed", "cloud", "real-time", "analytics", "multi", "tenant", "erp", "inventory", "payment"),
+        "innovation_needs": ("new", "innovative", "breakthrough", "revolutionary", "cutting-edge", "quantum", "artificial", "intelligence", "discovery", "advanced")
+    }
+    SCOPE_INDICATOR_SATURATION = {
+        "complexity_keywords": 5.0,
+        "scale_indicators": 4.0,
+        "integration_requirements": 4.0,
+        "innovation_needs": 3.0
+    }
+    SCOPE_INDICATOR_WEIGHTS = {
+        "complexity_keywords": 0.3,
+        "scale_indicators": 0.4,
+        "integration_requirements": 0.2,
+        "innovation_needs": 0.1
+    }
+    
+    # Inclusive upper score bound of every scope category but the last
+    SCOPE_CATEGORY_BOUNDS = (
+        (0.2, TaskScope.MICRO),
+        (0.4, TaskScope.SMALL),
+        (0.6, TaskScope.MEDIUM),
+        (0.8, TaskScope.LARGE)
+    )
+    
+    # Specialization families, in the order they are recommended
+    SPECIALIZATION_KEYWORDS = {
+        "Frontend Development": ("frontend", "ui", "interface"),
+        "Backend Development": ("backend", "api", "server"),
+        "Database Design": ("database", "data", "storage"),
+        "Security": ("security", "auth*", "encryption")
+    }
+    
+    keyword_matcher = KeywordMatcher({**SCOPE_INDICATOR_KEYWORDS, **SPECIALIZATION_KEYWORDS})
+    
+    def __init__(self, clock: Optional["RealClock"] = None):
+        self.clock = clock or RealClock()
+    
+    def analyze_task(self, task_description: str, rng: Optional[random.Random] = None,
+                     keyword_hits: Optional[Dict[str, Set[str]]] = None) -> TaskAnalysisResult:
+        """``keyword_hits`` may carry the description's KeywordMatcher.match_batch entry to skip matching it again."""
+        rng = rng or random.Random(random.getrandbits(64))
         print(f"🔍 Task Scope Analyzer: Analyzing task...")
         print(f"   Task: {task_description}")
         
         # Simulate intelligent task analysis
-        time.sleep(0.5)
+        self.clock.stage_delay("task_analysis", 0.5)
         
         # Calculate scope based on task characteristics
-        scope_indicators = self._extract_scope_indicators(task_description)
+        if keyword_hits is None:
+            keyword_hits = self.keyword_matcher.match(task_description)
+        scope_indicators = self._extract_scope_indicators(task_description, keyword_hits)
         scope_score = self._calculate_scope_score(scope_indicators)
         scope_category = self._determine_scope_category(scope_score)
         
         complexity_breakdown = {
-            "technical_complexity": random.uniform(0.3, 0.9),
-            "business_complexity": random.uniform(0.2, 0.8),
-            "timeline_pressure": random.uniform(0.1, 0.7),
-            "resource_constraints": random.uniform(0.2, 0.6)
+            "technical_complexity": rng.uniform(0.3, 0.9),
+            "business_complexity": rng.uniform(0.2, 0.8),
+            "timeline_pressure": rng.uniform(0.1, 0.7),
+            "resource_constraints": rng.uniform(0.2, 0.6)
         }
         
         result = TaskAnalysisResult(
@@ -123,16 +618,16 @@ class TaskScopeAnalyzer:
                 "constraints": ["Timeline", "Budget", "Technology stack"]
             },
             ecosystem_recommendations={
-                "recommended_agent_count": self._recommend_agent_count(scope_category),
-                "specialization_areas": self._recommend_specializations(task_description),
+                "recommended_agent_count": self._recommend_agent_count(scope_category, rng),
+                "specialization_areas": self._recommend_specializations(task_description, keyword_hits),
                 "collaboration_patterns": self._recommend_collaboration_pattern(scope_category),
                 "evolution_strategy": self._recommend_evolution_strategy(scope_category)
             },
             risk_assessment={
-                "scope_creep_risk": random.uniform(0.2, 0.6),
-                "technical_risk": random.uniform(0.1, 0.5),
-                "timeline_risk": random.uniform(0.2, 0.7),
-                "resource_risk": random.uniform(0.1, 0.4)
+                "scope_creep_risk": rng.uniform(0.2, 0.6),
+                "technical_risk": rng.uniform(0.1, 0.5),
+                "timeline_risk": rng.uniform(0.2, 0.7),
+                "resource_risk": rng.uniform(0.1, 0.4)
             }
         )
         
@@ -140,64 +635,62 @@ class TaskScopeAnalyzer:
         print(f"   ✅ Recommended agents: {result.ecosystem_recommendations['recommended_agent_count']}")
         return result
     
-    def _extract_scope_indicators(self, task_description: str) -> Dict[str, float]:
-        indicators = {
-            "complexity_keywords": 0.0,
-            "scale_indicators": 0.0,
-            "integration_requirements": 0.0,
-            "innovation_needs": 0.0
-        }
-        
-        task_lower = task_description.lower()
-        
-        # Complexity indicators
-        complexity_keywords = ["complex", "enterprise", "system", "architecture", "integration", "platform", "framework", "analytics", "dashboard", "management", "processing", "saas", "multi-tenant", "global"]
-        indicators["complexity_keywords"] = min(1.0, sum(1 for word in complexity_keywords if word in task_lower) / 5.0)
+    def _extract_scope_indicators(self, task_description: str, keyword_hits: Optional[Dict[str, Set[str]]] = None) -> Dict[str, float]:
+        if keyword_hits is None:
+            keyword_hits = self.keyword_matcher.match(task_description)
         
-        # Scale indicators  
-        scale_keywords = ["large", "massive", "enterprise", "global", "platform", "complete", "comprehensive", "full", "entire", "revolutionary", "breakthrough"]
-        indicators["scale_indicators"] = min(1.0, sum(1 for word in scale_keywords if word in task_lower) / 4.0)
+        return {
+            indicator: min(1.0, len(keyword_hits[indicator]) / saturation)
+            for indicator, saturation in self.SCOPE_INDICATOR_SATURATION.items()
+        }
+    
+    def score_batch(self, task_descriptions: Iterable[str]) -> Tuple["np.ndarray", List[TaskScope]]:
+        """
+        Score many descriptions at once with the per-task scope formula.
+
+        Builds one sparse keyword-hit matrix for the whole batch and computes
+        indicator counts, clipped indicators, weighted scores and categories
+        with NumPy array operations. Scores are bit-identical to
+        ``_calculate_scope_score(_extract_scope_indicators(...))``.
+        """
+        indicators = tuple(self.SCOPE_INDICATOR_SATURATION)
+        indptr, indices, columns = self.keyword_matcher.hit_matrix(task_descriptions, indicators)
         
-        # Integration requirements
-        integration_keywords = ["api", "integration", "microservices", "distributed", "cloud", "real-time", "analytics", "multi", "tenant", "erp", "inventory", "payment"]
-        indicators["integration_requirements"] = min(1.0, sum(1 for word in integration_keywords if word in task_lower) / 4.0)
+        # Sparse hit matrix x (keyword -> indicator) membership = per-indicator hit counts
+        column_indicator = np.asarray([indicators.index(family) for family, _ in columns], dtype=np.int64)
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        counts = np.bincount(rows * len(indicators) + column_indicator[indices],
+                             minlength=(len(indptr) - 1) * len(indicators)).reshape(-1, len(indicators))
         
-        # Innovation needs
-        innovation_keywords = ["new", "innovative", "breakthrough", "revolutionary", "cutting-edge", "quantum", "artificial", "intelligence", "discovery", "advanced"]
-        indicators["innovation_needs"] = min(1.0, sum(1 for word in innovation_keywords if word in task_lower) / 3.0)
+        # Accumulate in the same order as the per-task sum() so floats match exactly
+        scores = np.zeros(len(counts))
+        for position, indicator in enumerate(indicators):
+            clipped = np.minimum(1.0, counts[:, position] / self.SCOPE_INDICATOR_SATURATION[indicator])
+            scores = scores + clipped * self.SCOPE_INDICATOR_WEIGHTS[indicator]
+        scores = np.minimum(1.0, scores)
         
-        return indicators
+        bounds = np.asarray([bound for bound, _ in self.SCOPE_CATEGORY_BOUNDS])
+        categories = [category for _, category in self.SCOPE_CATEGORY_BOUNDS] + [TaskScope.MEGA]
+        category_codes = np.searchsorted(bounds, scores, side="left")
+        return scores, [categories[code] for code in category_codes]
     
     def _calculate_scope_score(self, indicators: Dict[str, float]) -> float:
-        weights = {
-            "complexity_keywords": 0.3,
-            "scale_indicators": 0.4,
-            "integration_requirements": 0.2,
-            "innovation_needs": 0.1
-        }
-        
-        scope_score = sum(indicators[key] * weights[key] for key in indicators)
+        scope_score = sum(indicators[key] * self.SCOPE_INDICATOR_WEIGHTS[key] for key in indicators)
         return min(1.0, scope_score)
     
     def _determine_scope_category(self, scope_score: float) -> TaskScope:
-        if scope_score <= 0.2:
-            return TaskScope.MICRO
-        elif scope_score <= 0.4:
-            return TaskScope.SMALL
-        elif scope_score <= 0.6:
-            return TaskScope.MEDIUM
-        elif scope_score <= 0.8:
-            return TaskScope.LARGE
-        else:
-            return TaskScope.MEGA
+        for upper_bound, category in self.SCOPE_CATEGORY_BOUNDS:
+            if scope_score <= upper_bound:
+                return category
+        return TaskScope.MEGA
     
-    def _recommend_agent_count(self, scope: TaskScope) -> int:
+    def _recommend_agent_count(self, scope: TaskScope, rng: random.Random = random) -> int:
         agent_counts = {
             TaskScope.MICRO: 1,
-            TaskScope.SMALL: random.randint(2, 4),
-            TaskScope.MEDIUM: random.randint(5, 12),
-            TaskScope.LARGE: random.randint(15, 40),
-            TaskScope.MEGA: random.randint(50, 100)
+            TaskScope.SMALL: rng.randint(2, 4),
+            TaskScope.MEDIUM: rng.randint(5, 12),
+            TaskScope.LARGE: rng.randint(15, 40),
+            TaskScope.MEGA: rng.randint(50, 100)
         }
         return agent_counts[scope]
     
@@ -205,19 +698,11 @@ class TaskScopeAnalyzer:
         # Simplified requirement extraction
         return ["Core functionality", "User interface", "Data processing", "Error handling"]
     
-    def _recommend_specializations(self, task_description: str) -> List[str]:
-        task_lower = task_description.lower()
-        specializations = []
-        
-        if any(word in task_lower for word in ["frontend", "ui", "interface"]):
-            specializations.append("Frontend Development")
-        if any(word in task_lower for word in ["backend", "api", "server"]):
-            specializations.append("Backend Development")
-        if any(word in task_lower for word in ["database", "data", "storage"]):
-            specializations.append("Database Design")
-        if any(word in task_lower for word in ["security", "auth", "encryption"]):
-            specializations.append("Security")
+    def _recommend_specializations(self, task_description: str, keyword_hits: Optional[Dict[str, Set[str]]] = None) -> List[str]:
+        if keyword_hits is None:
+            keyword_hits = self.keyword_matcher.match(task_description)
         
+        specializations = [name for name in self.SPECIALIZATION_KEYWORDS if keyword_hits[name]]
         return specializations or ["Full-stack Development"]
     
     def _recommend_collaboration_pattern(self, scope: TaskScope) -> str:
@@ -241,109 +726,376 @@ class TaskScopeAnalyzer:
         return strategies[scope]
 
 
+class CollaborationGraph:
+    """
+    Sparse, undirected collaboration graph between the agents of an ecosystem.
+
+    Adjacency is stored in CSR form: the partners of agent ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]``, so neighbor and degree queries are
+    slices and the whole graph is two integer arrays. Edges come from role
+    affinities and trait compatibility: agents of one role are ordered by a
+    compatibility score, chained to their nearest peers and arranged under
+    team leads (TEAM_FANOUT reports each, which keeps paths logarithmic), and
+    each pair of affine roles is joined by rank-matching those orders, so
+    agents with similar working styles pair up. Every step is linear in
+    agents plus edges.
+    """
+    
+    # Roles that work together directly (undirected)
+    ROLE_AFFINITIES = {
+        "System Architecture": ("Development Leadership", "Backend Development", "Frontend Development",
+                                "Security Specialist", "Performance Optimization"),
+        "Development Leadership": ("Frontend Development", "Backend Development", "Quality Leadership",
+                                   "DevOps and Infrastructure"),
+        "Frontend Development": ("Backend Development", "Quality Leadership"),
+        "Backend Development": ("DevOps and Infrastructure", "Security Specialist", "Performance Optimization",
+                                "Quality Leadership"),
+        "Quality Leadership": ("DevOps and Infrastructure",),
+        "DevOps and Infrastructure": ("Security Specialist", "Performance Optimization"),
+        "Primary Development": ("Quality Assurance", "Documentation"),
+        "Quality Assurance": ("Documentation",),
+        "Database Design": ("Backend Development", "Performance Optimization")
+    }
+    
+    COMPATIBILITY_BUCKETS = 64
+    TEAM_FANOUT = 8
+    
+    def __init__(self, agent_ids: List[str], indptr: array, indices: array):
+        self.agent_ids = agent_ids
+        self.indptr = indptr
+        self.indices = indices
+        self._index = {agent_id: position for position, agent_id in enumerate(agent_ids)}
+    
+    @classmethod
+    def from_agents(cls, agents: List[AgentSpecification]) -> "CollaborationGraph":
+        return cls.build(
+            [agent.agent_id for agent in agents],
+            [agent.role for agent in agents],
+            [cls.compatibility_score(agent.genetic_traits) for agent in agents]
+        )
+    
+    @classmethod
+    def build(cls, agent_ids: List[str], roles: List[str], compatibility: List[float]) -> "CollaborationGraph":
+        """Build the graph from parallel per-agent ids, roles and compatibility scores in [0, 1]."""
+        # Members of each role in compatibility order, via a bucket sort (no comparison sort)
+        buckets: List[List[int]] = [[] for _ in range(cls.COMPATIBILITY_BUCKETS)]
+        for position, score in enumerate(compatibility):
+            buckets[min(cls.COMPATIBILITY_BUCKETS - 1, max(0, int(score * cls.COMPATIBILITY_BUCKETS)))].append(position)
+        groups: Dict[str, List[int]] = {}
+        for bucket in buckets:
+            for position in bucket:
+                groups.setdefault(roles[position], []).append(position)
+        
+        sources, targets = array("l"), array("l")
+        for members in groups.values():
+            sources.extend(members[:-1])
+            targets.extend(members[1:])
+            # Rank 1's lead is rank 0, already its chained peer
+            sources.extend(members[2:])
+            targets.extend(members[(rank - 1) // cls.TEAM_FANOUT] for rank in range(2, len(members)))
+        for first, second in cls._affine_role_pairs(groups):
+            cls._rank_match(groups[first], groups[second], sources, targets)
+        return cls._from_edges(agent_ids, sources, targets)
+    
+    @staticmethod
+    def compatibility_score(genetic_traits: Dict[str, float]) -> float:
+        return 0.6 * genetic_traits["collaboration_style"] + 0.4 * genetic_traits["quality_obsession"]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollaborationGraph":
+        return cls(list(data["agent_ids"]), array("l", data["indptr"]), array("l", data["indices"]))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"agent_ids": self.agent_ids, "indptr": self.indptr.tolist(), "indices": self.indices.tolist()}
+    
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CollaborationGraph):
+            return NotImplemented
+        return (self.agent_ids, self.indptr, self.indices) == (other.agent_ids, other.indptr, other.indices)
+    
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices) // 2
+    
+    def degree(self, agent_id: str) -> int:
+        position = self._index[agent_id]
+        return self.indptr[position + 1] - self.indptr[position]
+    
+    def neighbors(self, agent_id: str) -> List[str]:
+        position = self._index[agent_id]
+        return [self.agent_ids[partner] for partner in self.indices[self.indptr[position]:self.indptr[position + 1]]]
+    
+    def shortest_path(self, source: str, target: str) -> List[str]:
+        """Fewest-hop communication path from ``source`` to ``target`` (breadth-first); [] if unreachable."""
+        start, goal = self._index[source], self._index[target]
+        parents = {start: start}
+        frontier = deque([start])
+        while frontier and goal not in parents:
+            current = frontier.popleft()
+            for partner in self.indices[self.indptr[current]:self.indptr[current + 1]]:
+                if partner not in parents:
+                    parents[partner] = current
+                    frontier.append(partner)
+        if goal not in parents:
+            return []
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return [self.agent_ids[position] for position in reversed(path)]
+    
+    @classmethod
+    def _affine_role_pairs(cls, groups: Dict[str, List[int]]) -> List[Tuple[str, str]]:
+        pairs = [(role, partner) for role, partners in cls.ROLE_AFFINITIES.items() if role in groups
+                 for partner in partners if partner in groups]
+        linked = {role for pair in pairs for role in pair}
+        # Roles without a known partner present report to the largest role group
+        hub = max(groups, key=lambda role: len(groups[role]), default=None)
+        pairs.extend((role, hub) for role in groups if role not in linked and role != hub)
+        return pairs
+    
+    @staticmethod
+    def _rank_match(first: List[int], second: List[int], sources: array, targets: array) -> None:
+        # Every member of the larger group links to the member at the same relative rank in the smaller
+        if len(first) < len(second):
+            first, second = second, first
+        scale = len(second) / len(first)
+        sources.extend(first)
+        targets.extend(second[int(rank * scale)] for rank in range(len(first)))
+    
+    @classmethod
+    def _from_edges(cls, agent_ids: List[str], sources: array, targets: array) -> "CollaborationGraph":
+        degrees = [0] * (len(agent_ids) + 1)
+        for endpoint in sources:
+            degrees[endpoint + 1] += 1
+        for endpoint in targets:
+            degrees[endpoint + 1] += 1
+        indptr = array("l", itertools.accumulate(degrees))
+        cursor = indptr.tolist()
+        indices = array("l", bytes(indptr[-1] * indptr.itemsize))
+        for source, target in zip(sources, targets):
+            indices[cursor[source]] = target
+            cursor[source] += 1
+            indices[cursor[target]] = source
+            cursor[target] += 1
+        return cls(list(agent_ids), indptr, indices)
+
+
 class AgentEcosystemDesigner:
-    """Designs optimal agent ecosystems based on task analysis."""
+    """
+    Designs optimal agent ecosystems based on task analysis.
+
+    Every callable in ``observers`` is called with each finished
+    EcosystemDesign (e.g. TraitIndex.add_ecosystem). Observers run in the
+    process that designs the ecosystem, so handle_tasks worker processes
+    notify their own copies.
+    """
     
-    def design_ecosystem(self, task_analysis: TaskAnalysisResult) -> EcosystemDesign:
+    # (agent id prefix, role, allocation weight) for teams built by _allocate_roles
+    TEAM_ROLES = {
+        TaskScope.SMALL: (
+            ("developer", "Primary Development", 2.0),
+            ("qa", "Quality Assurance", 1.0),
+            ("docs", "Documentation", 1.0)
+        ),
+        TaskScope.MEDIUM: (
+            ("architect", "System Architecture", 0.5),
+            ("dev-lead", "Development Leadership", 0.5),
+            ("frontend", "Frontend Development", 1.0),
+            ("backend", "Backend Development", 1.0),
+            ("qa-lead", "Quality Leadership", 0.5),
+            ("devops", "DevOps and Infrastructure", 1.0),
+            ("security", "Security Specialist", 1.0),
+            ("performance", "Performance Optimization", 1.0)
+        )
+    }
+    TEAM_ROLES[TaskScope.LARGE] = TEAM_ROLES[TaskScope.MEGA] = TEAM_ROLES[TaskScope.MEDIUM]
+    
+    # Detected specialization area -> the role that covers it; its weight is multiplied by SPECIALIZATION_BOOST
+    SPECIALIZATION_ROLES = {
+        "Frontend Development": ("frontend", "Frontend Development"),
+        "Backend Development": ("backend", "Backend Development"),
+        "Database Design": ("database", "Database Design"),
+        "Security": ("security", "Security Specialist")
+    }
+    SPECIALIZATION_BOOST = 3.0
+    
+    BASE_TRAIT_RANGES = {
+        "risk_tolerance": (0.3, 0.7),
+        "innovation_factor": (0.4, 0.8),
+        "quality_obsession": (0.6, 0.9),
+        "collaboration_style": (0.6, 0.9)
+    }
+    # Specialization keyword -> trait ranges that replace the base ones (first match wins)
+    SPECIALIZATION_TRAIT_RANGES = (
+        ("Architecture", {"innovation_factor": (0.7, 0.9), "quality_obsession": (0.8, 1.0)}),
+        ("Quality", {"risk_tolerance": (0.1, 0.3), "quality_obsession": (0.9, 1.0)}),
+        ("Security", {"risk_tolerance": (0.1, 0.3), "innovation_factor": (0.3, 0.5)})
+    )
+    
+    def __init__(self, clock: Optional["RealClock"] = None, observers: Optional[List[Any]] = None):
+        self.clock = clock or RealClock()
+        self.observers = list(observers or [])
+    
+    def design_ecosystem(self, task_analysis: TaskAnalysisResult, rng: Optional[random.Random] = None) -> EcosystemDesign:
+        rng = rng or random.Random(random.getrandbits(64))
         print(f"🏗️  Agent Ecosystem Designer: Designing optimal ecosystem...")
         print(f"   Scope: {task_analysis.scope_category.value}")
         print(f"   Agent count: {task_analysis.ecosystem_recommendations['recommended_agent_count']}")
         
-        time.sleep(0.5)
+        self.clock.stage_delay("ecosystem_design", 0.5)
         
         agent_count = task_analysis.ecosystem_recommendations['recommended_agent_count']
-        agents = self._create_agent_specifications(agent_count, task_analysis)
+        agents = self._create_agent_specifications(agent_count, task_analysis, rng)
         
         ecosystem = EcosystemDesign(
-            total_agents=agent_count,
+            total_agents=len(agents),
             team_structure=self._design_team_structure(task_analysis.scope_category),
             agent_specifications=agents,
-            workflow_design={
-                "development_process": self._design_development_process(task_analysis.scope_category),
-                "quality_gates": "Code review, testing, deployment approval",
-                "communication_schedule": self._design_communication_schedule(task_analysis.scope_category),
-                "decision_making_process": "Consensus with escalation paths"
-            },
-            success_metrics={
-                "team_velocity": "Tasks completed per sprint",
-                "quality_standards": "Defect rate < 2%",
-                "collaboration_effectiveness": "Team satisfaction score > 8/10",
-                "adaptation_capability": "Response time to requirement changes"
-            },
-            evolution_strategy={
-                "performance_monitoring": "Daily metrics, weekly reviews",
-                "optimization_opportunities": "Continuous improvement cycles",
-                "scaling_plans": "Add specialists as needed",
-                "knowledge_retention": "Documentation and mentoring"
-            }
+            workflow_design=self._design_workflow(task_analysis.scope_category),
+            success_metrics=self._define_success_metrics(),
+            evolution_strategy=self._plan_ecosystem_evolution(),
+            collaboration_graph=self._design_collaboration_graph(task_analysis.scope_category, agents)
         )
         
+        for observer in self.observers:
+            observer(ecosystem)
+        
         print(f"   ✅ Ecosystem designed with {len(agents)} specialized agents")
         print(f"   ✅ Team structure: {ecosystem.team_structure}")
+        if ecosystem.collaboration_graph is not None:
+            print(f"   ✅ Collaboration graph: {ecosystem.collaboration_graph.edge_count} partner links")
         return ecosystem
     
-    def _create_agent_specifications(self, agent_count: int, task_analysis: TaskAnalysisResult) -> List[AgentSpecification]:
-        agents = []
+    def _create_agent_specifications(self, agent_count: int, task_analysis: TaskAnalysisResult, rng: random.Random = random) -> List[AgentSpecification]:
         specializations = task_analysis.ecosystem_recommendations['specialization_areas']
         
         # Define agent roles based on scope and requirements
         if task_analysis.scope_category == TaskScope.MICRO:
-            agents.append(self._create_specialist_agent("specialist-1", specializations[0] if specializations else "Full-stack"))
-        
-        elif task_analysis.scope_category == TaskScope.SMALL:
-            agents.append(self._create_specialist_agent("developer-1", "Primary Development"))
-            if agent_count > 1:
-                agents.append(self._create_specialist_agent("qa-1", "Quality Assurance"))
-            if agent_count > 2:
-                agents.append(self._create_specialist_agent("docs-1", "Documentation"))
-        
-        elif task_analysis.scope_category in [TaskScope.MEDIUM, TaskScope.LARGE, TaskScope.MEGA]:
-            # Create diverse team with multiple specializations
-            roles = [
-                ("architect-1", "System Architecture"),
-                ("dev-lead-1", "Development Leadership"),
-                ("frontend-1", "Frontend Development"),
-                ("backend-1", "Backend Development"),
-                ("qa-lead-1", "Quality Leadership"),
-                ("devops-1", "DevOps and Infrastructure"),
-                ("security-1", "Security Specialist"),
-                ("performance-1", "Performance Optimization")
-            ]
-            
-            for i, (agent_id, role) in enumerate(roles[:agent_count]):
-                agents.append(self._create_specialist_agent(agent_id, role))
+            return [self._create_specialist_agent("specialist-1", specializations[0] if specializations else "Full-stack", rng)]
+        
+        roles = list(self.TEAM_ROLES[task_analysis.scope_category])
+        if task_analysis.scope_category != TaskScope.SMALL:
+            # Detected specializations are covered first and get a larger share, adding their role if the team lacks it
+            detected = {self.SPECIALIZATION_ROLES[area] for area in specializations if area in self.SPECIALIZATION_ROLES}
+            weights = {(prefix, role): weight for prefix, role, weight in roles}
+            roles = [(prefix, role, weights.get((prefix, role), 1.0) * self.SPECIALIZATION_BOOST)
+                     for prefix, role in sorted(detected, key=list(self.SPECIALIZATION_ROLES.values()).index)]
+            roles += [(prefix, role, weight) for prefix, role, weight in self.TEAM_ROLES[task_analysis.scope_category]
+                      if (prefix, role) not in detected]
         
+        allocation = self._allocate_roles(agent_count, roles)
+        traits = iter(self._generate_traits([role for _, role, count in allocation for _ in range(count)], rng))
+        agents = []
+        for prefix, role, count in allocation:
+            responsibility = f"Primary responsibility for {role}"
+            agents.extend(
+                AgentSpecification(
+                    agent_id=f"{prefix}-{number}",
+                    role=role,
+                    genetic_traits=next(traits),
+                    specializations=[role],
+                    responsibilities=[responsibility],
+                    collaboration_partners=[]
+                )
+                for number in range(1, count + 1)
+            )
         return agents
     
-    def _create_specialist_agent(self, agent_id: str, specialization: str) -> AgentSpecification:
-        # Generate genetic traits based on specialization
-        base_traits = {
-            "risk_tolerance": random.uniform(0.3, 0.7),
-            "innovation_factor": random.uniform(0.4, 0.8),
-            "quality_obsession": random.uniform(0.6, 0.9),
-            "collaboration_style": random.uniform(0.6, 0.9)
-        }
-        
-        # Adjust traits based on specialization
-        if "Architecture" in specialization:
-            base_traits["innovation_factor"] = random.uniform(0.7, 0.9)
-            base_traits["quality_obsession"] = random.uniform(0.8, 1.0)
-        elif "Quality" in specialization:
-            base_traits["risk_tolerance"] = random.uniform(0.1, 0.3)
-            base_traits["quality_obsession"] = random.uniform(0.9, 1.0)
-        elif "Security" in specialization:
-            base_traits["risk_tolerance"] = random.uniform(0.1, 0.3)
-            base_traits["innovation_factor"] = random.uniform(0.3, 0.5)
+    @staticmethod
+    def _allocate_roles(agent_count: int, roles: List[Tuple[str, str, float]]) -> List[Tuple[str, str, int]]:
+        """
+        Split ``agent_count`` agents across ``(prefix, role, weight)`` roles,
+        listed in coverage priority.
+
+        Every role gets one agent while there are enough to go round (the
+        first ``agent_count`` roles otherwise); the rest are shared in
+        proportion to weight by largest remainder, so counts always sum to
+        ``agent_count``.
+        """
+        if agent_count <= len(roles):
+            return [(prefix, role, 1) for prefix, role, _ in roles[:agent_count]]
         
+        remaining = agent_count - len(roles)
+        total_weight = sum(weight for _, _, weight in roles)
+        quotas = [remaining * weight / total_weight for _, _, weight in roles]
+        counts = [1 + int(quota) for quota in quotas]
+        leftover = agent_count - sum(counts)
+        for index in sorted(range(len(roles)), key=lambda index: int(quotas[index]) - quotas[index])[:leftover]:
+            counts[index] += 1
+        return [(prefix, role, count) for (prefix, role, _), count in zip(roles, counts)]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _trait_ranges(cls, specialization: str) -> Tuple[Tuple[float, float], ...]:
+        ranges = dict(cls.BASE_TRAIT_RANGES)
+        for keyword, overrides in cls.SPECIALIZATION_TRAIT_RANGES:
+            if keyword in specialization:
+                ranges.update(overrides)
+                break
+        return tuple(ranges[trait] for trait in cls.BASE_TRAIT_RANGES)
+    
+    def _generate_traits(self, roles: List[str], rng: random.Random = random) -> List[Dict[str, float]]:
+        """Genetic traits for one agent per entry of ``roles``, drawn in one batch when NumPy is available."""
+        trait_names = tuple(self.BASE_TRAIT_RANGES)
+        if np is None or len(roles) < 64:
+            return [
+                {trait: rng.uniform(low, high) for trait, (low, high) in zip(trait_names, self._trait_ranges(role))}
+                for role in roles
+            ]
+        # One (agents, traits) bounds matrix from the per-role ranges, then a single uniform draw
+        codes = {role: code for code, role in enumerate(dict.fromkeys(roles))}
+        role_codes = np.fromiter(map(codes.__getitem__, roles), dtype=np.intp, count=len(roles))
+        bounds = np.asarray([self._trait_ranges(role) for role in codes])[role_codes]
+        values = np.random.default_rng(rng.getrandbits(64)).uniform(bounds[..., 0], bounds[..., 1])
+        return [dict(zip(trait_names, row)) for row in values.tolist()]
+    
+    def _create_specialist_agent(self, agent_id: str, specialization: str, rng: random.Random = random) -> AgentSpecification:
+        # Generate genetic traits based on specialization
         return AgentSpecification(
             agent_id=agent_id,
             role=specialization,
-            genetic_traits=base_traits,
+            genetic_traits=self._generate_traits([specialization], rng)[0],
             specializations=[specialization],
             responsibilities=[f"Primary responsibility for {specialization}"],
             collaboration_partners=[]  # Will be filled based on team structure
         )
     
+    def _design_collaboration_graph(self, scope: TaskScope, agents: List[AgentSpecification]) -> Optional[CollaborationGraph]:
+        # Smaller teams collaborate as a whole; federations and ecosystems need explicit partner links
+        if scope not in (TaskScope.LARGE, TaskScope.MEGA):
+            return None
+        return CollaborationGraph.from_agents(agents)
+    
+    @shared_template
+    def _design_workflow(self, scope: TaskScope) -> Dict[str, str]:
+        return {
+            "development_process": self._design_development_process(scope),
+            "quality_gates": "Code review, testing, deployment approval",
+            "communication_schedule": self._design_communication_schedule(scope),
+            "decision_making_process": "Consensus with escalation paths"
+        }
+    
+    @shared_template
+    def _define_success_metrics(self) -> Dict[str, str]:
+        return {
+            "team_velocity": "Tasks completed per sprint",
+            "quality_standards": "Defect rate < 2%",
+            "collaboration_effectiveness": "Team satisfaction score > 8/10",
+            "adaptation_capability": "Response time to requirement changes"
+        }
+    
+    @shared_template
+    def _plan_ecosystem_evolution(self) -> Dict[str, str]:
+        return {
+            "performance_monitoring": "Daily metrics, weekly reviews",
+            "optimization_opportunities": "Continuous improvement cycles",
+            "scaling_plans": "Add specialists as needed",
+            "knowledge_retention": "Documentation and mentoring"
+        }
+    
     def _design_team_structure(self, scope: TaskScope) -> str:
         structures = {
             TaskScope.MICRO: "Single specialist",
@@ -378,11 +1130,14 @@ class AgentEcosystemDesigner:
 class TechnologyStackSpecialist:
     """Selects optimal technology stacks based on task and ecosystem requirements."""
     
+    def __init__(self, clock: Optional["RealClock"] = None):
+        self.clock = clock or RealClock()
+    
     def select_technology_stack(self, task_analysis: TaskAnalysisResult, ecosystem_design: EcosystemDesign) -> TechnologyStack:
         print(f"⚙️  Technology Stack Specialist: Selecting optimal technology stack...")
-        print(f"   Considering {ecosystem_design.total_agents} agents with {len(ecosystem_design.agent_specifications)} specializations")
+        print(f"   Considering {ecosystem_design.total_agents} agents with {len({agent.role for agent in ecosystem_design.agent_specifications})} specializations")
         
-        time.sleep(0.5)
+        self.clock.stage_delay("technology_stack", 0.5)
         
         complexity_level = self._determine_complexity_level(task_analysis.scope_category)
         risk_profile = self._determine_risk_profile(task_analysis)
@@ -392,7 +1147,7 @@ class TechnologyStackSpecialist:
             stack_philosophy=self._select_stack_philosophy(task_analysis.scope_category),
             complexity_level=complexity_level,
             risk_profile=risk_profile,
-            technology_selections=self._select_technologies(task_analysis, ecosystem_design),
+            technology_selections=self._select_technologies(task_analysis.scope_category),
             implementation_roadmap=self._create_implementation_roadmap(task_analysis.scope_category)
         )
         
@@ -431,9 +1186,10 @@ class TechnologyStackSpecialist:
         }
         return philosophies[scope]
     
-    def _select_technologies(self, task_analysis: TaskAnalysisResult, ecosystem_design: EcosystemDesign) -> Dict[str, Dict[str, Any]]:
+    @shared_template
+    def _select_technologies(self, scope: TaskScope) -> Dict[str, Dict[str, Any]]:
         # Select technologies based on scope and requirements
-        if task_analysis.scope_category in [TaskScope.MICRO, TaskScope.SMALL]:
+        if scope in [TaskScope.MICRO, TaskScope.SMALL]:
             return {
                 "frontend": {
                     "primary_technology": "React",
@@ -484,6 +1240,7 @@ class TechnologyStackSpecialist:
                 }
             }
     
+    @shared_template
     def _create_implementation_roadmap(self, scope: TaskScope) -> Dict[str, List[Dict[str, Any]]]:
         if scope in [TaskScope.MICRO, TaskScope.SMALL]:
             return {
@@ -549,11 +1306,14 @@ class TechnologyStackSpecialist:
 class EvolutionStrategyPlanner:
     """Plans evolutionary strategies for agent ecosystem development."""
     
+    def __init__(self, clock: Optional["RealClock"] = None):
+        self.clock = clock or RealClock()
+    
     def plan_evolution_strategy(self, task_analysis: TaskAnalysisResult, ecosystem_design: EcosystemDesign) -> EvolutionStrategy:
         print(f"🧬 Evolution Strategy Planner: Planning ecosystem evolution...")
         print(f"   Planning evolution for {ecosystem_design.total_agents}-agent ecosystem")
         
-        time.sleep(0.5)
+        self.clock.stage_delay("evolution_strategy", 0.5)
         
         strategy = EvolutionStrategy(
             strategy_philosophy=self._select_evolution_philosophy(task_analysis.scope_category),
@@ -614,6 +1374,7 @@ class EvolutionStrategyPlanner:
             "genetic_diversity_maintenance": "Active monitoring and intervention when needed"
         }
     
+    @shared_template
     def _plan_performance_evolution(self, scope: TaskScope) -> Dict[str, Any]:
         if scope in [TaskScope.MICRO, TaskScope.SMALL]:
             return {
@@ -630,6 +1391,7 @@ class EvolutionStrategyPlanner:
                 "innovation_acceleration": "Breakthrough innovation and paradigm creation"
             }
     
+    @shared_template
     def _design_adaptation_framework(self, scope: TaskScope) -> Dict[str, Any]:
         return {
             "change_monitoring": "Continuous environmental scanning and pattern recognition",
@@ -640,26 +1402,58 @@ class EvolutionStrategyPlanner:
 
 
 class AgentPerformanceMonitor:
-    """Monitors and optimizes agent and ecosystem performance."""
+    """
+    Monitors and optimizes agent and ecosystem performance.
+
+    With a ``stream`` (a performance_stream.PerformanceStream) the monitored
+    ecosystem's agents are registered with it under setup_monitoring's
+    ``namespace`` or a fresh one (see PerformanceStream.register_ecosystem;
+    the result keeps it as ``stream_namespace``) and baseline metrics come from
+    its live aggregates instead of the static defaults. With ``rules`` (an
+    optimization_rules.RuleEngine that has ticked at least once) the
+    optimization recommendations are the rules that fired on its latest tick.
+    """
     
-    def setup_monitoring(self, ecosystem_design: EcosystemDesign, evolution_strategy: EvolutionStrategy) -> PerformanceMonitoring:
+    BASELINE_METRICS = {
+        "overall_ecosystem_health": 0.75,
+        "individual_performance_avg": 0.72,
+        "team_collaboration_score": 0.78,
+        "innovation_index": 0.65,
+        "quality_consistency": 0.82,
+        "adaptation_readiness": 0.70,
+        "knowledge_leverage": 0.68,
+        "cultural_coherence": 0.76
+    }
+    
+    def __init__(self, clock: Optional["RealClock"] = None, stream: Optional[Any] = None, rules: Optional[Any] = None):
+        self.clock = clock or RealClock()
+        self.stream = stream
+        self.rules = rules
+    
+    def setup_monitoring(self, ecosystem_design: EcosystemDesign, evolution_strategy: EvolutionStrategy,
+                         namespace: Optional[str] = None) -> PerformanceMonitoring:
         print(f"📊 Agent Performance Monitor: Setting up comprehensive monitoring...")
-        print(f"   Monitoring {ecosystem_design.total_agents} agents across {len(ecosystem_design.agent_specifications)} roles")
+        print(f"   Monitoring {ecosystem_design.total_agents} agents across {len({agent.role for agent in ecosystem_design.agent_specifications})} roles")
         
-        time.sleep(0.5)
+        self.clock.stage_delay("performance_monitoring", 0.5)
+        if self.stream is not None:
+            # Events for these agents must use stream.agent_key(namespace, agent_id)
+            namespace = self.stream.register_ecosystem(ecosystem_design, namespace)
         
         monitoring = PerformanceMonitoring(
-            monitoring_framework=self._design_monitoring_framework(ecosystem_design),
+            monitoring_framework=self._design_monitoring_framework(),
             performance_metrics=self._generate_baseline_metrics(ecosystem_design),
             optimization_recommendations=self._generate_optimization_recommendations(ecosystem_design),
-            continuous_improvement_plan=self._create_improvement_plan(evolution_strategy)
+            continuous_improvement_plan=self._create_improvement_plan(),
+            stream_namespace=namespace if self.stream is not None else None
         )
         
         print(f"   ✅ Monitoring framework established")
         print(f"   ✅ Baseline metrics generated")
         return monitoring
     
-    def _design_monitoring_framework(self, ecosystem_design: EcosystemDesign) -> Dict[str, Any]:
+    @shared_template
+    def _design_monitoring_framework(self) -> Dict[str, Any]:
         return {
             "individual_monitoring": {
                 "task_completion_rate": "Real-time tracking of task completion",
@@ -682,19 +1476,14 @@ class AgentPerformanceMonitor:
         }
     
     def _generate_baseline_metrics(self, ecosystem_design: EcosystemDesign) -> Dict[str, float]:
+        if self.stream is not None:
+            return self.stream.baseline_metrics(self.BASELINE_METRICS)
         # Generate realistic baseline metrics
-        return {
-            "overall_ecosystem_health": 0.75,
-            "individual_performance_avg": 0.72,
-            "team_collaboration_score": 0.78,
-            "innovation_index": 0.65,
-            "quality_consistency": 0.82,
-            "adaptation_readiness": 0.70,
-            "knowledge_leverage": 0.68,
-            "cultural_coherence": 0.76
-        }
+        return dict(self.BASELINE_METRICS)
     
     def _generate_optimization_recommendations(self, ecosystem_design: EcosystemDesign) -> List[Dict[str, Any]]:
+        if self.rules is not None and self.rules.ticks:
+            return self.rules.recommendations
         return [
             {
                 "area": "Individual Performance",
@@ -719,7 +1508,8 @@ class AgentPerformanceMonitor:
             }
         ]
     
-    def _create_improvement_plan(self, evolution_strategy: EvolutionStrategy) -> Dict[str, Any]:
+    @shared_template
+    def _create_improvement_plan(self) -> Dict[str, Any]:
         return {
             "short_term_improvements": [
                 "Optimize individual agent task assignments",
@@ -739,60 +1529,972 @@ class AgentPerformanceMonitor:
         }
 
 
+def normalize_task_description(task_description: str) -> str:
+    """Casefold and collapse whitespace so near-identical descriptions compare equal."""
+    return " ".join(task_description.casefold().split())
+
+
+def task_cache_key(task_description: str) -> str:
+    return hashlib.sha256(normalize_task_description(task_description).encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Bounded memo of handle_task results keyed by task_cache_key().
+
+    Entries are evicted least-recently-used beyond ``max_entries`` and expire
+    ``ttl_seconds`` after they were stored. With ``path`` set, entries are
+    also written to a shelve file so they survive restarts and can be shared
+    by later runs. The file holds the same bounded set as memory: evicted
+    and expired entries are deleted from it, and on open it is trimmed to
+    the ``max_entries`` most recently stored live entries, which are loaded.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None,
+                 path: Optional[str] = None, timer=time.time):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = shelve.open(path) if path else None
+        if self._disk is not None:
+            self._load_disk()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the cached result for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._disk is not None:
+                entry = self._disk.get(key)
+                if entry is not None:
+                    self._store(key, entry)
+            if entry is not None and self._expired(entry[0]):
+                self._discard(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+    
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            entry = (self.timer(), copy.deepcopy(result))
+            self._store(key, entry)
+            if self._disk is not None:
+                self._disk[key] = entry
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.clear()
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+    
+    def _store(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            if self._disk is not None:
+                self._disk.pop(evicted, None)
+            self.evictions += 1
+    
+    def _load_disk(self) -> None:
+        live = []
+        for key in list(self._disk):
+            entry = self._disk[key]
+            if self._expired(entry[0]):
+                del self._disk[key]
+            else:
+                live.append((entry[0], key, entry))
+        # Oldest first, so the newest entries end up most recently used
+        live.sort(key=lambda item: item[0])
+        stale = max(0, len(live) - self.max_entries)
+        for _, key, _ in live[:stale]:
+            del self._disk[key]
+        for _, key, entry in live[stale:]:
+            self._entries[key] = entry
+    
+    def _discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._disk is not None and key in self._disk:
+            del self._disk[key]
+    
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and self.timer() - stored_at > self.ttl_seconds
+
+
+def result_to_dict(obj: Any) -> Any:
+    """
+    Plain-dict form of result dataclasses without asdict's deep copies.
+
+    Dataclasses become dicts and lists of dataclasses become lists of dicts;
+    every other value, including the nested payload dicts and lists, is
+    shared with the dataclass instead of being copied. Enums stay members.
+    """
+    if _is_dataclass_type(type(obj)):
+        # The instance dict holds exactly the fields; copy that one level only
+        plain = dict(obj.__dict__)
+        for name, value in plain.items():
+            if type(value) not in _PLAIN_LEAF_TYPES:
+                plain[name] = result_to_dict(value)
+        return plain
+    if type(obj) is list and obj and _is_dataclass_type(type(obj[0])):
+        return [result_to_dict(item) for item in obj]
+    return obj
+
+
+# Field values of these types are never dataclasses, so result_to_dict shares them without a call
+_PLAIN_LEAF_TYPES = frozenset((str, int, float, bool, dict, FrozenDict, FrozenList, CopyOnWriteDict, CopyOnWriteList, type(None)))
+
+
+@functools.lru_cache(maxsize=None)
+def _is_dataclass_type(cls: type) -> bool:
+    return hasattr(cls, "__dataclass_fields__")
+
+
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, CollaborationGraph):
+        return obj.to_dict()
+    if _is_dataclass_type(type(obj)):
+        # The instance dict holds exactly the fields; the encoder walks it in place
+        return obj.__dict__
+    return str(obj)
+
+
+_RESULT_JSON_ENCODER = json.JSONEncoder(default=_encode_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_result_json(result: Any) -> str:
+    """Compact JSON for a result dict or PipelineResult; enums are written as their values."""
+    return _RESULT_JSON_ENCODER.encode(result)
+
+
+def encode_result_msgpack(result: Any) -> bytes:
+    """msgpack bytes for a result dict or PipelineResult; read back with decode_result_msgpack."""
+    return _msgpack().packb(result, default=_encode_default, use_bin_type=True)
+
+
+def decode_result_msgpack(data: bytes) -> PipelineResult:
+    return PipelineResult.from_dict(_msgpack().unpackb(data, raw=False))
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("msgpack encoding requires the msgpack package (pip install msgpack)") from None
+    return msgpack
+
+
+def _resolve_compression(path: str, compression: Optional[str]) -> Optional[str]:
+    if compression == "auto":
+        if path.endswith(".gz"):
+            return "gzip"
+        if path.endswith(".zst"):
+            return "zstd"
+        return None
+    if compression not in (None, "gzip", "zstd"):
+        raise ValueError(f"Unsupported compression: {compression!r}")
+    return compression
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd compression requires the zstandard package (pip install zstandard)") from None
+    return zstandard
+
+
+class JsonlResultWriter:
+    """
+    Streams handle_task results to a JSON Lines file, one record per line.
+    Records are compact JSON from encode_result_json, so TaskScope values
+    are written as "micro", "small", ... (see PipelineResult.from_dict).
+
+    Each record is written as soon as it is produced and the file is flushed
+    every ``flush_every`` records or ``flush_interval`` seconds, so memory
+    stays flat and a crash loses at most the unflushed tail. Compression is
+    picked from the suffix (.gz, .zst) unless given explicitly.
+    """
+    
+    def __init__(self, path: str, compression: Optional[str] = "auto", flush_every: int = 100,
+                 flush_interval: float = 5.0, append: bool = False):
+        self.path = path
+        self.compression = _resolve_compression(path, compression)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._stream = self._open("a" if append else "w")
+    
+    def write(self, result: Dict[str, Any]) -> None:
+        self._stream.write(encode_result_json(result))
+        self._stream.write("\n")
+        self.records_written += 1
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        self._stream.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        if not self._stream.closed:
+            self._stream.close()
+    
+    def __enter__(self) -> "JsonlResultWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _open(self, mode: str):
+        if self.compression == "gzip":
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        if self.compression == "zstd":
+            compressor = _zstandard().ZstdCompressor()
+            return io.TextIOWrapper(compressor.stream_writer(open(self.path, mode + "b")), encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+
+def iter_jsonl_results(path: str, compression: Optional[str] = "auto") -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the records of a file written by JsonlResultWriter.
+
+    A final line without its newline (a write cut short by a crash) is skipped.
+    """
+    compression = _resolve_compression(path, compression)
+    if compression == "gzip":
+        stream = gzip.open(path, "rt", encoding="utf-8")
+    elif compression == "zstd":
+        decompressor = _zstandard().ZstdDecompressor()
+        stream = io.TextIOWrapper(decompressor.stream_reader(open(path, "rb")), encoding="utf-8")
+    else:
+        stream = open(path, encoding="utf-8")
+    with stream:
+        for line in stream:
+            if line.endswith("\n") and line.strip():
+                yield json.loads(line)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with Prometheus ``le`` semantics."""
+    
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+    
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for position, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.buckets[position - 1] if position else 0.0
+                if position == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[position] - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+# The span that stage delays in the current thread or task are charged to
+_active_span: contextvars.ContextVar = contextvars.ContextVar("genesis_clock_span", default=None)
+
+
+class ClockSpan:
+    """Seconds spent inside a ``with clock.span()`` block, on that clock's time line."""
+    
+    def __init__(self, clock: "RealClock"):
+        self.clock = clock
+        self.seconds = 0.0
+    
+    def __enter__(self) -> "ClockSpan":
+        self._token = _active_span.set(self)
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        _active_span.reset(self._token)
+        if not self.clock.simulated:
+            self.seconds = time.perf_counter() - self._start
+
+
+class RealClock:
+    """Wall-clock time: stage latency is spent blocking the calling thread."""
+    
+    simulated = False
+    
+    def stage_delay(self, stage: str, seconds: float) -> None:
+        time.sleep(seconds)
+    
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+    
+    def span(self) -> ClockSpan:
+        return ClockSpan(self)
+
+
+def uniform_latency(low: float, high: float):
+    """Stage latency distribution for VirtualClock: uniform on [low, high]."""
+    return functools.partial(_uniform_latency, low, high)
+
+
+def lognormal_latency(median: float, sigma: float):
+    """Stage latency distribution for VirtualClock: log-normal with a long right tail."""
+    return functools.partial(_lognormal_latency, median, sigma)
+
+
+def _uniform_latency(low: float, high: float, rng: random.Random) -> float:
+    return rng.uniform(low, high)
+
+
+def _lognormal_latency(median: float, sigma: float, rng: random.Random) -> float:
+    return median * rng.lognormvariate(0.0, sigma)
+
+
+class VirtualClock(RealClock):
+    """
+    Simulated time: stage latency advances a virtual time line instead of blocking.
+
+    ``latencies`` maps stage names to a fixed number of seconds or to a
+    distribution (a callable taking a random.Random, e.g. uniform_latency or
+    lognormal_latency); stages without an entry cost the meta-agent's default.
+    The coordinator charges each draw to the running stage and records every
+    task's simulated end-to-end latency: the sum of its stages for handle_task
+    and the critical path through PIPELINE_STAGES for ahandle_task. Read it
+    from ``task_latency`` or summary(). Worker processes of handle_tasks get
+    their own copy; attach StageMetrics to collect their latencies.
+    """
+    
+    simulated = True
+    
+    def __init__(self, latencies: Optional[Dict[str, Any]] = None, seed: Optional[int] = None,
+                 buckets: Tuple[float, ...] = LatencyHistogram.DEFAULT_BUCKETS):
+        self.latencies = dict(latencies or {})
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.task_latency = LatencyHistogram(buckets)
+        self._lock = threading.Lock()
+    
+    def stage_delay(self, stage: str, seconds: float) -> None:
+        latency = self.latencies.get(stage, seconds)
+        if callable(latency):
+            with self._lock:
+                latency = latency(self.rng)
+        self.sleep(max(0.0, latency))
+    
+    def sleep(self, seconds: float) -> None:
+        span = _active_span.get()
+        if span is not None:
+            span.seconds += seconds
+    
+    def record_task(self, seconds: float) -> None:
+        with self._lock:
+            self.task_latency.observe(seconds)
+    
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            histogram = self.task_latency
+            return {
+                "tasks": histogram.count,
+                "simulated_seconds": histogram.sum,
+                "mean_seconds": histogram.sum / histogram.count if histogram.count else 0.0,
+                "p50_seconds": histogram.quantile(0.5),
+                "p99_seconds": histogram.quantile(0.99),
+            }
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        if self.seed is None:
+            # Unseeded copies in worker processes should not replay the same draws
+            self.rng = random.Random()
+
+
+class StageMetrics:
+    """
+    Wall and CPU time of every pipeline stage, keyed by stage and TaskScope.
+
+    Attach one to GenesisMetaCoordinator(metrics=...). Each observation is a
+    bisect plus two additions, so it is cheap enough to leave on under load.
+    Read it through snapshot() or render_prometheus(). The whole task is
+    recorded under the stage name "task". With a VirtualClock the wall
+    histograms hold simulated seconds.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = LatencyHistogram.DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, stage: str, scope: TaskScope, wall_seconds: float, cpu_seconds: float) -> None:
+        with self._lock:
+            self._histogram("wall", stage, scope.value).observe(wall_seconds)
+            self._histogram("cpu", stage, scope.value).observe(cpu_seconds)
+    
+    def merge(self, other: "StageMetrics") -> None:
+        with self._lock:
+            for (kind, stage, scope), histogram in other._histograms.items():
+                self._histogram(kind, stage, scope).merge(histogram)
+    
+    def fresh(self) -> "StageMetrics":
+        """An empty StageMetrics with the same buckets."""
+        return StageMetrics(self.buckets)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """``{stage: {scope: {count, wall_sum, wall_p50, wall_p99, cpu_sum, cpu_p50, cpu_p99}}}``"""
+        with self._lock:
+            snapshot: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (kind, stage, scope), histogram in sorted(self._histograms.items()):
+                entry = snapshot.setdefault(stage, {}).setdefault(scope, {"count": histogram.count})
+                entry[f"{kind}_sum"] = histogram.sum
+                entry[f"{kind}_p50"] = histogram.quantile(0.5)
+                entry[f"{kind}_p99"] = histogram.quantile(0.99)
+            return snapshot
+    
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            for kind, description in (("wall", "Wall-clock"), ("cpu", "CPU")):
+                name = f"genesis_stage_{kind}_seconds"
+                lines.append(f"# HELP {name} {description} time spent per meta-agent stage.")
+                lines.append(f"# TYPE {name} histogram")
+                for (histogram_kind, stage, scope), histogram in sorted(self._histograms.items()):
+                    if histogram_kind != kind:
+                        continue
+                    labels = f'stage="{stage}",scope="{scope}"'
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets + (float("inf"),), histogram.counts):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+    
+    def _histogram(self, kind: str, stage: str, scope: str) -> LatencyHistogram:
+        key = (kind, stage, scope)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+        return histogram
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+# Since Python 3.12 cProfile runs on sys.monitoring, which allows one active profiler per process
+_PROFILER_SLOT = threading.Lock() if sys.version_info >= (3, 12) else None
+
+
+def _start_stage_profile() -> Optional[cProfile.Profile]:
+    """A fresh, enabled profiler, or None when another profiler is already active (the stage then runs unprofiled)."""
+    if _PROFILER_SLOT is not None and not _PROFILER_SLOT.acquire(blocking=False):
+        return None
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # An outside profiling tool holds sys.setprofile / sys.monitoring
+        if _PROFILER_SLOT is not None:
+            _PROFILER_SLOT.release()
+        return None
+    return profile
+
+
+def _stop_stage_profile(profile: cProfile.Profile) -> None:
+    profile.disable()
+    if _PROFILER_SLOT is not None:
+        _PROFILER_SLOT.release()
+
+
+class SlowTaskProfiler:
+    """
+    Keeps cProfile profiles of tasks slower than ``threshold_seconds``.
+
+    Every stage runs under its own profiler (stages may run on different
+    threads). On Python 3.12+ only one profiler can be active per process,
+    so a stage that overlaps another profiled stage runs unprofiled and the
+    task's profile covers the rest; a profiler that cannot be enabled never
+    fails the task. A slow task keeps the merged pstats.Stats of its stages in
+    ``profiles``, newest last, at most ``max_profiles`` of them. With
+    ``directory`` set, each one is also dumped to a .prof file there. That is
+    the only way to get profiles out of handle_tasks worker processes.
+    """
+    
+    def __init__(self, threshold_seconds: float, max_profiles: int = 20, directory: Optional[str] = None):
+        self.threshold_seconds = threshold_seconds
+        self.directory = directory
+        self.profiles: "deque[Tuple[float, str, pstats.Stats]]" = deque(maxlen=max_profiles)
+        self._captured = 0
+        self._lock = threading.Lock()
+    
+    def consider(self, task_description: str, wall_seconds: float, stage_profiles: List[cProfile.Profile]) -> None:
+        if wall_seconds < self.threshold_seconds or not stage_profiles:
+            return
+        # Bind to the real stdout: stage output may be redirected while the task runs
+        stats = pstats.Stats(stage_profiles[0], stream=sys.__stdout__)
+        for profile in stage_profiles[1:]:
+            stats.add(profile)
+        with self._lock:
+            self._captured += 1
+            self.profiles.append((wall_seconds, task_description, stats))
+            if self.directory is not None:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(os.path.join(self.directory, f"slow-task-{os.getpid()}-{self._captured}.prof"))
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["profiles"] = deque(maxlen=self.profiles.maxlen)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
 class GenesisMetaCoordinator:
     """Supreme meta-agent that orchestrates all other meta-agents."""
     
-    def __init__(self):
-        self.task_analyzer = TaskScopeAnalyzer()
-        self.ecosystem_designer = AgentEcosystemDesigner()
-        self.tech_specialist = TechnologyStackSpecialist()
-        self.evolution_planner = EvolutionStrategyPlanner()
-        self.performance_monitor = AgentPerformanceMonitor()
+    # Stage DAG: each stage and the outputs it consumes, in topological order.
+    PIPELINE_STAGES = {
+        "task_analysis": ("task_description",),
+        "ecosystem_design": ("task_analysis",),
+        "technology_stack": ("task_analysis", "ecosystem_design"),
+        "evolution_strategy": ("task_analysis", "ecosystem_design"),
+        "performance_monitoring": ("ecosystem_design", "evolution_strategy"),
+    }
+    
+    # Number of edited tasks whose stage outputs replan_task remembers
+    PLAN_MEMORY = 1024
+    
+    def __init__(self, cache: Optional[AnalysisCache] = None, seed: Optional[int] = None,
+                 metrics: Optional[StageMetrics] = None, profiler: Optional[SlowTaskProfiler] = None,
+                 clock: Optional[RealClock] = None):
+        self.clock = clock or RealClock()
+        self.task_analyzer = TaskScopeAnalyzer(self.clock)
+        self.ecosystem_designer = AgentEcosystemDesigner(self.clock)
+        self.tech_specialist = TechnologyStackSpecialist(self.clock)
+        self.evolution_planner = EvolutionStrategyPlanner(self.clock)
+        self.performance_monitor = AgentPerformanceMonitor(self.clock)
+        self.cache = cache
+        # Cached results are only valid if recomputing them gives the same answer,
+        # so caching implies seeding every task's RNG from its normalized text.
+        self.seed = 0 if cache is not None and seed is None else seed
+        self.metrics = metrics
+        self.profiler = profiler
+        self._plans: "OrderedDict[str, Dict[str, Tuple[Any, Any, Any]]]" = OrderedDict()
     
-    def handle_task(self, task_description: str) -> Dict[str, Any]:
+    def handle_task(self, task_description: str, keyword_hits: Optional[Dict[str, Set[str]]] = None,
+                    rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Complete end-to-end handling of any task through meta-agent coordination.
+
+        ``keyword_hits`` is passed on to TaskScopeAnalyzer.analyze_task, so
+        callers that matched many descriptions at once (match_batch) do not
+        tokenize each one again. ``rng`` drives the stages of a coordinator
+        without a seed (handle_tasks passes one per task); a seeded
+        coordinator always derives the RNG from the task text.
         """
+        cache_key = task_cache_key(task_description)
+        cached = self._cached_result(cache_key, task_description)
+        if cached is not None:
+            return cached
+        stages = self._stage_functions(self._task_rng(cache_key, rng), keyword_hits)
+        trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]] = []
+        task_start = time.perf_counter()
+        
         print("🚀 Genesis Meta-Coordinator: Initiating comprehensive task analysis and ecosystem creation")
         print(f"📝 Task: {task_description}")
         print("=" * 80)
         
         # Step 1: Analyze task scope and requirements
-        task_analysis = self.task_analyzer.analyze_task(task_description)
+        task_analysis = self._run_stage(trace, "task_analysis", stages["task_analysis"], task_description)
         print()
         
         # Step 2: Design optimal agent ecosystem
-        ecosystem_design = self.ecosystem_designer.design_ecosystem(task_analysis)
+        ecosystem_design = self._run_stage(trace, "ecosystem_design", stages["ecosystem_design"], task_analysis)
         print()
         
         # Step 3: Select optimal technology stack
-        technology_stack = self.tech_specialist.select_technology_stack(task_analysis, ecosystem_design)
+        technology_stack = self._run_stage(trace, "technology_stack", stages["technology_stack"], task_analysis, ecosystem_design)
         print()
         
         # Step 4: Plan evolutionary strategy
-        evolution_strategy = self.evolution_planner.plan_evolution_strategy(task_analysis, ecosystem_design)
+        evolution_strategy = self._run_stage(trace, "evolution_strategy", stages["evolution_strategy"], task_analysis, ecosystem_design)
         print()
         
         # Step 5: Setup performance monitoring
-        performance_monitoring = self.performance_monitor.setup_monitoring(ecosystem_design, evolution_strategy)
+        performance_monitoring = self._run_stage(trace, "performance_monitoring", stages["performance_monitoring"], ecosystem_design, evolution_strategy)
         print()
+        self._record_trace(trace, task_analysis.scope_category, task_description,
+                           self._task_latency(trace, time.perf_counter() - task_start, concurrent=False))
         
         # Generate comprehensive result
-        result = {
-            "task_description": task_description,
-            "task_analysis": asdict(task_analysis),
-            "ecosystem_design": asdict(ecosystem_design),
-            "technology_stack": asdict(technology_stack),
-            "evolution_strategy": asdict(evolution_strategy),
-            "performance_monitoring": asdict(performance_monitoring),
-            "meta_coordination_summary": self._generate_coordination_summary(
-                task_analysis, ecosystem_design, technology_stack, evolution_strategy, performance_monitoring
-            )
-        }
+        result = self._build_result(
+            task_description, task_analysis, ecosystem_design, technology_stack, evolution_strategy, performance_monitoring
+        )
+        if self.cache is not None:
+            self.cache.put(cache_key, result)
         
         print("🎯 Genesis Meta-Coordinator: Complete ecosystem created and ready for deployment")
         print("=" * 80)
         return result
+
+    def replan_task(self, task_description: str, task_id: str) -> Dict[str, Any]:
+        """
+        handle_task for a task whose description is edited over time.
+
+        ``task_id`` identifies the task across edits: each stage's RNG is
+        seeded from it rather than from the text, every stage's inputs are
+        fingerprinted, and a stage whose fingerprint matches the previous
+        plan for ``task_id`` reuses that plan's output instead of running.
+        The result holds copy-on-write views of the plan's frozen stage
+        outputs, so editing it never changes a later re-plan.
+        result["incremental"] lists the recomputed and reused stages.
+        """
+        previous = self._plans.pop(task_id, {})
+        stage_rngs = {name: random.Random(f"{self.seed}:{task_id}:{name}") for name in ("task_analysis", "ecosystem_design")}
+        stages = self._stage_functions(stage_rngs["task_analysis"])
+        stages["ecosystem_design"] = functools.partial(self.ecosystem_designer.design_ecosystem, rng=stage_rngs["ecosystem_design"])
+        outputs: Dict[str, Any] = {"task_description": task_description}
+        plan: Dict[str, Tuple[Any, Any, Any]] = {}
+        recomputed, reused = [], []
+        trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]] = []
+        task_start = time.perf_counter()
+        
+        print("🔁 Genesis Meta-Coordinator: Re-planning edited task")
+        print(f"📝 Task: {task_description}")
+        print("=" * 80)
+        
+        for name, inputs in self.PIPELINE_STAGES.items():
+            fingerprint = self._stage_fingerprint(name, outputs, plan)
+            earlier = previous.get(name)
+            if earlier is not None and earlier[0] == fingerprint:
+                outputs[name] = earlier[1]
+                plan[name] = earlier
+                reused.append(name)
+            else:
+                outputs[name] = self._run_stage(trace, name, stages[name], *(outputs[dependency] for dependency in inputs))
+                # Results only ever get copy-on-write views of this frozen form, never the plan's payloads
+                plan[name] = (fingerprint, outputs[name], freeze(result_to_dict(outputs[name])))
+                recomputed.append(name)
+                print()
+        self._record_trace(trace, outputs["task_analysis"].scope_category, task_description,
+                           self._task_latency(trace, time.perf_counter() - task_start, concurrent=False))
+        
+        self._plans[task_id] = plan
+        while len(self._plans) > self.PLAN_MEMORY:
+            self._plans.popitem(last=False)
+        
+        result = {"task_description": task_description}
+        result.update((name, copy_on_write(plan[name][2])) for name in self.PIPELINE_STAGES)
+        result["meta_coordination_summary"] = self._generate_coordination_summary(*(outputs[name] for name in self.PIPELINE_STAGES))
+        result["incremental"] = {"recomputed": recomputed, "reused": reused}
+        print(f"🎯 Genesis Meta-Coordinator: Re-planned {len(recomputed)} stages, reused {len(reused)}")
+        print("=" * 80)
+        return result
+    
+    async def ahandle_task(self, task_description: str, executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """
+        Asynchronous handle_task that schedules stages from PIPELINE_STAGES.
+
+        Every stage starts as soon as the stages it consumes have finished, so
+        independent stages (technology stack selection and evolution planning)
+        run concurrently. Stages run on ``executor`` (the loop's default
+        thread pool when omitted), which lets many tasks share one event loop.
+        """
+        cache_key = task_cache_key(task_description)
+        cached = self._cached_result(cache_key, task_description)
+        if cached is not None:
+            return cached
+        
+        print("🚀 Genesis Meta-Coordinator: Initiating comprehensive task analysis and ecosystem creation")
+        print(f"📝 Task: {task_description}")
+        print("=" * 80)
+        
+        loop = asyncio.get_running_loop()
+        stage_functions = self._stage_functions(self._task_rng(cache_key))
+        outputs: Dict[str, Any] = {"task_description": task_description}
+        stages: Dict[str, asyncio.Future] = {}
+        trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]] = []
+        task_start = time.perf_counter()
+        
+        async def run_stage(name: str) -> None:
+            inputs = self.PIPELINE_STAGES[name]
+            await asyncio.gather(*(stages[dependency] for dependency in inputs if dependency in stages))
+            stage_call = functools.partial(self._run_stage, trace, name, stage_functions[name],
+                                           *(outputs[dependency] for dependency in inputs))
+            outputs[name] = await loop.run_in_executor(executor, stage_call)
+        
+        for name in self.PIPELINE_STAGES:
+            stages[name] = asyncio.ensure_future(run_stage(name))
+        await asyncio.gather(*stages.values())
+        self._record_trace(trace, outputs["task_analysis"].scope_category, task_description,
+                           self._task_latency(trace, time.perf_counter() - task_start, concurrent=True))
+        
+        result = self._build_result(task_description, *(outputs[name] for name in self.PIPELINE_STAGES))
+        if self.cache is not None:
+            self.cache.put(cache_key, result)
+        
+        print("🎯 Genesis Meta-Coordinator: Complete ecosystem created and ready for deployment")
+        print("=" * 80)
+        return result
+
+    async def ahandle_tasks(self, task_descriptions: Iterable[str], max_concurrency: int = 100) -> List[BatchTaskOutcome]:
+        """Run many tasks on the current event loop, keeping up to ``max_concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Two stages of one task may run at once, so size the pool accordingly.
+        executor = ThreadPoolExecutor(max_workers=max_concurrency * 2)
+        
+        async def run_one(index: int, task_description: str) -> BatchTaskOutcome:
+            async with semaphore:
+                try:
+                    result = await self.ahandle_task(task_description, executor=executor)
+                except Exception as exc:
+                    return BatchTaskOutcome(index=index, task_description=task_description,
+                                            error=f"{type(exc).__name__}: {exc}")
+                return BatchTaskOutcome(index=index, task_description=task_description, result=result)
+        
+        try:
+            return await asyncio.gather(*(run_one(index, task) for index, task in enumerate(task_descriptions)))
+        finally:
+            executor.shutdown(wait=False)
+
+    def handle_tasks(self, task_descriptions: Iterable[str], workers: Optional[int] = None,
+                     ordered: bool = True, seed: Optional[int] = None, quiet: bool = True,
+                     max_in_flight: Optional[int] = None) -> Iterator[BatchTaskOutcome]:
+        """
+        Handle many tasks by fanning them out across a process pool.
+
+        Yields one BatchTaskOutcome per task, either in submission order
+        (``ordered=True``) or as tasks complete. A failing task is reported
+        through ``outcome.error`` and never aborts the rest of the batch.
+        An InvalidTaskInput (see iter_task_descriptions) becomes a failed
+        outcome without running. Each worker reseeds its RNG on startup;
+        passing ``seed`` additionally seeds every task from ``(seed, index)``
+        so runs are reproducible regardless of which worker picks a task up.
+        Workers print progress to stderr whenever this process's stdout is
+        redirected there, whatever the start method. With a cache configured,
+        hits are answered in this process, duplicates of a task that is still
+        in flight share its result, and only genuine misses reach the pool.
+        """
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or workers * 2
+        tasks = enumerate(task_descriptions)
+
+        if workers == 1:
+            for index, task_description in tasks:
+                if isinstance(task_description, InvalidTaskInput):
+                    yield task_description.outcome(index)
+                else:
+                    yield _run_batch_task(self, index, task_description, seed, quiet)
+            return
+
+        # Workers get a cache-less copy; the cache lives in (and is filled by) this process.
+        worker_coordinator = copy.copy(self)
+        worker_coordinator.cache = None
+        # Spawned workers get a fresh sys.stdout, so pass main()'s redirect of progress to stderr along
+        progress_to_stderr = sys.stdout is sys.stderr
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                       initargs=(worker_coordinator, progress_to_stderr))
+        in_flight: Dict[str, Future] = {}
+        try:
+            pending = deque()
+            for index, task_description in tasks:
+                if isinstance(task_description, InvalidTaskInput):
+                    future = Future()
+                    future.set_result(task_description.outcome(index))
+                    pending.append((index, task_description.line, future))
+                    if len(pending) >= max_in_flight:
+                        yield from self._remember_outcomes(_drain_batch(pending, ordered, until=max_in_flight - 1), in_flight)
+                    continue
+                cache_key = task_cache_key(task_description)
+                cached = self._cached_result(cache_key, task_description)
+                if cached is not None:
+                    future = Future()
+                    future.set_result(BatchTaskOutcome(index=index, task_description=task_description,
+                                                       result=cached, from_cache=True))
+                elif self.cache is not None and cache_key in in_flight:
+                    future = in_flight[cache_key]
+                else:
+                    future = executor.submit(_run_batch_task_in_worker, index, task_description, seed, quiet)
+                    if self.cache is not None:
+                        in_flight[cache_key] = future
+                pending.append((index, task_description, future))
+                if len(pending) >= max_in_flight:
+                    yield from self._remember_outcomes(_drain_batch(pending, ordered, until=max_in_flight - 1), in_flight)
+            yield from self._remember_outcomes(_drain_batch(pending, ordered, until=0), in_flight)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _remember_outcomes(self, outcomes: Iterator[BatchTaskOutcome], in_flight: Dict[str, Future]) -> Iterator[BatchTaskOutcome]:
+        for outcome in outcomes:
+            if self.metrics is not None and outcome.stage_metrics is not None:
+                self.metrics.merge(outcome.stage_metrics)
+                outcome.stage_metrics = None
+            if self.cache is not None and not outcome.from_cache:
+                cache_key = task_cache_key(outcome.task_description)
+                in_flight.pop(cache_key, None)
+                if outcome.ok:
+                    self.cache.put(cache_key, outcome.result)
+            yield outcome
+    
+    def _run_stage(self, trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]], name: str, stage_function, *inputs):
+        profile = _start_stage_profile() if self.profiler is not None else None
+        span = self.clock.span()
+        cpu_start = time.thread_time()
+        try:
+            with span:
+                return stage_function(*inputs)
+        finally:
+            if profile is not None:
+                _stop_stage_profile(profile)
+            trace.append((name, span.seconds, time.thread_time() - cpu_start, profile))
+    
+    def _record_trace(self, trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]], scope: TaskScope,
+                      task_description: str, wall_seconds: float) -> None:
+        if self.metrics is not None:
+            for name, stage_wall, stage_cpu, _ in trace:
+                self.metrics.record(name, scope, stage_wall, stage_cpu)
+            self.metrics.record("task", scope, wall_seconds, sum(stage_cpu for _, _, stage_cpu, _ in trace))
+        if self.profiler is not None:
+            self.profiler.consider(task_description, wall_seconds, [profile for *_, profile in trace if profile is not None])
+        if self.clock.simulated:
+            self.clock.record_task(wall_seconds)
+    
+    def _task_latency(self, trace: List[Tuple[str, float, float, Optional[cProfile.Profile]]],
+                      measured_seconds: float, concurrent: bool) -> float:
+        """End-to-end latency on the clock's time line; simulated stages run back to back or along the DAG."""
+        if not self.clock.simulated:
+            return measured_seconds
+        durations = {name: stage_seconds for name, stage_seconds, _, _ in trace}
+        if not concurrent:
+            return sum(durations.values())
+        finished: Dict[str, float] = {}
+        for name, inputs in self.PIPELINE_STAGES.items():
+            finished[name] = max((finished[dependency] for dependency in inputs if dependency in finished), default=0.0) + durations[name]
+        return max(finished.values())
+    
+    def _stage_fingerprint(self, name: str, outputs: Dict[str, Any], plan: Dict[str, Tuple[Any, Any, Any]]) -> Tuple[Any, ...]:
+        """What a stage actually reads from its inputs: equal fingerprints give equal outputs."""
+        if name == "task_analysis":
+            return (normalize_task_description(outputs["task_description"]),)
+        task_analysis = outputs["task_analysis"]
+        if name == "ecosystem_design":
+            recommendations = task_analysis.ecosystem_recommendations
+            return (task_analysis.scope_category, recommendations["recommended_agent_count"],
+                    tuple(recommendations["specialization_areas"]))
+        if name == "technology_stack":
+            return (task_analysis.scope_category, self.tech_specialist._determine_risk_profile(task_analysis))
+        if name == "evolution_strategy":
+            return (task_analysis.scope_category,)
+        # Any other stage depends on everything upstream of it (and monitoring on live data)
+        upstream = tuple(plan[dependency][0] for dependency in self.PIPELINE_STAGES[name])
+        if name != "performance_monitoring":
+            return upstream
+        stream, rules = self.performance_monitor.stream, self.performance_monitor.rules
+        return upstream + (stream and (id(stream), stream.events), rules and (id(rules), rules.ticks))
+    
+    def _task_rng(self, cache_key: str, rng: Optional[random.Random] = None) -> random.Random:
+        if self.seed is None:
+            return rng or random.Random(random.getrandbits(64))
+        return random.Random(f"{self.seed}:{cache_key}")
+    
+    def _cached_result(self, cache_key: str, task_description: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        result = self.cache.get(cache_key)
+        if result is not None:
+            result["task_description"] = task_description
+        return result
+    
+    def _stage_functions(self, rng: random.Random, keyword_hits: Optional[Dict[str, Set[str]]] = None) -> Dict[str, Any]:
+        return {
+            "task_analysis": functools.partial(self.task_analyzer.analyze_task, rng=rng, keyword_hits=keyword_hits),
+            "ecosystem_design": functools.partial(self.ecosystem_designer.design_ecosystem, rng=rng),
+            "technology_stack": self.tech_specialist.select_technology_stack,
+            "evolution_strategy": self.evolution_planner.plan_evolution_strategy,
+            "performance_monitoring": self.performance_monitor.setup_monitoring,
+        }
+    
+    def _build_result(self, task_description, task_analysis, ecosystem_design, technology_stack, evolution_strategy, performance_monitoring) -> Dict[str, Any]:
+        return PipelineResult(
+            task_description=task_description,
+            task_analysis=task_analysis,
+            ecosystem_design=ecosystem_design,
+            technology_stack=technology_stack,
+            evolution_strategy=evolution_strategy,
+            performance_monitoring=performance_monitoring,
+            meta_coordination_summary=self._generate_coordination_summary(
+                task_analysis, ecosystem_design, technology_stack, evolution_strategy, performance_monitoring
+            )
+        ).to_dict()
     
     def _generate_coordination_summary(self, task_analysis, ecosystem_design, technology_stack, evolution_strategy, performance_monitoring) -> Dict[str, Any]:
         return {
@@ -816,10 +2518,80 @@ class GenesisMetaCoordinator:
         }
 
 
-def run_demonstrations():
-    """Run comprehensive demonstrations of the meta-agent system."""
+_worker_coordinator: Optional[GenesisMetaCoordinator] = None
+
+
+def _init_batch_worker(coordinator: GenesisMetaCoordinator, progress_to_stderr: bool = False) -> None:
+    global _worker_coordinator
+    _worker_coordinator = coordinator
+    if progress_to_stderr:
+        sys.stdout = sys.stderr
+    # Forked workers inherit the parent's RNG state; give each its own seed.
+    random.seed(os.urandom(16))
+
+
+def _run_batch_task_in_worker(index: int, task_description: str, seed: Optional[int], quiet: bool) -> BatchTaskOutcome:
+    coordinator = _worker_coordinator
+    if coordinator.metrics is not None:
+        # Ship this task's timings back to the parent's metrics with the outcome
+        coordinator.metrics = coordinator.metrics.fresh()
+    outcome = _run_batch_task(coordinator, index, task_description, seed, quiet)
+    outcome.stage_metrics = coordinator.metrics
+    return outcome
+
+
+def _run_batch_task(coordinator: GenesisMetaCoordinator, index: int, task_description: str,
+                    seed: Optional[int], quiet: bool) -> BatchTaskOutcome:
+    # A private RNG per task: with workers=1 this runs in the caller's process
+    rng = random.Random(f"{seed}:{index}") if seed is not None else None
+    try:
+        if quiet:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = coordinator.handle_task(task_description, rng=rng)
+        else:
+            result = coordinator.handle_task(task_description, rng=rng)
+    except Exception as exc:
+        return BatchTaskOutcome(index=index, task_description=task_description, error=f"{type(exc).__name__}: {exc}")
+    return BatchTaskOutcome(index=index, task_description=task_description, result=result)
+
+
+def _drain_batch(pending: deque, ordered: bool, until: int) -> Iterator[BatchTaskOutcome]:
+    """Yield finished outcomes until at most ``until`` tasks remain in flight."""
+    while len(pending) > until:
+        if ordered:
+            completed = [pending.popleft()]
+        else:
+            done, _ = wait([future for _, _, future in pending], return_when=FIRST_COMPLETED)
+            completed = [entry for entry in pending if entry[2] in done]
+            for entry in completed:
+                pending.remove(entry)
+        for index, task_description, future in completed:
+            try:
+                outcome = future.result()
+                if outcome.index != index:
+                    # A duplicate that shared the result of an identical in-flight task
+                    result = copy.deepcopy(outcome.result)
+                    if result is not None:
+                        result["task_description"] = task_description
+                    outcome = BatchTaskOutcome(index=index, task_description=task_description, result=result,
+                                               error=outcome.error, from_cache=True)
+                yield outcome
+            except Exception as exc:
+                # The worker itself died (e.g. BrokenProcessPool); report it against this task only.
+                yield BatchTaskOutcome(index=index, task_description=task_description,
+                                       error=f"{type(exc).__name__}: {exc}")
+
+
+def run_demonstrations(sink: Optional[JsonlResultWriter] = None, clock: Optional[RealClock] = None):
+    """
+    Run comprehensive demonstrations of the meta-agent system.
+
+    Full results are streamed to ``sink`` as they are produced; only a short
+    summary per demonstration is kept and returned. Pass a VirtualClock to
+    simulate stage latency and pauses instead of waiting for them.
+    """
     
-    coordinator = GenesisMetaCoordinator()
+    coordinator = GenesisMetaCoordinator(clock=clock)
     
     # Demo tasks representing different scopes
     demo_tasks = [
@@ -830,7 +2602,7 @@ def run_demonstrations():
         "Develop a revolutionary quantum-computing-based artificial intelligence framework for breakthrough scientific discovery"
     ]
     
-    results = []
+    summaries = []
     
     for i, task in enumerate(demo_tasks, 1):
         print(f"\n{'='*100}")
@@ -838,12 +2610,19 @@ def run_demonstrations():
         print(f"{'='*100}")
         
         result = coordinator.handle_task(task)
-        results.append(result)
+        if sink is not None:
+            sink.write(result)
         
         # Brief summary of what was created
         scope = result['task_analysis']['scope_category']
         agent_count = result['ecosystem_design']['total_agents']
         tech_stack = result['technology_stack']['stack_name']
+        summaries.append({
+            "task_description": task,
+            "scope": scope.value,
+            "total_agents": agent_count,
+            "technology_stack": tech_stack
+        })
         
         print(f"\n📋 RESULT SUMMARY:")
         print(f"   🎯 Scope: {scope.value.upper()}")
@@ -854,7 +2633,7 @@ def run_demonstrations():
         
         if i < len(demo_tasks):
             print(f"\n⏳ Preparing next demonstration...")
-            time.sleep(1)
+            coordinator.clock.sleep(1)
     
     # Generate overall summary
     print(f"\n{'='*100}")
@@ -863,7 +2642,7 @@ def run_demonstrations():
     
     print(f"✅ Successfully demonstrated meta-agent coordination for {len(demo_tasks)} different task scopes")
     print(f"✅ Scope range: MICRO → SMALL → MEDIUM → LARGE → MEGA")
-    print(f"✅ Agent ecosystems: 1 → {results[1]['ecosystem_design']['total_agents']} → {results[2]['ecosystem_design']['total_agents']} → {results[3]['ecosystem_design']['total_agents']} → {results[4]['ecosystem_design']['total_agents']} agents")
+    print(f"✅ Agent ecosystems: 1 → {summaries[1]['total_agents']} → {summaries[2]['total_agents']} → {summaries[3]['total_agents']} → {summaries[4]['total_agents']} agents")
     print(f"✅ Complete technology stack selection and optimization")
     print(f"✅ Evolutionary strategies from rapid iteration to paradigm creation")
     print(f"✅ Comprehensive performance monitoring and continuous improvement")
@@ -871,19 +2650,109 @@ def run_demonstrations():
     print(f"\n🎊 Agent Genesis Meta-Agent System: FULLY OPERATIONAL")
     print(f"Ready to handle any task scope with optimal agent ecosystem creation!")
     
-    return results
+    return summaries
 
 
-if __name__ == "__main__":
-    print("🌟 Agent Genesis Meta-Agent System Demonstration")
-    print("Showcasing universal task handling from micro to mega scale")
-    print()
+def iter_task_descriptions(lines: Iterable[str], input_format: str = "auto") -> Iterator[Union[str, InvalidTaskInput]]:
+    """
+    Lazily yield task descriptions from text or JSONL lines.
+
+    Text input is one description per line. JSONL lines are objects with a
+    "task_description" key or bare JSON strings. With "auto" a line that
+    starts with ``{`` or ``"`` is read as JSON if it parses and as text
+    otherwise. A line that is not a task record (malformed JSONL, or JSON
+    without a description) is yielded as an InvalidTaskInput so it fails on
+    its own instead of aborting the stream. Blank lines are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield _parse_task_line(line, input_format)
+
+
+def _parse_task_line(line: str, input_format: str) -> Union[str, InvalidTaskInput]:
+    if input_format == "text" or (input_format == "auto" and line[0] not in '{"'):
+        return line
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        if input_format == "auto":
+            return line
+        return InvalidTaskInput(line, f"JSONDecodeError: {exc}")
+    if isinstance(record, dict):
+        record = record.get("task_description")
+    if not isinstance(record, str):
+        return InvalidTaskInput(line, 'ValueError: expected a JSON string or an object with a string "task_description"')
+    return record
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Agent Genesis meta-agent system")
+    parser.add_argument("inputs", nargs="*", help="task files (text or JSONL); '-' reads stdin; none runs the demonstration")
+    parser.add_argument("--format", choices=("auto", "text", "jsonl"), default="auto", help="input format")
+    parser.add_argument("--output", default="-", help="results file (.jsonl, .jsonl.gz, .jsonl.zst); default stdout")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="tasks submitted but not yet written (default 2x workers)")
+    parser.add_argument("--ordered", action="store_true", help="write results in input order instead of completion order")
+    parser.add_argument("--quiet", action="store_true", help="suppress the meta-agents' progress output")
+    parser.add_argument("--seed", type=int, default=None, help="seed every task for reproducible results")
+    parser.add_argument("--virtual-clock", action="store_true", help="simulate stage latency instead of waiting")
+    args = parser.parse_args(argv)
+    clock = VirtualClock(seed=args.seed) if args.virtual_clock else None
     
-    results = run_demonstrations()
+    if not args.inputs:
+        print("🌟 Agent Genesis Meta-Agent System Demonstration")
+        print("Showcasing universal task handling from micro to mega scale")
+        print()
+        
+        # Stream results for analysis as each demonstration completes
+        with JsonlResultWriter('meta_agent_demonstration_results.jsonl', flush_every=1) as sink:
+            run_demonstrations(sink, clock)
+        
+        print(f"\n💾 Detailed results saved to 'meta_agent_demonstration_results.jsonl'")
+        print("🚀 Agent Genesis is ready for real-world deployment!")
+        return 0
     
-    # Save results for analysis
-    with open('meta_agent_demonstration_results.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    def lines() -> Iterator[str]:
+        for path in args.inputs:
+            if path == "-":
+                yield from sys.stdin
+            else:
+                with open(path, encoding="utf-8") as stream:
+                    yield from stream
     
-    print(f"\n💾 Detailed results saved to 'meta_agent_demonstration_results.json'")
-    print("🚀 Agent Genesis is ready for real-world deployment!")
+    # Results own stdout; progress output goes to stderr (or nowhere with --quiet)
+    results = sys.stdout
+    failures = 0
+    coordinator = GenesisMetaCoordinator(seed=args.seed, clock=clock)
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        sink = stack.enter_context(JsonlResultWriter(args.output)) if args.output != "-" else None
+        outcomes = coordinator.handle_tasks(iter_task_descriptions(lines(), args.format), workers=args.workers,
+                                            ordered=args.ordered, seed=args.seed, quiet=args.quiet,
+                                            max_in_flight=args.max_in_flight)
+        try:
+            for outcome in outcomes:
+                if not outcome.ok:
+                    failures += 1
+                    print(f"❌ Task {outcome.index} failed: {outcome.error}", file=sys.stderr)
+                    record = {"index": outcome.index, "task_description": outcome.task_description, "error": outcome.error}
+                else:
+                    record = outcome.result
+                if sink is not None:
+                    sink.write(record)
+                else:
+                    results.write(encode_result_json(record))
+                    results.write("\n")
+            results.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`); stop quietly like other filters
+            os.dup2(os.open(os.devnull, os.O_WRONLY), results.fileno())
+            return 1
+        finally:
+            outcomes.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Optimization Rules
+
+Declarative threshold and trend rules over PerformanceStream metrics that
+produce AgentPerformanceMonitor optimization recommendations (the same
+``area`` / ``recommendation`` / ``expected_impact`` /
+``implementation_effort`` / ``timeline`` dicts) from live data.
+
+A rule fires when at least ``min_fraction`` of the agents, teams or
+ecosystem it looks at satisfy its condition:
+
+- ``below`` / ``above``: the current value is under / over ``threshold``
+- ``falling`` / ``rising``: the value moved down / up on each of the last
+  ``threshold`` monitoring ticks
+
+Rules are compiled once: rules sharing a metric and condition become one
+group with a threshold vector. Each tick sorts every metric's values once
+and answers a whole group with one ``searchsorted``, so thousands of rules
+over 10^5 agents cost milliseconds rather than rules x agents comparisons.
+
+    engine = RuleEngine(DEFAULT_RULES)
+    monitor = AgentPerformanceMonitor(stream=stream, rules=engine)
+    engine.tick(stream)    # once per monitoring interval
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from performance_stream import PerformanceStream
+
+CONDITIONS = ("below", "above", "falling", "rising")
+
+RECOMMENDATION_FIELDS = ("area", "recommendation", "expected_impact", "implementation_effort", "timeline")
+
+
+def metric_scope(metric: str) -> str:
+    if metric in PerformanceStream.AGENT_METRICS:
+        return "agent"
+    if metric in PerformanceStream.TEAM_METRICS:
+        return "team"
+    if metric in PerformanceStream.ECOSYSTEM_METRICS:
+        return "ecosystem"
+    raise ValueError(f"unknown metric: {metric!r}")
+
+
+@dataclass(frozen=True)
+class Rule:
+    metric: str
+    condition: str
+    threshold: float
+    area: str
+    recommendation: str
+    expected_impact: str
+    implementation_effort: str = "Medium"
+    timeline: str = "2-4 weeks"
+    min_fraction: float = 0.1
+
+    def __post_init__(self):
+        if self.condition not in CONDITIONS:
+            raise ValueError(f"condition must be one of {', '.join(CONDITIONS)}, not {self.condition!r}")
+        metric_scope(self.metric)
+
+    def to_recommendation(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in RECOMMENDATION_FIELDS}
+
+
+DEFAULT_RULES = (
+    Rule("task_completion_rate", "below", 0.7, "Individual Performance",
+         "Implement personalized learning paths for each agent",
+         "15-20% improvement in task completion speed"),
+    Rule("quality_scores", "below", 0.6, "Quality Assurance",
+         "Pair low-scoring agents with Quality Assurance reviewers",
+         "Fewer defects reaching integration", "Low", "1-2 weeks"),
+    Rule("collaboration_metrics", "falling", 3, "Team Collaboration",
+         "Establish regular cross-functional pairing sessions",
+         "Improved knowledge sharing and team cohesion", "Low", "1 week"),
+    Rule("team_dynamics", "falling", 3, "Team Collaboration",
+         "Rebalance team composition and communication schedule",
+         "Restored team velocity", "Medium", "2-3 weeks", min_fraction=0.25),
+    Rule("knowledge_sharing", "below", 1.0, "Knowledge Sharing",
+         "Rotate agents through cross-team reviews",
+         "Faster spread of solutions between teams", "Low", "1-2 weeks", min_fraction=0.5),
+    Rule("innovation_rate", "below", 0.5, "Innovation Capability",
+         "Create dedicated innovation time (20% time)",
+         "Increased breakthrough solutions and creative approaches", "Medium", "Ongoing", min_fraction=0.5),
+    Rule("adaptation_capability", "falling", 3, "Adaptation",
+         "Refresh the ecosystem's learning curriculum",
+         "Faster response to changing requirements", "Medium", "3-4 weeks", min_fraction=1.0),
+)
+
+
+@dataclass
+class _RuleGroup:
+    scope: str
+    metric: str
+    condition: str
+    thresholds: np.ndarray
+    min_fractions: np.ndarray
+    rules: np.ndarray  # positions in the compiled rule list
+
+
+class RuleEngine:
+    """Compiled rule set evaluated against PerformanceStream snapshots once per monitoring tick."""
+
+    def __init__(self, rules: Iterable[Rule] = DEFAULT_RULES):
+        self.rules: List[Rule] = list(rules)
+        grouped: Dict[Tuple[str, str, str], List[int]] = {}
+        for position, rule in enumerate(self.rules):
+            grouped.setdefault((metric_scope(rule.metric), rule.metric, rule.condition), []).append(position)
+        self._groups = [
+            _RuleGroup(scope, metric, condition,
+                       thresholds=np.array([self.rules[position].threshold for position in positions]),
+                       min_fractions=np.array([self.rules[position].min_fraction for position in positions]),
+                       rules=np.array(positions))
+            for (scope, metric, condition), positions in grouped.items()
+        ]
+        trend_windows = [int(rule.threshold) for rule in self.rules if rule.condition in ("falling", "rising")]
+        self._history_length = max(trend_windows, default=0) + 1
+        self._history: Dict[Tuple[str, str], Deque[np.ndarray]] = {}
+        self.ticks = 0
+        self.fired: List[Rule] = []
+
+    @property
+    def recommendations(self) -> List[Dict[str, Any]]:
+        """Recommendations of the rules that fired on the latest tick."""
+        return [rule.to_recommendation() for rule in self.fired]
+
+    def tick(self, stream: PerformanceStream) -> List[Dict[str, Any]]:
+        """Record one monitoring window from ``stream`` and evaluate every rule against it."""
+        return self.evaluate(stream.snapshot())
+
+    def evaluate(self, snapshot: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Like tick(), for a PerformanceStream.snapshot()-shaped dict of metric values."""
+        current = {
+            (scope, metric): _as_vector(values)
+            for scope, metrics in snapshot.items() for metric, values in metrics.items()
+        }
+        for key, values in current.items():
+            self._history.setdefault(key, deque(maxlen=self._history_length)).append(values)
+        self.ticks += 1
+
+        fired = np.zeros(len(self.rules), dtype=bool)
+        sorted_values: Dict[Tuple[str, str], np.ndarray] = {}
+        sorted_runs: Dict[Tuple[str, str, str], np.ndarray] = {}
+        for group in self._groups:
+            key = (group.scope, group.metric)
+            if key not in current:
+                continue
+            if group.condition in ("below", "above"):
+                if key not in sorted_values:
+                    values = current[key]
+                    sorted_values[key] = np.sort(values[~np.isnan(values)])
+                population = sorted_values[key]
+                if group.condition == "below":
+                    matching = np.searchsorted(population, group.thresholds, side="left")
+                else:
+                    matching = len(population) - np.searchsorted(population, group.thresholds, side="right")
+            else:
+                run_key = (group.scope, group.metric, group.condition)
+                if run_key not in sorted_runs:
+                    sorted_runs[run_key] = np.sort(self._trend_runs(key, group.condition))
+                population = sorted_runs[run_key]
+                matching = len(population) - np.searchsorted(population, group.thresholds, side="left")
+            needed = np.maximum(1, np.ceil(group.min_fractions * len(population)))
+            fired[group.rules] = matching >= needed
+
+        self.fired = [self.rules[position] for position in np.flatnonzero(fired)]
+        return self.recommendations
+
+    def _trend_runs(self, key: Tuple[str, str], condition: str) -> np.ndarray:
+        """Per entity, how many consecutive ticks (ending now) moved in the condition's direction."""
+        history = self._history[key]
+        latest = history[-1]
+        runs = np.zeros(len(latest), dtype=np.int64)
+        moving = np.ones(len(latest), dtype=bool)
+        newer = latest
+        for older in reversed(list(history)[:-1]):
+            older = _padded(older, len(latest))
+            step = newer < older if condition == "falling" else newer > older
+            moving &= step
+            if not moving.any():
+                break
+            runs += moving
+            newer = older
+        return runs[~np.isnan(latest)]
+
+
+def _as_vector(values: Any) -> np.ndarray:
+    if values is None or isinstance(values, (int, float)):
+        return np.array([math.nan if values is None else values], dtype=np.float64)
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if hasattr(values, "typecode"):
+        return np.frombuffer(values, dtype=np.float64)
+    return np.array([math.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def _padded(values: np.ndarray, length: int) -> np.ndarray:
+    """Older snapshots predate agents registered since; those count as no data."""
+    if len(values) >= length:
+        return values[:length]
+    return np.concatenate([values, np.full(length - len(values), math.nan)])
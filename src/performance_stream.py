@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Performance Stream
+
+Live per-agent event ingestion for AgentPerformanceMonitor. Events are
+task completions and failures, quality scores, collaboration, learning and
+innovation events. They are folded into bounded-memory rolling aggregates
+at three levels:
+
+- agent: EWMAs stored column-wise (one array per series), so 10^5 agents
+  cost a few MB
+- team (the agent's role): EWMAs, ring-buffer windows for per-hour rates,
+  and a quality sketch
+- ecosystem: EWMAs and a quality sketch, plus running sums over agents
+  and teams
+
+Every metric named in AgentPerformanceMonitor._design_monitoring_framework
+is read in O(1) via ``metric()``. Quantiles come from LogBucketSketch, a
+mergeable log-bucket sketch with bounded relative error.
+
+    stream = PerformanceStream()
+    monitor = AgentPerformanceMonitor(stream=stream)
+    stream.record("specialist-3", "quality_score", 0.91)
+    stream.metric("quality_scores", agent_id="specialist-3")
+
+Agent ids only need to be unique within one ecosystem, so
+``register_ecosystem`` files each design's agents under a namespace and
+returns it; events for those agents use ``agent_key(namespace, agent_id)``.
+Teams stay keyed by role and are shared across ecosystems.
+"""
+
+import math
+import numbers
+import threading
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from meta_agent_demonstration import EcosystemDesign
+
+EVENT_KINDS = ("task_completed", "task_failed", "quality_score", "collaboration", "learning", "innovation")
+
+UNASSIGNED_TEAM = "Unassigned"
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in EVENT_KINDS:
+        raise ValueError(f"unknown event kind {kind!r}; expected one of {', '.join(EVENT_KINDS)}")
+
+
+def _check_event(event: Tuple[Any, ...]) -> None:
+    if len(event) not in (4, 5):
+        raise ValueError(f"events are (agent_id, kind, value, timestamp[, peer]) tuples, got {len(event)} fields")
+    _check_kind(event[1])
+    for field, number in (("value", event[2]), ("timestamp", event[3])):
+        if not isinstance(number, numbers.Real):
+            raise TypeError(f"event {field} must be a number, got {type(number).__name__}")
+        if not math.isfinite(number):
+            raise ValueError(f"event {field} must be finite, got {number}")
+
+
+class LogBucketSketch:
+    """
+    Mergeable quantile sketch with relative accuracy ``relative_accuracy``.
+
+    Positive values fall into buckets whose bounds grow geometrically by
+    gamma = (1 + a) / (1 - a), so every quantile is within a factor of
+    (1 +/- a) of a true sample. Sketches with the same accuracy merge by
+    adding bucket counts. Past ``max_buckets`` the lowest buckets are
+    collapsed, which only costs accuracy at the low tail.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "LogBucketSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        cumulative = self.zero_count
+        for key in sorted(self.buckets):
+            cumulative += self.buckets[key]
+            if cumulative > rank:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k] in relative terms
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        folded = sum(self.buckets.pop(key) for key in keys[:excess])
+        self.buckets[keys[excess]] += folded
+
+
+class RollingWindow:
+    """Event counts over the last ``window_seconds`` in a ring of ``slots`` buckets."""
+
+    __slots__ = ("slot_seconds", "counts", "total", "_latest_slot")
+
+    def __init__(self, window_seconds: float = 3600.0, slots: int = 60):
+        self.slot_seconds = window_seconds / slots
+        self.counts = [0.0] * slots
+        self.total = 0.0
+        self._latest_slot: Optional[int] = None
+
+    def add(self, timestamp: float, value: float = 1.0) -> None:
+        slot = int(timestamp // self.slot_seconds)
+        self._advance(slot)
+        if slot <= self._latest_slot - len(self.counts):
+            return  # older than the window
+        self.counts[slot % len(self.counts)] += value
+        self.total += value
+
+    def rate_per_hour(self, now: float) -> float:
+        self._advance(int(now // self.slot_seconds))
+        return self.total * 3600.0 / (self.slot_seconds * len(self.counts))
+
+    def _advance(self, slot: int) -> None:
+        if self._latest_slot is None:
+            self._latest_slot = slot
+            return
+        if slot <= self._latest_slot:
+            return
+        # Clear the slots that fell out of the window; at most one full lap
+        for stale in range(self._latest_slot + 1, min(slot, self._latest_slot + len(self.counts)) + 1):
+            position = stale % len(self.counts)
+            self.total -= self.counts[position]
+            self.counts[position] = 0.0
+        self._latest_slot = slot
+
+
+class Ewma:
+    """Exponentially weighted mean (and mean square) of a series."""
+
+    __slots__ = ("alpha", "value", "square")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value: Optional[float] = None
+        self.square = 0.0
+
+    def add(self, sample: float) -> None:
+        if self.value is None:
+            self.value, self.square = sample, sample * sample
+        else:
+            self.value += self.alpha * (sample - self.value)
+            self.square += self.alpha * (sample * sample - self.square)
+
+    @property
+    def deviation(self) -> Optional[float]:
+        if self.value is None:
+            return None
+        return math.sqrt(max(0.0, self.square - self.value * self.value))
+
+
+class _TeamAggregate:
+    __slots__ = ("completions", "cross_team", "innovations", "collaboration", "quality")
+
+    def __init__(self, alpha: float, window_seconds: float, relative_accuracy: float):
+        self.completions = RollingWindow(window_seconds)
+        self.cross_team = RollingWindow(window_seconds)
+        self.innovations = RollingWindow(window_seconds)
+        self.collaboration = Ewma(alpha)
+        self.quality = LogBucketSketch(relative_accuracy)
+
+
+class PerformanceStream:
+    """Bounded-memory rolling aggregates of agent events per agent, team and ecosystem."""
+
+    # Individual monitoring framework metric -> the per-agent series behind it
+    AGENT_METRICS = {
+        "task_completion_rate": "success",
+        "quality_scores": "quality",
+        "collaboration_metrics": "collaboration",
+        "learning_velocity": "learning",
+    }
+    TEAM_METRICS = ("team_velocity", "team_dynamics", "knowledge_sharing", "innovation_rate")
+    ECOSYSTEM_METRICS = ("system_performance", "emergent_properties", "adaptation_capability", "cultural_health")
+
+    def __init__(self, alpha: float = 0.05, window_seconds: float = 3600.0, relative_accuracy: float = 0.01):
+        self.alpha = alpha
+        self.window_seconds = window_seconds
+        self.relative_accuracy = relative_accuracy
+        self.events = 0
+        self._now = 0.0
+        self._lock = threading.Lock()
+
+        self._ecosystems = 0
+        self._agent_index: Dict[str, int] = {}
+        self._agent_team: array = array("l")
+        self._agent_series: Dict[str, array] = {series: array("d") for series in self.AGENT_METRICS.values()}
+        # Sum and count of agents with a value, per series, for O(1) averages over agents
+        self._agent_sums: Dict[str, float] = {series: 0.0 for series in self.AGENT_METRICS.values()}
+        self._agent_counts: Dict[str, int] = {series: 0 for series in self.AGENT_METRICS.values()}
+
+        self._team_index: Dict[str, int] = {}
+        self._teams: List[_TeamAggregate] = []
+        self._team_dynamics_sum = 0.0
+        self._team_dynamics_count = 0
+
+        self._ecosystem = {name: Ewma(alpha) for name in ("success", "quality", "collaboration", "cross_team",
+                                                          "learning", "innovation")}
+        self._ecosystem_quality = LogBucketSketch(relative_accuracy)
+
+    @staticmethod
+    def agent_key(namespace: str, agent_id: str) -> str:
+        """Stream id of ``agent_id`` from the ecosystem registered under ``namespace``."""
+        return f"{namespace}/{agent_id}"
+
+    def register_ecosystem(self, ecosystem_design: EcosystemDesign, namespace: Optional[str] = None) -> str:
+        """
+        Assign each agent of the design to its role's team.
+
+        Agents are registered as ``agent_key(namespace, agent_id)``, so designs
+        reusing ids like "frontend-1" stay apart. Without a ``namespace`` the
+        next "ecosystem-N" is used. Returns the namespace.
+        """
+        with self._lock:
+            if namespace is None:
+                namespace = f"ecosystem-{self._ecosystems}"
+            self._ecosystems += 1
+            for agent in ecosystem_design.agent_specifications:
+                self._register_agent(self.agent_key(namespace, agent.agent_id), agent.role)
+        return namespace
+
+    def register_agent(self, agent_id: str, team: str) -> None:
+        with self._lock:
+            self._register_agent(agent_id, team)
+
+    def record(self, agent_id: str, kind: str, value: float = 1.0, timestamp: Optional[float] = None,
+               peer: Optional[str] = None) -> None:
+        """
+        Fold one event into the aggregates.
+
+        ``value`` is the quality score, collaboration or learning amount, or
+        innovation score; completions and failures ignore it. ``peer`` is the
+        other agent of a collaboration event.
+        """
+        with self._lock:
+            self._record(agent_id, kind, value, time.time() if timestamp is None else timestamp, peer)
+
+    def record_many(self, events: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Ingest ``(agent_id, kind, value, timestamp[, peer])`` tuples under one lock acquisition.
+
+        Every tuple's arity, kind, value and timestamp are checked first, so
+        a batch with one malformed event is rejected without applying any of it.
+        """
+        events = list(events)
+        for event in events:
+            _check_event(event)
+        with self._lock:
+            for event in events:
+                agent_id, kind, value, timestamp = event[:4]
+                self._record(agent_id, kind, value, timestamp, event[4] if len(event) > 4 else None)
+        return len(events)
+
+    def metric(self, name: str, agent_id: Optional[str] = None, team: Optional[str] = None) -> Optional[float]:
+        """Current value of a monitoring framework metric, or None before any relevant event."""
+        with self._lock:
+            return self._metric(name, agent_id, team)
+
+    def _metric(self, name: str, agent_id: Optional[str] = None, team: Optional[str] = None) -> Optional[float]:
+        if name in self.AGENT_METRICS:
+            if agent_id is None:
+                raise ValueError(f"{name} is an individual metric; pass agent_id")
+            index = self._agent_index.get(agent_id)
+            value = self._agent_series[self.AGENT_METRICS[name]][index] if index is not None else math.nan
+            return None if math.isnan(value) else value
+        if name in self.TEAM_METRICS:
+            if team is None:
+                raise ValueError(f"{name} is a team metric; pass team")
+            if team not in self._team_index:
+                return None
+            return self._team_metric(name, self._teams[self._team_index[team]])
+        if name in self.ECOSYSTEM_METRICS:
+            return self._ecosystem_metric(name)
+        raise KeyError(f"unknown metric: {name!r}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Every metric at once, taken under one lock acquisition.
+
+        ``{"agent": {metric: array('d') in agent registration order, NaN where
+        no data}, "team": {metric: [value or None per team]}, "ecosystem":
+        {metric: value or None}}``; ``agent_ids()`` and ``teams()`` give the order.
+        """
+        with self._lock:
+            return {
+                "agent": {name: array("d", self._agent_series[series]) for name, series in self.AGENT_METRICS.items()},
+                "team": {name: [self._team_metric(name, team) for team in self._teams] for name in self.TEAM_METRICS},
+                "ecosystem": {name: self._ecosystem_metric(name) for name in self.ECOSYSTEM_METRICS},
+            }
+
+    def agent_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._agent_index)
+
+    def teams(self) -> List[str]:
+        with self._lock:
+            return list(self._team_index)
+
+    def agent_average(self, name: str) -> Optional[float]:
+        """Mean of an individual metric over all agents that have a value."""
+        with self._lock:
+            return self._agent_average(name)
+
+    def _agent_average(self, name: str) -> Optional[float]:
+        series = self.AGENT_METRICS[name]
+        count = self._agent_counts[series]
+        return self._agent_sums[series] / count if count else None
+
+    def quality_quantile(self, q: float, team: Optional[str] = None) -> Optional[float]:
+        with self._lock:
+            if team is None:
+                return self._ecosystem_quality.quantile(q)
+            if team not in self._team_index:
+                return None
+            return self._teams[self._team_index[team]].quality.quantile(q)
+
+    def baseline_metrics(self, defaults: Dict[str, float]) -> Dict[str, float]:
+        """AgentPerformanceMonitor baseline metrics from live data, keeping ``defaults`` where there is none yet."""
+        with self._lock:
+            quality = self._ecosystem["quality"]
+            live = {
+                "overall_ecosystem_health": self._ecosystem_metric("system_performance"),
+                "individual_performance_avg": self._agent_average("task_completion_rate"),
+                "team_collaboration_score": self._ecosystem["collaboration"].value,
+                "innovation_index": self._ecosystem["innovation"].value,
+                "quality_consistency": 1.0 - min(1.0, 2 * quality.deviation) if quality.value is not None else None,
+                "adaptation_readiness": self._ecosystem_metric("adaptation_capability"),
+                "knowledge_leverage": self._ecosystem_metric("emergent_properties"),
+                "cultural_coherence": self._ecosystem_metric("cultural_health"),
+            }
+        return {name: live[name] if live.get(name) is not None else default for name, default in defaults.items()}
+
+    def _register_agent(self, agent_id: str, team: str) -> int:
+        team_index = self._team_index.get(team)
+        if team_index is None:
+            team_index = self._team_index[team] = len(self._teams)
+            self._teams.append(_TeamAggregate(self.alpha, self.window_seconds, self.relative_accuracy))
+        index = self._agent_index.get(agent_id)
+        if index is None:
+            index = self._agent_index[agent_id] = len(self._agent_team)
+            self._agent_team.append(team_index)
+            for values in self._agent_series.values():
+                values.append(math.nan)
+        else:
+            self._agent_team[index] = team_index
+        return index
+
+    def _record(self, agent_id: str, kind: str, value: float, timestamp: float, peer: Optional[str]) -> None:
+        _check_kind(kind)
+        index = self._agent_index.get(agent_id)
+        if index is None:
+            index = self._register_agent(agent_id, UNASSIGNED_TEAM)
+        team = self._teams[self._agent_team[index]]
+        self._now = max(self._now, timestamp)
+        ecosystem = self._ecosystem
+
+        if kind == "task_completed" or kind == "task_failed":
+            success = 1.0 if kind == "task_completed" else 0.0
+            self._update_agent("success", index, success)
+            ecosystem["success"].add(success)
+            if success:
+                team.completions.add(timestamp)
+        elif kind == "quality_score":
+            self._update_agent("quality", index, value)
+            ecosystem["quality"].add(value)
+            team.quality.add(value)
+            self._ecosystem_quality.add(value)
+        elif kind == "collaboration":
+            self._update_agent("collaboration", index, value)
+            ecosystem["collaboration"].add(value)
+            previous = team.collaboration.value
+            team.collaboration.add(value)
+            self._team_dynamics_sum += team.collaboration.value - (previous or 0.0)
+            self._team_dynamics_count += previous is None
+            peer_index = self._agent_index.get(peer) if peer is not None else None
+            if peer_index is not None:
+                cross_team = self._agent_team[peer_index] != self._agent_team[index]
+                ecosystem["cross_team"].add(1.0 if cross_team else 0.0)
+                if cross_team:
+                    team.cross_team.add(timestamp)
+        elif kind == "learning":
+            self._update_agent("learning", index, value)
+            ecosystem["learning"].add(value)
+        else:
+            ecosystem["innovation"].add(value)
+            team.innovations.add(timestamp)
+        self.events += 1
+
+    def _update_agent(self, series: str, index: int, sample: float) -> None:
+        values = self._agent_series[series]
+        previous = values[index]
+        if math.isnan(previous):
+            values[index] = sample
+            self._agent_counts[series] += 1
+            self._agent_sums[series] += sample
+        else:
+            values[index] = previous + self.alpha * (sample - previous)
+            self._agent_sums[series] += values[index] - previous
+
+    def _team_metric(self, name: str, team: _TeamAggregate) -> Optional[float]:
+        if name == "team_velocity":
+            return team.completions.rate_per_hour(self._now)
+        if name == "team_dynamics":
+            return team.collaboration.value
+        if name == "knowledge_sharing":
+            return team.cross_team.rate_per_hour(self._now)
+        return team.innovations.rate_per_hour(self._now)
+
+    def _ecosystem_metric(self, name: str) -> Optional[float]:
+        ecosystem = self._ecosystem
+        if name == "system_performance":
+            success, quality = ecosystem["success"].value, ecosystem["quality"].value
+            if success is None or quality is None:
+                return success if quality is None else quality
+            return success * quality
+        if name == "emergent_properties":
+            return ecosystem["cross_team"].value
+        if name == "adaptation_capability":
+            return ecosystem["learning"].value
+        return self._team_dynamics_sum / self._team_dynamics_count if self._team_dynamics_count else None
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Result Store
+
+Persists handle_task results in a local SQLite database instead of one flat
+results file, so questions like "all MEGA tasks with more than 50 agents" or
+"Security agents with quality_obsession >= 0.9" are answered from indexes
+without parsing everything first.
+
+Schema (one row per task in the first three tables):
+
+- tasks: description, cache key and the full result as zlib-compressed JSON
+- analyses: scope category, scope score, confidence, recommended agent count
+- ecosystems: total agents, team structure, technology stack name
+- agents: one row per agent with its role and the four genetic traits
+
+Writes are buffered and inserted in batches inside one transaction each;
+a batch whose insert fails stays queued and is retried by the next flush.
+Task ids are reserved ``batch_size`` at a time from the task_ids table in
+a write transaction, so several writers can share one database (ids are
+unique but may have gaps). A record is checked when it is added, so a malformed one is rejected on its
+own; the CLI's per-task error records are skipped by add_many and
+ingest_jsonl. The database runs in WAL mode, so readers (ResultStore(path, readonly=True),
+in other threads or processes) are never blocked by the writer.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from meta_agent_demonstration import (
+    PipelineResult, TaskScope, encode_result_json, iter_jsonl_results, task_cache_key
+)
+
+TRAIT_COLUMNS = ("risk_tolerance", "innovation_factor", "quality_obsession", "collaboration_style")
+
+# One result's rows: (tasks row, analyses row, ecosystems row, agents rows)
+_Rows = Tuple[Tuple[Any, ...], Tuple[Any, ...], Tuple[Any, ...], List[Tuple[Any, ...]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY,
+    task_key TEXT NOT NULL,
+    task_description TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    result BLOB
+);
+CREATE TABLE IF NOT EXISTS analyses (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks(task_id),
+    scope_category TEXT NOT NULL,
+    scope_score REAL NOT NULL,
+    confidence_level REAL NOT NULL,
+    recommended_agent_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ecosystems (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks(task_id),
+    total_agents INTEGER NOT NULL,
+    team_structure TEXT NOT NULL,
+    stack_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS agents (
+    task_id INTEGER NOT NULL REFERENCES tasks(task_id),
+    agent_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    risk_tolerance REAL NOT NULL,
+    innovation_factor REAL NOT NULL,
+    quality_obsession REAL NOT NULL,
+    collaboration_style REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_key ON tasks(task_key);
+CREATE INDEX IF NOT EXISTS analyses_by_scope ON analyses(scope_category);
+CREATE INDEX IF NOT EXISTS analyses_by_score ON analyses(scope_score);
+CREATE INDEX IF NOT EXISTS ecosystems_by_agents ON ecosystems(total_agents);
+CREATE INDEX IF NOT EXISTS agents_by_task ON agents(task_id);
+CREATE INDEX IF NOT EXISTS agents_by_role ON agents(role, quality_obsession);
+CREATE INDEX IF NOT EXISTS agents_by_risk ON agents(risk_tolerance);
+CREATE INDEX IF NOT EXISTS agents_by_innovation ON agents(innovation_factor);
+CREATE INDEX IF NOT EXISTS agents_by_quality ON agents(quality_obsession);
+CREATE INDEX IF NOT EXISTS agents_by_collaboration ON agents(collaboration_style);
+CREATE TABLE IF NOT EXISTS task_ids (
+    next_id INTEGER NOT NULL
+);
+INSERT INTO task_ids SELECT COALESCE(MAX(task_id), 0) + 1 FROM tasks WHERE NOT EXISTS (SELECT 1 FROM task_ids);
+"""
+
+
+@dataclass
+class StoredTask:
+    task_id: int
+    task_description: str
+    scope_category: TaskScope
+    scope_score: float
+    confidence_level: float
+    total_agents: int
+    team_structure: str
+    stack_name: str
+
+
+@dataclass
+class StoredAgent:
+    task_id: int
+    agent_id: str
+    role: str
+    genetic_traits: Dict[str, float]
+
+
+class ResultStore:
+    """SQLite-backed store of handle_task results with batched inserts and indexed queries."""
+
+    def __init__(self, path: str, batch_size: int = 1000, keep_results: bool = True, readonly: bool = False):
+        self.path = path
+        self.batch_size = batch_size
+        self.keep_results = keep_results
+        self.readonly = readonly
+        if readonly:
+            self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._pending: List[_Rows] = []
+        self.skipped = 0
+        # Ids [_next_task_id, _reserved_end) are reserved for this writer
+        self._next_task_id = self._reserved_end = 0
+
+    def add(self, result: Dict[str, Any]) -> int:
+        """
+        Queue one result for insertion and return its task id; inserted once the batch fills.
+
+        Raises ValueError, queuing nothing, when ``result`` is not a handle_task result.
+        If inserting the full batch fails, the error propagates and the batch,
+        this result included, stays queued.
+        """
+        with self._lock:
+            if self._next_task_id >= self._reserved_end:
+                self._reserve_ids_locked()
+            task_id = self._next_task_id
+            self._pending.append(self._result_rows(task_id, result))
+            self._next_task_id += 1
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+            return task_id
+
+    def add_many(self, results: Iterable[Dict[str, Any]]) -> int:
+        """Add every result, skipping per-task error records (counted in ``skipped``); returns the number added."""
+        count = 0
+        for result in results:
+            if is_error_record(result):
+                self.skipped += 1
+                continue
+            self.add(result)
+            count += 1
+        self.flush()
+        return count
+
+    def ingest_jsonl(self, path: str) -> int:
+        """Import a file written by JsonlResultWriter or the CLI; error records are skipped."""
+        return self.add_many(iter_jsonl_results(path))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        if not self.readonly:
+            self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def count_tasks(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def get_task(self, task_id: int) -> Optional[StoredTask]:
+        rows = self._select_tasks("t.task_id = ?", [task_id], limit=1)
+        return rows[0] if rows else None
+
+    def find_tasks(self, scope: Optional[TaskScope] = None, min_agents: Optional[int] = None,
+                   max_agents: Optional[int] = None, min_score: Optional[float] = None,
+                   max_score: Optional[float] = None, task_description: Optional[str] = None,
+                   limit: Optional[int] = 100) -> List[StoredTask]:
+        conditions, parameters = [], []
+        for clause, value in (("a.scope_category = ?", scope.value if scope is not None else None),
+                              ("e.total_agents >= ?", min_agents), ("e.total_agents <= ?", max_agents),
+                              ("a.scope_score >= ?", min_score), ("a.scope_score <= ?", max_score),
+                              ("t.task_key = ?", task_cache_key(task_description) if task_description else None)):
+            if value is not None:
+                conditions.append(clause)
+                parameters.append(value)
+        return self._select_tasks(" AND ".join(conditions) or "1", parameters, limit)
+
+    def find_agents(self, role: Optional[str] = None, task_id: Optional[int] = None, limit: Optional[int] = 100,
+                    **bounds: Tuple[Optional[float], Optional[float]]) -> List[StoredAgent]:
+        """
+        Agents matching a role, a task and inclusive ``(low, high)`` trait bounds.
+
+        ``store.find_agents(role="Security Specialist", quality_obsession=(0.9, None))``
+        """
+        unknown = set(bounds) - set(TRAIT_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown traits: {', '.join(sorted(unknown))}")
+        conditions, parameters = [], []
+        if role is not None:
+            conditions.append("role = ?")
+            parameters.append(role)
+        if task_id is not None:
+            conditions.append("task_id = ?")
+            parameters.append(task_id)
+        for trait, (low, high) in bounds.items():
+            if low is not None:
+                conditions.append(f"{trait} >= ?")
+                parameters.append(low)
+            if high is not None:
+                conditions.append(f"{trait} <= ?")
+                parameters.append(high)
+        query = (f"SELECT task_id, agent_id, role, {', '.join(TRAIT_COLUMNS)} FROM agents "
+                 f"WHERE {' AND '.join(conditions) or '1'}")
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [
+            StoredAgent(task_id=row[0], agent_id=row[1], role=row[2], genetic_traits=dict(zip(TRAIT_COLUMNS, row[3:])))
+            for row in self._connection.execute(query, parameters)
+        ]
+
+    def load_result(self, task_id: int) -> Optional[PipelineResult]:
+        """The full stored result as dataclasses (requires keep_results=True when it was added)."""
+        row = self._connection.execute("SELECT result FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return PipelineResult.from_dict(json.loads(zlib.decompress(row[0])))
+
+    def _select_tasks(self, where: str, parameters: List[Any], limit: Optional[int]) -> List[StoredTask]:
+        query = ("SELECT t.task_id, t.task_description, a.scope_category, a.scope_score, a.confidence_level, "
+                 "e.total_agents, e.team_structure, e.stack_name "
+                 "FROM tasks t JOIN analyses a USING (task_id) JOIN ecosystems e USING (task_id) "
+                 f"WHERE {where} ORDER BY a.task_id")
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [
+            StoredTask(task_id=row[0], task_description=row[1], scope_category=TaskScope(row[2]), scope_score=row[3],
+                       confidence_level=row[4], total_agents=row[5], team_structure=row[6], stack_name=row[7])
+            for row in self._connection.execute(query, parameters)
+        ]
+
+    def _result_rows(self, task_id: int, result: Dict[str, Any]) -> _Rows:
+        try:
+            analysis, ecosystem = result["task_analysis"], result["ecosystem_design"]
+            scope = analysis["scope_category"]
+            task = (task_id, task_cache_key(result["task_description"]), result["task_description"], time.time(), None)
+            rows = (
+                task,
+                (task_id, scope.value if isinstance(scope, TaskScope) else TaskScope(scope).value, analysis["scope_score"],
+                 analysis["confidence_level"], analysis["ecosystem_recommendations"]["recommended_agent_count"]),
+                (task_id, ecosystem["total_agents"], ecosystem["team_structure"], result["technology_stack"]["stack_name"]),
+                [(task_id, agent["agent_id"], agent["role"], *(agent["genetic_traits"][trait] for trait in TRAIT_COLUMNS))
+                 for agent in ecosystem["agent_specifications"]]
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            if is_error_record(result):
+                raise ValueError(f"error record for task {result.get('index')}: {result['error']}") from None
+            raise ValueError(f"not a handle_task result ({type(exc).__name__}: {exc})") from None
+        if self.keep_results:
+            payload = zlib.compress(encode_result_json(result).encode("utf-8"), 1)
+            rows = (task[:-1] + (payload,),) + rows[1:]
+        return rows
+
+    def _reserve_ids_locked(self) -> None:
+        connection = self._connection
+        # IMMEDIATE takes the write lock up front, so no other writer reads the same next_id
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Also past MAX(task_id), in case rows were inserted without a reservation
+            next_id = connection.execute("SELECT MAX((SELECT next_id FROM task_ids), "
+                                         "(SELECT COALESCE(MAX(task_id), 0) + 1 FROM tasks))").fetchone()[0]
+            connection.execute("UPDATE task_ids SET next_id = ?", (next_id + self.batch_size,))
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        self._next_task_id, self._reserved_end = next_id, next_id + self.batch_size
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        pending = self._pending
+        # A failed insert rolls the whole batch back; it stays pending for the next flush
+        with self._connection:
+            self._connection.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?, ?)", [rows[0] for rows in pending])
+            self._connection.executemany("INSERT INTO analyses VALUES (?, ?, ?, ?, ?)", [rows[1] for rows in pending])
+            self._connection.executemany("INSERT INTO ecosystems VALUES (?, ?, ?, ?)", [rows[2] for rows in pending])
+            self._connection.executemany("INSERT INTO agents VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                         [agent for rows in pending for agent in rows[3]])
+        self._pending = []
+
+
+def is_error_record(record: Any) -> bool:
+    """A CLI error record ({"index", "task_description", "error"}) rather than a result."""
+    return isinstance(record, dict) and "error" in record and "task_analysis" not in record
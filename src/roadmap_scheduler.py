@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Roadmap Scheduler
+
+Critical-path scheduling for the ``setup_phases`` that
+TechnologyStackSpecialist._create_implementation_roadmap emits. Durations
+such as "2-4 weeks" are parsed into day ranges, phase dependencies form a
+DAG, and one topological pass (Kahn's algorithm) gives every phase's
+earliest start, a reverse pass its longest remaining path ("tail"), and
+from those its slack and the program's critical path, all in O(V+E).
+
+Roadmaps from many ecosystems are merged under a namespace each, so their
+identically named phases stay distinct:
+
+    scheduler = RoadmapScheduler()
+    for index, stack in enumerate(stacks):
+        scheduler.add_roadmap(stack.implementation_roadmap, namespace=f"ecosystem-{index}")
+    scheduler.critical_path()
+
+Changing one phase's duration afterwards re-propagates only the phases
+whose earliest start or tail actually changes; structural edits (new phases
+or dependencies) trigger a full O(V+E) pass on the next query.
+"""
+
+import functools
+import heapq
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DAYS_PER_UNIT = {"hour": 1 / 8, "day": 1, "week": 7, "month": 30, "quarter": 91, "year": 365}
+
+_DURATION_PATTERN = re.compile(
+    r"^\s*(\d+(?:\.\d+)?)\s*(?:(?:-|–|to)\s*(\d+(?:\.\d+)?))?\s*(hour|day|week|month|quarter|year)s?\s*$", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_duration(duration: str) -> Tuple[float, float]:
+    """``"2-4 weeks"`` -> ``(14.0, 28.0)`` days; a single value gives equal bounds."""
+    match = _DURATION_PATTERN.match(duration)
+    if match is None:
+        raise ValueError(f"unrecognized duration: {duration!r}")
+    low, high, unit = match.groups()
+    days = DAYS_PER_UNIT[unit.lower()]
+    low = float(low) * days
+    high = float(high) * days if high is not None else low
+    if high < low:
+        raise ValueError(f"duration range is reversed: {duration!r}")
+    return low, high
+
+
+class CyclicDependencyError(ValueError):
+    """The phase dependencies contain a cycle; ``cycle`` lists one of them."""
+
+    def __init__(self, cycle: List[str]):
+        super().__init__(f"dependency cycle: {' -> '.join(cycle + cycle[:1])}")
+        self.cycle = cycle
+
+
+@dataclass
+class PhaseSchedule:
+    phase: str
+    duration_days: float
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+    slack: float
+
+    @property
+    def critical(self) -> bool:
+        # Slack is a difference of float sums, so a critical phase can be off by rounding
+        return abs(self.slack) <= 1e-9 * max(1.0, self.latest_finish)
+
+
+class RoadmapScheduler:
+    """Dependency DAG of roadmap phases with incremental critical-path scheduling."""
+
+    ESTIMATES = {"low": lambda low, high: low, "mid": lambda low, high: (low + high) / 2, "high": lambda low, high: high}
+
+    def __init__(self, estimate: str = "mid"):
+        if estimate not in self.ESTIMATES:
+            raise ValueError(f"estimate must be one of {', '.join(self.ESTIMATES)}")
+        self.estimate = estimate
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._ranges: List[Tuple[float, float]] = []
+        self._durations: List[float] = []
+        self._dependency_names: List[List[str]] = []
+        self._predecessors: List[List[int]] = []
+        self._successors: List[List[int]] = []
+        self._roots: List[int] = []
+        self._position: List[int] = []
+        self._earliest_start: List[float] = []
+        self._tail: List[float] = []
+        self._makespan = 0.0
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, phase: str) -> bool:
+        return phase in self._index
+
+    def add_phase(self, phase: str, duration: Any, dependencies: Iterable[str] = ()) -> None:
+        """
+        Add a phase; ``duration`` is a string like "1-2 weeks", a ``(low, high)``
+        day range or a number of days. Dependencies may name phases added later.
+        """
+        if phase in self._index:
+            raise ValueError(f"duplicate phase: {phase!r}")
+        self._index[phase] = len(self._names)
+        self._names.append(phase)
+        self._ranges.append(_day_range(duration))
+        self._durations.append(self.ESTIMATES[self.estimate](*self._ranges[-1]))
+        self._dependency_names.append(list(dependencies))
+        self._dirty = True
+
+    def add_dependency(self, phase: str, dependency: str) -> None:
+        self._dependency_names[self._require(phase)].append(dependency)
+        self._dirty = True
+
+    def add_roadmap(self, roadmap: Dict[str, List[Dict[str, Any]]], namespace: Optional[str] = None,
+                    after: Iterable[str] = ()) -> List[str]:
+        """
+        Merge an implementation roadmap's ``setup_phases``.
+
+        Phase names and their dependencies are prefixed with ``namespace/``;
+        phases without dependencies additionally wait for every phase in
+        ``after`` (already-namespaced names). Returns the added phase names.
+        """
+        prefix = f"{namespace}/" if namespace else ""
+        after = list(after)
+        added = []
+        for phase in roadmap["setup_phases"]:
+            dependencies = [prefix + dependency for dependency in phase["dependencies"]] or after
+            self.add_phase(prefix + phase["phase"], phase["duration"], dependencies)
+            added.append(prefix + phase["phase"])
+        return added
+
+    def update_duration(self, phase: str, duration: Any) -> None:
+        """Change one phase's duration, re-propagating only the affected phases."""
+        index = self._require(phase)
+        self._ranges[index] = _day_range(duration)
+        self._durations[index] = self.ESTIMATES[self.estimate](*self._ranges[index])
+        if self._dirty:
+            return
+        self._propagate_earliest_starts(index)
+        self._propagate_tails(index)
+        self._makespan = max(self._tail[root] for root in self._roots)
+
+    @property
+    def makespan(self) -> float:
+        """Length of the whole program in days."""
+        self._ensure_scheduled()
+        return self._makespan
+
+    def phase_schedule(self, phase: str) -> PhaseSchedule:
+        self._ensure_scheduled()
+        return self._phase_schedule(self._require(phase))
+
+    def schedule(self) -> List[PhaseSchedule]:
+        """Every phase in topological order."""
+        self._ensure_scheduled()
+        order = sorted(range(len(self._names)), key=self._position.__getitem__)
+        return [self._phase_schedule(index) for index in order]
+
+    def critical_path(self) -> List[str]:
+        """One longest chain of zero-slack phases from a start to the end of the program."""
+        self._ensure_scheduled()
+        if not self._names:
+            return []
+        earliest_start, durations = self._earliest_start, self._durations
+        current = max(range(len(self._names)), key=lambda index: earliest_start[index] + durations[index])
+        path = [current]
+        while self._predecessors[current]:
+            current = next(predecessor for predecessor in self._predecessors[current]
+                           if earliest_start[predecessor] + durations[predecessor] == earliest_start[current])
+            path.append(current)
+        return [self._names[index] for index in reversed(path)]
+
+    def _phase_schedule(self, index: int) -> PhaseSchedule:
+        earliest_start, duration = self._earliest_start[index], self._durations[index]
+        latest_start = self._makespan - self._tail[index]
+        return PhaseSchedule(
+            phase=self._names[index],
+            duration_days=duration,
+            earliest_start=earliest_start,
+            earliest_finish=earliest_start + duration,
+            latest_start=latest_start,
+            latest_finish=latest_start + duration,
+            slack=latest_start - earliest_start
+        )
+
+    def _require(self, phase: str) -> int:
+        try:
+            return self._index[phase]
+        except KeyError:
+            raise KeyError(f"unknown phase: {phase!r}") from None
+
+    def _ensure_scheduled(self) -> None:
+        if self._dirty:
+            self._build_graph()
+            self._schedule()
+            self._dirty = False
+
+    def _build_graph(self) -> None:
+        count = len(self._names)
+        lookup = self._index.get
+        predecessors = [[lookup(dependency) for dependency in dependencies] for dependencies in self._dependency_names]
+        successors: List[List[int]] = [[] for _ in range(count)]
+        for index, incoming in enumerate(predecessors):
+            for position, predecessor in enumerate(incoming):
+                if predecessor is None:
+                    dependency = self._dependency_names[index][position]
+                    raise ValueError(f"phase {self._names[index]!r} depends on unknown phase {dependency!r}")
+                successors[predecessor].append(index)
+        self._predecessors, self._successors = predecessors, successors
+        self._roots = [index for index in range(count) if not predecessors[index]]
+
+    def _schedule(self) -> None:
+        count = len(self._names)
+        durations, predecessors, successors = self._durations, self._predecessors, self._successors
+
+        # Forward pass in Kahn order: earliest start = latest finish among predecessors
+        indegree = [len(incoming) for incoming in predecessors]
+        ready = deque(index for index in range(count) if not indegree[index])
+        order: List[int] = []
+        earliest_start = [0.0] * count
+        while ready:
+            index = ready.popleft()
+            order.append(index)
+            finish = earliest_start[index] + durations[index]
+            for successor in successors[index]:
+                if finish > earliest_start[successor]:
+                    earliest_start[successor] = finish
+                indegree[successor] -= 1
+                if not indegree[successor]:
+                    ready.append(successor)
+        if len(order) < count:
+            raise CyclicDependencyError(self._find_cycle(indegree))
+
+        # Backward pass: tail = own duration + longest tail among successors
+        tail = [0.0] * count
+        for index in reversed(order):
+            longest = 0.0
+            for successor in successors[index]:
+                if tail[successor] > longest:
+                    longest = tail[successor]
+            tail[index] = durations[index] + longest
+
+        position = [0] * count
+        for rank, index in enumerate(order):
+            position[index] = rank
+        self._position, self._earliest_start, self._tail = position, earliest_start, tail
+        self._makespan = max((tail[root] for root in self._roots), default=0.0)
+
+    def _find_cycle(self, indegree: List[int]) -> List[str]:
+        """Phases Kahn's algorithm could not order all lie on or behind a cycle; walk back until one repeats."""
+        current = next(index for index, remaining in enumerate(indegree) if remaining)
+        seen: Dict[int, int] = {}
+        walk: List[int] = []
+        while current not in seen:
+            seen[current] = len(walk)
+            walk.append(current)
+            current = next(predecessor for predecessor in self._predecessors[current] if indegree[predecessor])
+        return [self._names[index] for index in reversed(walk[seen[current]:])]
+
+    def _propagate_earliest_starts(self, changed: int) -> None:
+        durations, predecessors, successors = self._durations, self._predecessors, self._successors
+        earliest_start, position = self._earliest_start, self._position
+        heap = [(position[successor], successor) for successor in successors[changed]]
+        heapq.heapify(heap)
+        queued = {successor for _, successor in heap}
+        while heap:
+            _, index = heapq.heappop(heap)
+            queued.discard(index)
+            start = max(earliest_start[predecessor] + durations[predecessor] for predecessor in predecessors[index])
+            if start == earliest_start[index]:
+                continue
+            earliest_start[index] = start
+            for successor in successors[index]:
+                if successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(heap, (position[successor], successor))
+
+    def _propagate_tails(self, changed: int) -> None:
+        durations, predecessors, successors = self._durations, self._predecessors, self._successors
+        tail, position = self._tail, self._position
+        heap = [(-position[changed], changed)]
+        queued = {changed}
+        while heap:
+            _, index = heapq.heappop(heap)
+            queued.discard(index)
+            length = durations[index] + max((tail[successor] for successor in successors[index]), default=0.0)
+            if length == tail[index] and index != changed:
+                continue
+            tail[index] = length
+            for predecessor in predecessors[index]:
+                if predecessor not in queued:
+                    queued.add(predecessor)
+                    heapq.heappush(heap, (-position[predecessor], predecessor))
+
+
+def _day_range(duration: Any) -> Tuple[float, float]:
+    if isinstance(duration, str):
+        return parse_duration(duration)
+    if isinstance(duration, (int, float)):
+        return float(duration), float(duration)
+    low, high = duration
+    return float(low), float(high)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Agent Genesis Trait Index
+
+Answers range and nearest-neighbor queries over the four genetic traits and
+the role of agents from many ecosystems, e.g. quality_obsession >= 0.9 and
+risk_tolerance <= 0.3 in "Security Specialist" roles, without a linear scan
+over AgentSpecification.genetic_traits dicts.
+
+The index is log-structured. New ecosystems are appended to a small delta
+segment that queries scan with vectorized NumPy; once the delta outgrows
+``merge_threshold`` (or an eighth of the main segment) it is merged into the
+main segment, which keeps:
+
+- per trait, every agent sorted by that trait, so a range query binary-searches
+  each bound and only filters the candidates of the most selective one
+- per role, a posting list of agent positions
+- a k-d tree with leaf buckets for nearest-neighbor search
+
+Queries therefore cost O(log n + k) for k candidates instead of O(n).
+"""
+
+import heapq
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from agent_population import AgentPopulation, TRAIT_NAMES
+from meta_agent_demonstration import EcosystemDesign
+
+# (low, high) bounds on one trait; None leaves that side open
+TraitBounds = Tuple[Optional[float], Optional[float]]
+
+
+@dataclass
+class IndexedAgent:
+    ecosystem_id: int
+    agent_id: str
+    role: str
+    genetic_traits: Dict[str, float]
+    distance: Optional[float] = None
+
+
+class _KDTree:
+    """Static k-d tree over a (4, n) trait matrix, splitting the widest trait at the median."""
+
+    LEAF_SIZE = 32
+
+    def __init__(self, traits: np.ndarray):
+        self.points = traits
+        self.order = np.arange(traits.shape[1], dtype=np.int64)
+        # Node arrays; a split dimension of -1 marks a leaf covering order[start:end]
+        self.split_dim: List[int] = []
+        self.split_value: List[float] = []
+        self.children: List[Tuple[int, int]] = []
+        self.bounds: List[Tuple[int, int]] = []
+        if traits.shape[1]:
+            self._build(0, traits.shape[1])
+
+    def _build(self, start: int, end: int) -> int:
+        node = len(self.bounds)
+        self.bounds.append((start, end))
+        self.split_dim.append(-1)
+        self.split_value.append(0.0)
+        self.children.append((-1, -1))
+        if end - start <= self.LEAF_SIZE:
+            return node
+        segment = self.order[start:end]
+        values = self.points[:, segment]
+        dim = int(np.argmax(values.max(axis=1) - values.min(axis=1)))
+        middle = (end - start) // 2
+        self.order[start:end] = segment[np.argpartition(values[dim], middle)]
+        self.split_dim[node] = dim
+        self.split_value[node] = float(self.points[dim, self.order[start + middle]])
+        left = self._build(start, start + middle)
+        right = self._build(start + middle, end)
+        self.children[node] = (left, right)
+        return node
+
+    def nearest(self, query: np.ndarray, k: int, allowed: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Squared distances and positions of the ``k`` nearest points, optionally restricted by a mask."""
+        best_distances = np.empty(0, dtype=np.float64)
+        best_positions = np.empty(0, dtype=np.int64)
+        if not self.bounds:
+            return best_distances, best_positions
+        # Best-first search; a node's key is a lower bound on the distance to any point below it
+        frontier = [(0.0, 0)]
+        while frontier:
+            bound, node = heapq.heappop(frontier)
+            if len(best_distances) == k and bound > best_distances[-1]:
+                break
+            dim = self.split_dim[node]
+            if dim >= 0:
+                offset = query[dim] - self.split_value[node]
+                left, right = self.children[node]
+                near, far = (left, right) if offset < 0 else (right, left)
+                heapq.heappush(frontier, (bound, near))
+                heapq.heappush(frontier, (max(bound, offset * offset), far))
+                continue
+            start, end = self.bounds[node]
+            positions = self.order[start:end]
+            if allowed is not None:
+                positions = positions[allowed[positions]]
+            distances = ((self.points[:, positions] - query[:, None]) ** 2).sum(axis=0, dtype=np.float64)
+            best_distances, best_positions = _smallest(np.concatenate([best_distances, distances]),
+                                                       np.concatenate([best_positions, positions]), k)
+        return best_distances, best_positions
+
+
+def _smallest(distances: np.ndarray, positions: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    if len(distances) > k:
+        keep = np.argpartition(distances, k - 1)[:k]
+        distances, positions = distances[keep], positions[keep]
+    order = np.argsort(distances, kind="stable")
+    return distances[order], positions[order]
+
+
+class _MainSegment:
+    """Immutable, fully indexed segment: sorted trait columns, role postings and a k-d tree."""
+
+    def __init__(self, population: AgentPopulation, ecosystem_ids: np.ndarray):
+        self.population = population
+        self.ecosystem_ids = ecosystem_ids
+        traits = population.traits
+        self.sorted_order = np.argsort(traits, axis=1, kind="stable").astype(np.int64)
+        self.sorted_values = np.take_along_axis(traits, self.sorted_order, axis=1)
+        self.role_order = np.argsort(population.role_codes, kind="stable")
+        self.role_starts = np.concatenate([[0], np.cumsum(np.bincount(population.role_codes,
+                                                                      minlength=len(population.roles)))])
+        self.tree = _KDTree(traits)
+
+    def candidates(self, bounds: Dict[int, TraitBounds], role_codes: Optional[List[int]]) -> np.ndarray:
+        """Positions satisfying the most selective single constraint (a superset of the answer)."""
+        best: Optional[np.ndarray] = None
+        for dim, (low, high) in bounds.items():
+            values = self.sorted_values[dim]
+            start = 0 if low is None else int(np.searchsorted(values, low, side="left"))
+            end = len(values) if high is None else int(np.searchsorted(values, high, side="right"))
+            if best is None or end - start < len(best):
+                best = self.sorted_order[dim, start:max(start, end)]
+        if role_codes is not None:
+            size = sum(int(self.role_starts[code + 1] - self.role_starts[code]) for code in role_codes)
+            if best is None or size < len(best):
+                best = np.concatenate([self.role_order[self.role_starts[code]:self.role_starts[code + 1]]
+                                       for code in role_codes] or [np.empty(0, dtype=np.int64)])
+        return np.arange(len(self.population)) if best is None else best
+
+
+class TraitIndex:
+    """Incremental multi-dimensional index over agent traits and roles across ecosystems."""
+
+    def __init__(self, merge_threshold: int = 4096):
+        self.merge_threshold = merge_threshold
+        self._main = _MainSegment(AgentPopulation(), np.empty(0, dtype=np.int64))
+        self._delta = AgentPopulation()
+        self._delta_ecosystem_ids: List[int] = []
+        self._next_ecosystem_id = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._main.population) + len(self._delta)
+
+    def add_ecosystem(self, ecosystem_design: EcosystemDesign) -> int:
+        """
+        Index every agent of ``ecosystem_design`` and return its ecosystem id.
+
+        Can be registered directly as an AgentEcosystemDesigner observer.
+        """
+        return self.add_population(AgentPopulation.from_ecosystem(ecosystem_design))
+
+    def add_population(self, population: AgentPopulation) -> int:
+        with self._lock:
+            ecosystem_id = self._next_ecosystem_id
+            self._next_ecosystem_id += 1
+            self._delta.extend(population)
+            self._delta_ecosystem_ids.extend([ecosystem_id] * len(population))
+            if len(self._delta) >= max(self.merge_threshold, len(self._main.population) // 8):
+                self.merge()
+            return ecosystem_id
+
+    def merge(self) -> None:
+        """Fold the delta segment into the main segment and rebuild its indexes."""
+        with self._lock:
+            if not len(self._delta):
+                return
+            population = AgentPopulation.concat([self._main.population, self._delta])
+            ecosystem_ids = np.concatenate([self._main.ecosystem_ids, np.asarray(self._delta_ecosystem_ids, dtype=np.int64)])
+            self._main = _MainSegment(population, ecosystem_ids)
+            self._delta = AgentPopulation()
+            self._delta_ecosystem_ids = []
+
+    def range_query(self, roles: Union[str, Iterable[str], None] = None, limit: Optional[int] = None,
+                    **bounds: TraitBounds) -> List[IndexedAgent]:
+        """
+        Agents whose traits fall inside every given ``(low, high)`` bound (inclusive).
+
+        ``index.range_query(roles="Security Specialist", quality_obsession=(0.9, None),
+        risk_tolerance=(None, 0.3))``
+        """
+        with self._lock:
+            matches = self._range_positions(roles, bounds)
+            if limit is not None:
+                matches = matches[:limit]
+            return [self._materialize(segment, position) for segment, position in matches]
+
+    def count(self, roles: Union[str, Iterable[str], None] = None, **bounds: TraitBounds) -> int:
+        with self._lock:
+            return len(self._range_positions(roles, bounds))
+
+    def nearest(self, genetic_traits: Union[Dict[str, float], Sequence[float]], k: int = 5,
+                roles: Union[str, Iterable[str], None] = None) -> List[IndexedAgent]:
+        """The ``k`` agents closest to ``genetic_traits`` (Euclidean over the four traits); none for ``k <= 0``."""
+        if k <= 0:
+            return []
+        if isinstance(genetic_traits, dict):
+            genetic_traits = [genetic_traits[name] for name in TRAIT_NAMES]
+        query = np.asarray(genetic_traits, dtype=np.float64)
+        with self._lock:
+            main, delta = self._main, self._delta
+            main_codes, delta_codes = self._role_codes(main.population, roles), self._role_codes(delta, roles)
+            allowed = None if main_codes is None else np.isin(main.population.role_codes, main_codes)
+            distances, positions = main.tree.nearest(query, k, allowed)
+
+            delta_positions = np.arange(len(delta))
+            if delta_codes is not None:
+                delta_positions = delta_positions[np.isin(delta.role_codes, delta_codes)]
+            delta_distances = ((delta.traits[:, delta_positions] - query[:, None]) ** 2).sum(axis=0, dtype=np.float64)
+            # Delta positions are offset past the main segment to tell the two apart
+            distances, positions = _smallest(np.concatenate([distances, delta_distances]),
+                                             np.concatenate([positions, delta_positions + len(main.population)]), k)
+            results = []
+            for distance, position in zip(distances, positions):
+                in_main = position < len(main.population)
+                agent = self._materialize(main if in_main else delta, int(position if in_main else position - len(main.population)))
+                agent.distance = float(np.sqrt(distance))
+                results.append(agent)
+            return results
+
+    def _range_positions(self, roles, bounds: Dict[str, TraitBounds]) -> List[Tuple[object, int]]:
+        unknown = set(bounds) - set(TRAIT_NAMES)
+        if unknown:
+            raise ValueError(f"unknown traits: {', '.join(sorted(unknown))}")
+        # Traits are stored as float32; compare in float32 so a bound equal to a stored value matches it
+        dims = {TRAIT_NAMES.index(name): tuple(None if value is None else np.float32(value) for value in bound)
+                for name, bound in bounds.items()}
+        matches: List[Tuple[object, int]] = []
+        main, delta = self._main, self._delta
+        main_codes = self._role_codes(main.population, roles)
+        main_candidates = main.candidates(dims, main_codes)
+        for segment, population, candidates, codes in (
+            (main, main.population, main_candidates, main_codes),
+            (delta, delta, np.arange(len(delta)), self._role_codes(delta, roles)),
+        ):
+            keep = self._matching(population, candidates, dims, codes)
+            matches.extend((segment, int(position)) for position in keep)
+        return matches
+
+    @staticmethod
+    def _matching(population: AgentPopulation, candidates: np.ndarray, dims: Dict[int, TraitBounds],
+                  role_codes: Optional[List[int]]) -> np.ndarray:
+        mask = np.ones(len(candidates), dtype=bool)
+        for dim, (low, high) in dims.items():
+            values = population.traits[dim, candidates]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        if role_codes is not None:
+            mask &= np.isin(population.role_codes[candidates], role_codes)
+        return np.sort(candidates[mask])
+
+    @staticmethod
+    def _role_codes(population: AgentPopulation, roles) -> Optional[List[int]]:
+        if roles is None:
+            return None
+        roles = [roles] if isinstance(roles, str) else roles
+        return [code for code in (population.role_code(role) for role in roles) if code >= 0]
+
+    def _materialize(self, segment, position: int) -> IndexedAgent:
+        if isinstance(segment, _MainSegment):
+            population, ecosystem_id = segment.population, int(segment.ecosystem_ids[position])
+        else:
+            population, ecosystem_id = segment, self._delta_ecosystem_ids[position]
+        agent = population.view(position)
+        return IndexedAgent(ecosystem_id=ecosystem_id, agent_id=agent.agent_id, role=agent.role,
+                            genetic_traits=agent.genetic_traits)
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# The modules under src/ import each other as top-level scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from meta_agent_demonstration import GenesisMetaCoordinator, VirtualClock  # noqa: E402
+
+
+@pytest.fixture
+def coordinator():
+    """A seeded coordinator on a virtual clock, so tasks run without the stage sleeps."""
+    return GenesisMetaCoordinator(seed=1, clock=VirtualClock(seed=1))
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from agent_population import TRAIT_NAMES, AgentPopulation
+from meta_agent_demonstration import PipelineResult
+
+
+@pytest.fixture
+def ecosystem(coordinator):
+    result = coordinator.handle_task(
+        "Create a complete e-commerce platform with inventory management, payment processing, and analytics dashboard"
+    )
+    return PipelineResult.from_dict(result).ecosystem_design
+
+
+def _rounded(spec):
+    traits = {name: float(np.float32(value)) for name, value in spec.genetic_traits.items()}
+    return (spec.agent_id, spec.role, traits, spec.specializations, spec.responsibilities, spec.collaboration_partners)
+
+
+def test_round_trip_keeps_every_field(ecosystem):
+    ecosystem.agent_specifications[0].collaboration_partners = [ecosystem.agent_specifications[1].agent_id]
+    population = AgentPopulation.from_ecosystem(ecosystem)
+
+    assert [_rounded(spec) for spec in population.to_specs()] == [_rounded(spec) for spec in ecosystem.agent_specifications]
+
+    rebuilt = population.to_ecosystem()
+    assert rebuilt.total_agents == ecosystem.total_agents
+    assert rebuilt.team_structure == ecosystem.team_structure
+    assert rebuilt.workflow_design == ecosystem.workflow_design
+    assert [agent.agent_id for agent in rebuilt.agent_specifications] == [agent.agent_id for agent in ecosystem.agent_specifications]
+
+
+def test_views_are_independent_copies(ecosystem):
+    population = AgentPopulation.from_ecosystem(ecosystem)
+    population.view(0).specializations.append("extra")
+
+    assert "extra" not in population.view(0).specializations
+
+
+def test_select_extend_and_append_keep_details(ecosystem):
+    population = AgentPopulation.from_ecosystem(ecosystem)
+    merged = AgentPopulation.from_traits(np.full((len(TRAIT_NAMES), 2), 0.5), "Backend Development")
+    merged.extend(population.select(slice(1, 3)))
+    merged.append(ecosystem.agent_specifications[0])
+
+    assert merged.view(0).specializations == ["Backend Development"]
+    assert merged.view(2).responsibilities == ecosystem.agent_specifications[2].responsibilities
+    assert merged.view(4).specializations == ecosystem.agent_specifications[0].specializations
+    assert len(merged) == 5
+
+
+def test_from_traits_populations_need_a_template():
+    population = AgentPopulation.from_traits(np.zeros((len(TRAIT_NAMES), 3)), ["A", "B", "A"])
+
+    assert population.role_codes.tolist() == [0, 1, 0]
+    assert population.view(-1).agent_id == "agent-3"
+    with pytest.raises(ValueError):
+        population.to_ecosystem()
+    with pytest.raises(ValueError):
+        AgentPopulation.from_traits(np.zeros((3, 3)), "A")
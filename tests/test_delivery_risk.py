@@ -0,0 +1,62 @@
+import numpy as np
+
+from delivery_risk import DeliveryRiskSimulator
+
+ROADMAP = {
+    "setup_phases": [
+        {"phase": "Design", "duration": "1-3 weeks", "dependencies": []},
+        {"phase": "Build", "duration": "2-4 weeks", "dependencies": ["Design"]},
+        {"phase": "Docs", "duration": "3 days", "dependencies": ["Design"]},
+        {"phase": "Launch", "duration": "1 week", "dependencies": ["Build", "Docs"]},
+    ]
+}
+RISKS = {"timeline_risk": 0.4, "scope_creep_risk": 0.3}
+
+
+class ZeroDraws:
+    """Generator stand-in whose uniforms are all exactly 0."""
+
+    def random(self, size, dtype=np.float64):
+        return np.zeros(size, dtype=dtype)
+
+
+def test_estimate_is_ordered_and_seeded():
+    estimate = DeliveryRiskSimulator(samples=20_000, seed=3, batch_size=7_000).simulate(ROADMAP, RISKS, deadline="8 weeks")
+    again = DeliveryRiskSimulator(samples=20_000, seed=3, batch_size=7_000).simulate(ROADMAP, RISKS, deadline="8 weeks")
+
+    assert estimate == again
+    assert estimate.nominal_days == 42
+    assert list(estimate.percentiles.values()) == sorted(estimate.percentiles.values())
+    assert estimate.mean_days > estimate.nominal_days
+    assert estimate.deadline_days == 56 and 0 < estimate.probability_late < 1
+    assert estimate.phase_criticality["Design"] == 1.0
+    assert estimate.phase_criticality["Build"] + estimate.phase_criticality["Docs"] == 1.0
+
+
+def test_no_risk_stays_within_the_roadmap_ranges():
+    estimate = DeliveryRiskSimulator(samples=5_000, seed=1).simulate(ROADMAP, {})
+
+    assert 7 + 14 + 7 <= estimate.percentiles["p50"] <= 21 + 28 + 7
+    assert estimate.phase_criticality["Docs"] == 0.0
+
+
+def test_zero_draws_never_make_durations_infinite():
+    simulator = DeliveryRiskSimulator(samples=16, seed=0)
+    simulator.rng = ZeroDraws()
+    low, high = np.array([7.0, 14.0]), np.array([21.0, 28.0])
+
+    completion = simulator._simulate_batch(16, low, (low + high) / 2, high, [[], [0]], RISKS, np.zeros(2, dtype=np.int64))
+
+    assert np.isfinite(completion).all()
+    estimate = DeliveryRiskSimulator(samples=100_000, seed=5).simulate(ROADMAP, {"timeline_risk": 1.0})
+    assert np.isfinite(estimate.mean_days) and np.isfinite(list(estimate.percentiles.values())).all()
+
+
+def test_simulate_result_uses_the_results_own_roadmap_and_risks(coordinator):
+    result = coordinator.handle_task("Build a REST API for user management with authentication")
+
+    estimate = DeliveryRiskSimulator(samples=2_000, seed=0).simulate_result(result)
+
+    assert set(estimate.phase_criticality) == {
+        phase["phase"] for phase in result["technology_stack"]["implementation_roadmap"]["setup_phases"]
+    }
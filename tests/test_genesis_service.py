@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+
+from genesis_service import GenesisService, _post_task, load_test
+from meta_agent_demonstration import GenesisMetaCoordinator, RealClock, VirtualClock
+
+
+class GatedClock(RealClock):
+    """Stage latency that blocks until the test opens the gate."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def stage_delay(self, stage, seconds):
+        self.gate.wait(10)
+
+
+async def _post(host, port, task_description):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        return await _post_task((reader, writer), host, task_description)
+    finally:
+        writer.close()
+
+
+def test_tasks_are_answered_and_batched():
+    async def scenario():
+        service = GenesisService(GenesisMetaCoordinator(seed=1, clock=VirtualClock(seed=1)), port=0)
+        await service.start()
+        try:
+            host, port = service.address
+            statuses = await asyncio.gather(*(_post(host, port, f"Build a REST API {index % 3}") for index in range(12)))
+        finally:
+            await service.stop()
+        return statuses, service
+
+    statuses, service = asyncio.run(scenario())
+
+    assert statuses == [200] * 12
+    assert service.batched_tasks == 12
+    assert service.batches < 12
+
+
+def test_stop_answers_waiting_requests_503():
+    clock = GatedClock()
+
+    async def scenario():
+        service = GenesisService(GenesisMetaCoordinator(seed=1, clock=clock), port=0, max_in_flight=1)
+        await service.start()
+        host, port = service.address
+        clients = [asyncio.ensure_future(_post(host, port, f"Build a todo app {index}")) for index in range(4)]
+        await asyncio.sleep(0.2)
+        await asyncio.wait_for(service.stop(), 5)
+        return await asyncio.wait_for(asyncio.gather(*clients), 5)
+
+    try:
+        statuses = asyncio.run(scenario())
+    finally:
+        clock.gate.set()
+
+    assert statuses == [503] * 4
+
+
+def test_bad_requests_are_rejected():
+    async def scenario():
+        service = GenesisService(GenesisMetaCoordinator(seed=1, clock=VirtualClock(seed=1)), port=0)
+        await service.start()
+        try:
+            host, port = service.address
+            reader, writer = await asyncio.open_connection(host, port)
+            body = json.dumps({"task_description": ""}).encode("utf-8")
+            writer.write(f"POST /tasks HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+            status = int((await reader.readline()).split()[1])
+            writer.close()
+            return status
+        finally:
+            await service.stop()
+
+    assert asyncio.run(scenario()) == 400
+
+
+def test_load_test_counts_refused_connections_as_errors():
+    async def scenario():
+        service = GenesisService(GenesisMetaCoordinator(seed=1, clock=VirtualClock(seed=1)), port=0)
+        await service.start()
+        host, port = service.address
+        await service.stop()
+        return await load_test(host, port, ["Build a REST API"], rps=50, duration=0.1)
+
+    report = asyncio.run(scenario())
+
+    assert report["requests"] == 5
+    assert report["errors"] == 5 and report["ok"] == 0
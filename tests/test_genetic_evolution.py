@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from agent_population import TRAIT_NAMES, AgentPopulation
+from genetic_evolution import GeneticEvolutionEngine, default_fitness
+
+
+def _traits(size, seed=0):
+    return np.random.default_rng(seed).uniform(0.3, 0.9, (len(TRAIT_NAMES), size)).astype(np.float32)
+
+
+def test_evolution_improves_fitness_and_keeps_traits_in_range():
+    engine = GeneticEvolutionEngine(mutation_rate=0.05, crossover_frequency=0.35, seed=0)
+    result = engine.evolve(_traits(2000), 10)
+
+    assert [stats.generation for stats in result.history] == list(range(11))
+    assert result.history[-1].mean_fitness > result.history[0].mean_fitness
+    assert result.traits.min() >= 0.0 and result.traits.max() <= 1.0
+    assert np.array_equal(result.fitness, default_fitness(result.traits))
+
+
+def test_seeded_runs_are_reproducible_and_leave_the_input_alone():
+    traits = _traits(500)
+    before = traits.copy()
+
+    first = GeneticEvolutionEngine(0.05, 0.35, seed=3).evolve(traits, 4)
+    second = GeneticEvolutionEngine(0.05, 0.35, seed=3).evolve(traits, 4)
+
+    assert np.array_equal(first.traits, second.traits)
+    assert np.array_equal(traits, before)
+
+
+def test_elites_survive_each_generation():
+    engine = GeneticEvolutionEngine(mutation_rate=1.0, crossover_frequency=1.0, mutation_scale=0.5,
+                                    elite_fraction=0.05, seed=1)
+    result = engine.evolve(_traits(1000), 5)
+
+    best = [stats.best_fitness for stats in result.history]
+    assert best == sorted(best)
+
+
+def test_population_input_keeps_roles_and_ids():
+    population = AgentPopulation.from_traits(_traits(20), ["Backend"] * 10 + ["Frontend"] * 10,
+                                             [f"agent-{index}" for index in range(20)])
+
+    result = GeneticEvolutionEngine.from_plan({"mutation_rate": 0.1, "crossover_frequency": 0.5}, seed=0).evolve(population, 2)
+
+    assert [agent.role for agent in result.population] == [agent.role for agent in population]
+    assert result.population.agent_id(5) == "agent-5"
+    assert np.array_equal(result.population.traits, result.traits)
+
+
+def test_rejects_bad_shapes_and_tournaments():
+    with pytest.raises(ValueError):
+        GeneticEvolutionEngine(0.05, 0.35).evolve(np.zeros((3, 10)), 1)
+    with pytest.raises(ValueError):
+        GeneticEvolutionEngine(0.05, 0.35, tournament_size=0)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from agent_population import TRAIT_NAMES
+from island_evolution import IslandEvolutionRunner
+
+PLAN = {"mutation_rate": 0.05, "crossover_frequency": 0.35}
+
+
+def _traits(size):
+    return np.random.default_rng(0).uniform(0.3, 0.9, (len(TRAIT_NAMES), size)).astype(np.float32)
+
+
+def test_islands_evolve_and_migrate():
+    result = IslandEvolutionRunner.from_plan(PLAN, islands=2, migration_interval=2, migrants=2, seed=1).run(_traits(40), 5)
+
+    assert result.island_bounds == [0, 20, 40]
+    assert result.migrations == 2
+    assert [len(history) for history in result.island_history] == [5, 5]
+    assert result.traits.shape == (len(TRAIT_NAMES), 40)
+
+
+def test_more_islands_than_individuals_is_rejected():
+    with pytest.raises(ValueError, match="4 islands"):
+        IslandEvolutionRunner.from_plan(PLAN, islands=4, seed=1).run(_traits(3), 2)
+
+
+def test_worker_setup_failure_is_reported():
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        IslandEvolutionRunner.from_plan({}, islands=2, seed=1).run(_traits(10), 2)
+
+
+def test_zero_migrants_disables_migration():
+    runner = IslandEvolutionRunner.from_plan(PLAN, islands=2, migration_interval=1, migrants=0, seed=1)
+    result = runner.run(_traits(20), 3)
+
+    assert result.migrations == 0
+    assert runner._migrate(result.traits, result.fitness, result.island_bounds) is None
+    with pytest.raises(ValueError):
+        IslandEvolutionRunner.from_plan(PLAN, islands=2, migrants=-1)
@@ -0,0 +1,312 @@
+import copy
+import cProfile
+import functools
+import json
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import meta_agent_demonstration
+from benchmarks import SyntheticTaskGenerator
+from meta_agent_demonstration import (
+    AnalysisCache, GenesisMetaCoordinator, SlowTaskProfiler, TaskScopeAnalyzer, VirtualClock, encode_result_json,
+    freeze, iter_jsonl_results, iter_task_descriptions, main
+)
+
+TASKS = [
+    "Fix a null pointer exception in the user login validation method",
+    "Build a REST API for user management with authentication and basic CRUD operations",
+    "Create a complete e-commerce platform with inventory management, payment processing, and analytics dashboard",
+]
+
+
+class FailingCoordinator(GenesisMetaCoordinator):
+    """Fails every task mentioning "explode"; module level so worker processes can unpickle it."""
+
+    def handle_task(self, task_description, keyword_hits=None, rng=None):
+        if "explode" in task_description:
+            raise RuntimeError("stage blew up")
+        return super().handle_task(task_description, keyword_hits, rng)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_handle_tasks_ordered_results_match_handle_task(coordinator, workers):
+    outcomes = list(coordinator.handle_tasks(TASKS, workers=workers, ordered=True, seed=3))
+
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2]
+    assert all(outcome.ok for outcome in outcomes)
+    assert [outcome.result["task_description"] for outcome in outcomes] == TASKS
+
+
+def test_handle_tasks_completion_order_reports_every_task(coordinator):
+    outcomes = list(coordinator.handle_tasks(TASKS * 2, workers=2, ordered=False))
+
+    assert sorted(outcome.index for outcome in outcomes) == list(range(6))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_handle_tasks_isolates_failures(workers):
+    coordinator = FailingCoordinator(seed=1, clock=VirtualClock(seed=1))
+    tasks = [TASKS[0], "Make the build explode", TASKS[1]]
+
+    outcomes = list(coordinator.handle_tasks(tasks, workers=workers))
+
+    assert [outcome.ok for outcome in outcomes] == [True, False, True]
+    assert outcomes[1].error == "RuntimeError: stage blew up"
+    assert outcomes[1].task_description == tasks[1]
+
+
+def test_handle_tasks_seed_makes_runs_reproducible(coordinator):
+    first = [outcome.result for outcome in coordinator.handle_tasks(TASKS, workers=2, seed=7)]
+    second = [outcome.result for outcome in coordinator.handle_tasks(TASKS, workers=1, seed=7)]
+
+    assert list(map(encode_result_json, first)) == list(map(encode_result_json, second))
+
+
+def test_handle_tasks_seed_leaves_the_global_rng_alone():
+    coordinator = GenesisMetaCoordinator(clock=VirtualClock(seed=1))
+    random.seed(42)
+    expected = random.random()
+    random.seed(42)
+
+    list(coordinator.handle_tasks(TASKS, workers=1, seed=7))
+
+    assert random.random() == expected
+
+
+def test_score_batch_matches_per_task_scores():
+    analyzer = TaskScopeAnalyzer(VirtualClock())
+    descriptions = [description for _, description in SyntheticTaskGenerator(0).generate(500)]
+    descriptions += TASKS + ["", "   ", "API api Api, micro-services; ML/AI!"]
+
+    scores, categories = analyzer.score_batch(descriptions)
+
+    for description, score, category in zip(descriptions, scores, categories):
+        expected = analyzer._calculate_scope_score(analyzer._extract_scope_indicators(description))
+        assert score == expected
+        assert category is analyzer._determine_scope_category(expected)
+
+
+def test_score_batch_spans_chunks():
+    analyzer = TaskScopeAnalyzer(VirtualClock())
+    pool = [description for _, description in SyntheticTaskGenerator(2).generate(300)]
+    repeats = analyzer.keyword_matcher.HIT_MATRIX_CHUNK // len(pool) + 2
+
+    scores, _ = analyzer.score_batch(pool * repeats)
+
+    assert scores.reshape(repeats, len(pool)).tolist() == [analyzer.score_batch(pool)[0].tolist()] * repeats
+
+
+def test_match_batch_matches_match():
+    matcher = TaskScopeAnalyzer(VirtualClock()).keyword_matcher
+    descriptions = [description for _, description in SyntheticTaskGenerator(1).generate(200)]
+
+    assert matcher.match_batch(descriptions) == [matcher.match(description) for description in descriptions]
+
+
+def test_cache_hit_returns_a_private_copy():
+    cache = AnalysisCache()
+    coordinator = GenesisMetaCoordinator(cache=cache, clock=VirtualClock(seed=1))
+
+    first = coordinator.handle_task(TASKS[1])
+    first["technology_stack"]["stack_name"] = "edited"
+    second = coordinator.handle_task("  " + TASKS[1].upper())
+
+    assert cache.stats()["hits"] == 1
+    assert second["technology_stack"]["stack_name"] != "edited"
+
+
+def test_handle_tasks_answers_cache_hits_in_process():
+    coordinator = GenesisMetaCoordinator(cache=AnalysisCache(), clock=VirtualClock(seed=1))
+    coordinator.handle_task(TASKS[0])
+
+    outcomes = list(coordinator.handle_tasks([TASKS[0], TASKS[1]], workers=2))
+
+    assert [outcome.from_cache for outcome in outcomes] == [True, False]
+
+
+def test_cache_entries_expire_after_ttl():
+    now = [0.0]
+    cache = AnalysisCache(ttl_seconds=10, timer=lambda: now[0])
+    cache.put("key", {"value": 1})
+
+    now[0] = 10.0
+    assert cache.get("key") == {"value": 1}
+    now[0] = 10.5
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = AnalysisCache(max_entries=2)
+    cache.put("a", {})
+    cache.put("b", {})
+    cache.get("a")
+    cache.put("c", {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {} and cache.get("c") == {}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_shelve_is_bounded_by_max_entries(tmp_path):
+    path = str(tmp_path / "cache")
+    now = [0.0]
+    cache = AnalysisCache(max_entries=3, path=path, timer=lambda: now[0])
+    for index in range(10):
+        now[0] = index
+        cache.put(f"k{index}", {"index": index})
+    assert sorted(cache._disk.keys()) == ["k7", "k8", "k9"]
+    cache.close()
+
+    # Reopening trims to the newest live entries and serves them
+    reopened = AnalysisCache(max_entries=2, ttl_seconds=1.5, path=path, timer=lambda: now[0])
+    assert sorted(reopened._disk.keys()) == ["k8", "k9"]
+    assert reopened.get("k9") == {"index": 9}
+    reopened.clear()
+    assert len(reopened._disk) == 0
+    reopened.close()
+
+
+def test_iter_task_descriptions_formats():
+    lines = ['{"task_description": "Build an API"}\n', '"Build a CLI"\n', "\n", "Plain text task\n",
+             '"Quoted" is how this task starts\n', '{"no_description": 1}\n']
+
+    auto = list(iter_task_descriptions(lines, "auto"))
+    assert auto[:4] == ["Build an API", "Build a CLI", "Plain text task", '"Quoted" is how this task starts']
+    assert "task_description" in auto[4].error
+
+    text = list(iter_task_descriptions(lines, "text"))
+    assert text[0] == '{"task_description": "Build an API"}'
+
+    jsonl = list(iter_task_descriptions(lines, "jsonl"))
+    assert jsonl[:2] == ["Build an API", "Build a CLI"]
+    assert [item.error.split(":")[0] for item in jsonl[2:4]] == ["JSONDecodeError", "JSONDecodeError"]
+
+
+def test_cli_writes_one_record_per_line(tmp_path, capsys):
+    tasks = tmp_path / "tasks.txt"
+    tasks.write_text('"Quoted" leads this text task\n{"task_description": "Build an API"}\n\nFix a typo\n')
+
+    code = main([str(tasks), "--quiet", "--virtual-clock", "--seed", "1", "--ordered"])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == 0
+    assert [record["task_description"] for record in records] == [
+        '"Quoted" leads this text task', "Build an API", "Fix a typo"
+    ]
+
+
+def test_cli_reports_malformed_jsonl_and_keeps_going(tmp_path, capsys):
+    tasks = tmp_path / "tasks.jsonl"
+    tasks.write_text('{"task_description": "Build an API"}\nnot json\n"Fix a typo"\n')
+    output = tmp_path / "results.jsonl"
+
+    code = main([str(tasks), "--format", "jsonl", "--output", str(output), "--quiet", "--virtual-clock",
+                 "--workers", "2", "--ordered"])
+
+    records = list(iter_jsonl_results(str(output)))
+    assert code == 1
+    assert [record.get("error", "").split(":")[0] for record in records] == ["", "JSONDecodeError", ""]
+    assert "Task 1 failed" in capsys.readouterr().err
+
+
+def test_cli_progress_from_spawned_workers_stays_off_stdout(tmp_path, capfd, monkeypatch):
+    tasks = tmp_path / "tasks.txt"
+    tasks.write_text("\n".join(TASKS) + "\n")
+    spawn_pool = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(meta_agent_demonstration, "ProcessPoolExecutor", spawn_pool)
+
+    code = main([str(tasks), "--virtual-clock", "--workers", "2", "--ordered"])
+
+    captured = capfd.readouterr()
+    assert code == 0
+    assert [json.loads(line)["task_description"] for line in captured.out.splitlines()] == TASKS
+    assert "Genesis Meta-Coordinator" in captured.err
+
+
+def test_profiler_never_fails_tasks_while_another_profiler_runs():
+    profiler = SlowTaskProfiler(threshold_seconds=0.0)
+    coordinator = GenesisMetaCoordinator(seed=1, clock=VirtualClock(seed=1), profiler=profiler)
+
+    # On Python 3.12+ only one profiler can be enabled at a time
+    outer = cProfile.Profile()
+    outer.enable()
+    try:
+        result = coordinator.handle_task(TASKS[1])
+    finally:
+        outer.disable()
+
+    assert result["task_description"] == TASKS[1]
+    assert all(outcome.ok for outcome in coordinator.handle_tasks(TASKS, workers=1))
+    assert profiler.profiles
+
+
+def test_shared_templates_are_copy_on_write(coordinator):
+    first = coordinator.handle_task(TASKS[2])
+    second = coordinator.handle_task(TASKS[2] + " with dashboards")
+
+    framework = first["performance_monitoring"]["monitoring_framework"]
+    name = next(iter(framework))
+    framework[name] = "edited"
+    framework["added"] = True
+    roadmap = first["technology_stack"]["implementation_roadmap"]
+    phase = next(iter(roadmap))
+    roadmap[phase][0]["edited"] = True
+    roadmap[phase].append({"added": True})
+
+    for other in (second, coordinator.handle_task(TASKS[2] + " and reports")):
+        assert other["performance_monitoring"]["monitoring_framework"][name] != "edited"
+        assert "added" not in other["performance_monitoring"]["monitoring_framework"]
+        assert "edited" not in other["technology_stack"]["implementation_roadmap"][phase][0]
+        assert {"added": True} not in other["technology_stack"]["implementation_roadmap"][phase]
+
+
+def test_agents_own_their_specialization_lists(coordinator):
+    agents = coordinator.handle_task(TASKS[2])["ecosystem_design"]["agent_specifications"]
+    agents[0]["specializations"].append("extra")
+    agents[0]["responsibilities"].append("extra")
+
+    for agent in agents[1:]:
+        assert "extra" not in agent["specializations"]
+        assert "extra" not in agent["responsibilities"]
+    fresh = coordinator.handle_task(TASKS[2])["ecosystem_design"]["agent_specifications"]
+    assert "extra" not in fresh[0]["specializations"]
+
+
+def test_deepcopy_of_a_result_is_fully_mutable(coordinator):
+    result = copy.deepcopy(coordinator.handle_task(TASKS[2]))
+
+    framework = result["performance_monitoring"]["monitoring_framework"]
+    framework["added"] = True
+    for value in framework.values():
+        if isinstance(value, dict):
+            value["added"] = True
+        elif isinstance(value, list):
+            value.append("added")
+
+    frozen = freeze({"nested": {"items": [1, {"deep": 2}]}})
+    plain = copy.deepcopy(frozen)
+    plain["nested"]["items"][1]["deep"] = 3
+    assert type(plain) is dict and type(plain["nested"]["items"]) is list
+    assert frozen["nested"]["items"][1]["deep"] == 2
+    assert copy.copy(frozen) is frozen
+
+
+
+def test_editing_a_replan_result_leaves_later_replans_alone(coordinator):
+    first = coordinator.replan_task(TASKS[2], task_id="shop")
+    first["ecosystem_design"]["agent_specifications"][0]["genetic_traits"]["edited"] = True
+    roadmap = first["technology_stack"]["implementation_roadmap"]
+    phase = next(iter(roadmap))
+    roadmap[phase].append({"added": True})
+
+    second = coordinator.replan_task(TASKS[2] + " with dashboards", task_id="shop")
+
+    assert "ecosystem_design" in second["incremental"]["reused"]
+    assert "edited" not in second["ecosystem_design"]["agent_specifications"][0]["genetic_traits"]
+    assert {"added": True} not in second["technology_stack"]["implementation_roadmap"][phase]
+    third = coordinator.replan_task(TASKS[2] + " with dashboards", task_id="shop")
+    assert all(third[name] == second[name] for name in coordinator.PIPELINE_STAGES)
@@ -0,0 +1,72 @@
+import math
+
+import pytest
+
+from meta_agent_demonstration import AgentPerformanceMonitor, PipelineResult
+from optimization_rules import RECOMMENDATION_FIELDS, Rule, RuleEngine
+from performance_stream import PerformanceStream
+
+
+def _snapshot(agent=None, team=None, ecosystem=None):
+    return {"agent": agent or {}, "team": team or {}, "ecosystem": ecosystem or {}}
+
+
+def test_threshold_rules_need_their_fraction_of_agents():
+    rules = [
+        Rule("quality_scores", "below", 0.6, "Quality", "Pair reviewers", "Fewer defects", min_fraction=0.5),
+        Rule("quality_scores", "below", 0.9, "Quality", "Raise the bar", "Better output", min_fraction=0.5),
+        Rule("task_completion_rate", "above", 0.95, "Throughput", "Take on more work", "More delivered"),
+    ]
+    engine = RuleEngine(rules)
+
+    fired = engine.evaluate(_snapshot(agent={
+        "quality_scores": [0.5, 0.7, 0.8, math.nan],
+        "task_completion_rate": [0.99, 0.5, None, 0.2],
+    }))
+
+    # NaN and None mean "no data": one of three scored agents is below 0.6, all three below 0.9
+    assert [recommendation["recommendation"] for recommendation in fired] == ["Raise the bar", "Take on more work"]
+    assert set(fired[0]) == set(RECOMMENDATION_FIELDS)
+    assert engine.ticks == 1
+
+
+def test_trend_rules_need_consecutive_moves():
+    engine = RuleEngine([Rule("emergent_properties", "falling", 2, "Adaptation", "Refresh", "Faster response")])
+
+    for value, expected in ((0.9, []), (0.8, []), (0.7, ["Refresh"]), (0.75, []), (0.7, []), (0.6, ["Refresh"])):
+        fired = engine.evaluate(_snapshot(ecosystem={"emergent_properties": value}))
+        assert [recommendation["recommendation"] for recommendation in fired] == expected
+
+
+def test_trend_rules_ignore_agents_registered_since_the_window_started():
+    engine = RuleEngine([Rule("quality_scores", "rising", 1, "Quality", "Share practices", "Consistency",
+                              min_fraction=1.0)])
+
+    engine.evaluate(_snapshot(agent={"quality_scores": [0.5]}))
+    assert engine.evaluate(_snapshot(agent={"quality_scores": [0.6, 0.9]})) == []
+    assert engine.evaluate(_snapshot(agent={"quality_scores": [0.7, 0.95]}))
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        Rule("quality_scores", "sideways", 0.5, "Quality", "x", "y")
+    with pytest.raises(ValueError):
+        Rule("no_such_metric", "below", 0.5, "Quality", "x", "y")
+
+
+def test_monitor_recommends_what_the_latest_tick_fired(coordinator):
+    stream = PerformanceStream()
+    engine = RuleEngine()
+    monitor = AgentPerformanceMonitor(stream=stream, rules=engine)
+    result = PipelineResult.from_dict(coordinator.handle_task("Build a REST API for user management"))
+    monitoring = monitor.setup_monitoring(result.ecosystem_design, result.evolution_strategy)
+    static_areas = [recommendation["area"] for recommendation in monitoring.optimization_recommendations]
+
+    for agent in result.ecosystem_design.agent_specifications:
+        stream.record(stream.agent_key(monitoring.stream_namespace, agent.agent_id), "task_failed", timestamp=1.0)
+    engine.tick(stream)
+
+    monitoring = monitor.setup_monitoring(result.ecosystem_design, result.evolution_strategy)
+    areas = [recommendation["area"] for recommendation in monitoring.optimization_recommendations]
+    assert areas != static_areas
+    assert areas == [rule.area for rule in engine.fired] and "Individual Performance" in areas
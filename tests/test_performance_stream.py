@@ -0,0 +1,85 @@
+import pytest
+
+from meta_agent_demonstration import AgentPerformanceMonitor, PipelineResult
+from performance_stream import LogBucketSketch, PerformanceStream
+
+
+def test_ecosystems_with_repeated_agent_ids_stay_apart(coordinator):
+    stream = PerformanceStream()
+    coordinator.performance_monitor.stream = stream
+    namespaces = [
+        coordinator.handle_task(task)["performance_monitoring"]["stream_namespace"]
+        for task in ("Fix a typo in the login page", "Fix a null pointer exception in the user login validation method")
+    ]
+
+    assert namespaces[0] != namespaces[1]
+    first, second = (stream.agent_key(namespace, "specialist-1") for namespace in namespaces)
+    assert {first, second} <= set(stream.agent_ids())
+
+    stream.record(first, "quality_score", 0.9, timestamp=1.0)
+    assert stream.metric("quality_scores", agent_id=first) == 0.9
+    assert stream.metric("quality_scores", agent_id=second) is None
+
+
+def test_register_ecosystem_uses_the_given_namespace(coordinator):
+    stream = PerformanceStream()
+    result = coordinator.handle_task("Create a complete e-commerce platform with inventory management")
+    ecosystem = PipelineResult.from_dict(result).ecosystem_design
+
+    assert stream.register_ecosystem(ecosystem, namespace="shop") == "shop"
+    assert stream.agent_ids() == [stream.agent_key("shop", agent.agent_id) for agent in ecosystem.agent_specifications]
+
+    monitoring = AgentPerformanceMonitor(stream=stream).setup_monitoring(ecosystem, None, namespace="shop-2")
+    assert monitoring.stream_namespace == "shop-2"
+    assert stream.agent_key("shop-2", ecosystem.agent_specifications[0].agent_id) in stream.agent_ids()
+
+
+def test_record_many_is_all_or_nothing():
+    stream = PerformanceStream()
+    stream.register_agent("a", "Backend")
+
+    with pytest.raises(ValueError):
+        stream.record_many([("a", "quality_score", 0.8, 1.0), ("b", "bogus", 1.0, 1.0)])
+    with pytest.raises(ValueError):
+        stream.record_many([("a", "quality_score", 0.8, 1.0), ("b", "task_completed", 1.0)])
+    with pytest.raises(ValueError):
+        stream.record_many([("a", "quality_score", 0.8, 1.0), ("b", "quality_score", float("nan"), 1.0)])
+    with pytest.raises(TypeError):
+        stream.record_many([("a", "quality_score", 0.8, 1.0), ("b", "quality_score", "high", 1.0)])
+    with pytest.raises(ValueError):
+        stream.record("c", "bogus")
+
+    assert stream.events == 0
+    assert stream.agent_ids() == ["a"]
+    assert stream.metric("quality_scores", agent_id="a") is None
+
+
+def test_aggregates_and_baseline_metrics():
+    stream = PerformanceStream(alpha=0.5)
+    stream.register_agent("a", "Backend")
+    stream.register_agent("b", "Frontend")
+    count = stream.record_many([
+        ("a", "task_completed", 1.0, 10.0),
+        ("a", "quality_score", 0.8, 11.0),
+        ("b", "task_failed", 1.0, 12.0),
+        ("a", "collaboration", 0.6, 13.0, "b"),
+    ])
+
+    assert count == 4
+    assert stream.metric("task_completion_rate", agent_id="a") == 1.0
+    assert stream.agent_average("task_completion_rate") == 0.5
+    assert stream.metric("team_velocity", team="Backend") == 1.0
+    assert stream.metric("emergent_properties") == 1.0
+
+    baseline = stream.baseline_metrics(AgentPerformanceMonitor.BASELINE_METRICS)
+    assert baseline["individual_performance_avg"] == 0.5
+    assert baseline["innovation_index"] == AgentPerformanceMonitor.BASELINE_METRICS["innovation_index"]
+
+
+def test_log_bucket_sketch_relative_accuracy():
+    sketch = LogBucketSketch(relative_accuracy=0.01)
+    for value in range(1, 10001):
+        sketch.add(value / 100)
+
+    assert sketch.quantile(0.5) == pytest.approx(50.0, rel=0.011)
+    assert sketch.quantile(0.99) == pytest.approx(99.0, rel=0.011)
@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from meta_agent_demonstration import JsonlResultWriter, TaskScope
+from result_store import ResultStore
+
+TASKS = [
+    "Build a REST API for user management with authentication and basic CRUD operations",
+    "Create a complete e-commerce platform with inventory management, payment processing, and analytics dashboard",
+]
+
+
+@pytest.fixture
+def results(coordinator):
+    return [coordinator.handle_task(task) for task in TASKS]
+
+
+def test_add_and_query(tmp_path, results):
+    with ResultStore(str(tmp_path / "results.db"), batch_size=1) as store:
+        task_ids = [store.add(result) for result in results]
+
+        assert store.count_tasks() == 2
+        loaded = store.load_result(task_ids[1])
+        assert loaded.task_description == TASKS[1]
+        stored = store.get_task(task_ids[0])
+        assert isinstance(stored.scope_category, TaskScope)
+        assert len(store.find_agents(task_id=task_ids[1], limit=None)) == results[1]["ecosystem_design"]["total_agents"]
+
+
+def test_ingest_skips_error_records(tmp_path, results):
+    path = str(tmp_path / "results.jsonl")
+    with JsonlResultWriter(path) as sink:
+        sink.write(results[0])
+        sink.write({"index": 1, "task_description": "x", "error": "ValueError: boom"})
+        sink.write(results[1])
+
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        assert store.ingest_jsonl(path) == 2
+        assert store.skipped == 1
+        assert store.count_tasks() == 2
+
+
+@pytest.mark.parametrize("record", [{"index": 1, "task_description": "x", "error": "E"}, {"task_description": "x"}])
+def test_add_rejects_non_results(tmp_path, record):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        with pytest.raises(ValueError):
+            store.add(record)
+        store.flush()
+        assert store.count_tasks() == 0
+
+
+def test_failed_flush_keeps_the_batch_for_a_retry(tmp_path, results):
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path, batch_size=10)
+    task_ids = [store.add(result) for result in results]
+    store._connection.execute("PRAGMA busy_timeout = 0")
+
+    # Another connection holding the write lock makes the insert fail
+    blocker = sqlite3.connect(path)
+    blocker.execute("BEGIN IMMEDIATE")
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    blocker.rollback()
+    blocker.close()
+
+    store.flush()
+    assert store.count_tasks() == 2
+    assert [store.get_task(task_id).task_description for task_id in task_ids] == TASKS
+    store.close()
+
+
+def test_writers_sharing_a_database_get_distinct_ids(tmp_path, results):
+    path = str(tmp_path / "results.db")
+    first, second = ResultStore(path, batch_size=2), ResultStore(path, batch_size=2)
+
+    ids = []
+    for _ in range(3):
+        ids.append(first.add(results[0]))
+        ids.append(second.add(results[1]))
+    first.close()
+    second.close()
+
+    assert len(set(ids)) == 6
+    with ResultStore(path) as reopened:
+        assert reopened.count_tasks() == 6
+        assert reopened.add(results[0]) > max(ids)
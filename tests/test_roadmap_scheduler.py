@@ -0,0 +1,73 @@
+import pytest
+
+from roadmap_scheduler import CyclicDependencyError, RoadmapScheduler, parse_duration
+
+ROADMAP = {
+    "setup_phases": [
+        {"phase": "Design", "duration": "1-3 weeks", "dependencies": []},
+        {"phase": "Build", "duration": "2-4 weeks", "dependencies": ["Design"]},
+        {"phase": "Docs", "duration": "3 days", "dependencies": ["Design"]},
+        {"phase": "Launch", "duration": "1 week", "dependencies": ["Build", "Docs"]},
+    ]
+}
+
+
+def test_parse_duration():
+    assert parse_duration("2-4 weeks") == (14.0, 28.0)
+    assert parse_duration("3 days") == (3.0, 3.0)
+    assert parse_duration("1 to 2 months") == (30.0, 60.0)
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+    with pytest.raises(ValueError):
+        parse_duration("4-2 weeks")
+
+
+def test_critical_path_and_slack():
+    scheduler = RoadmapScheduler()
+    scheduler.add_roadmap(ROADMAP, namespace="eco")
+
+    assert scheduler.makespan == 14 + 21 + 7
+    assert scheduler.critical_path() == ["eco/Design", "eco/Build", "eco/Launch"]
+    assert scheduler.phase_schedule("eco/Docs").slack == 18
+    assert [phase.critical for phase in scheduler.schedule()] == [True, True, False, True]
+
+
+def test_float_durations_keep_the_critical_chain_critical():
+    scheduler = RoadmapScheduler()
+    scheduler.add_phase("x", 0.1)
+    scheduler.add_phase("y", 0.2, ["x"])
+    scheduler.add_phase("z", 0.3, ["y"])
+    scheduler.add_phase("side", 0.1, ["x"])
+
+    assert [phase.critical for phase in scheduler.schedule()] == [True, True, False, True]
+
+
+def test_update_duration_matches_a_full_reschedule():
+    scheduler = RoadmapScheduler()
+    scheduler.add_roadmap(ROADMAP, namespace="a")
+    scheduler.add_roadmap(ROADMAP, namespace="b", after=["a/Launch"])
+    scheduler.makespan
+    scheduler.update_duration("a/Docs", "6 weeks")
+
+    fresh = RoadmapScheduler()
+    fresh.add_roadmap(ROADMAP, namespace="a")
+    fresh.add_roadmap(ROADMAP, namespace="b", after=["a/Launch"])
+    fresh.update_duration("a/Docs", "6 weeks")
+
+    assert scheduler.schedule() == fresh.schedule()
+    assert scheduler.critical_path()[:2] == ["a/Design", "a/Docs"]
+
+
+def test_cycles_and_unknown_dependencies_are_reported():
+    scheduler = RoadmapScheduler()
+    scheduler.add_phase("a", 1, ["c"])
+    scheduler.add_phase("b", 1, ["a"])
+    scheduler.add_phase("c", 1, ["b"])
+    with pytest.raises(CyclicDependencyError) as raised:
+        scheduler.makespan
+    assert sorted(raised.value.cycle) == ["a", "b", "c"]
+
+    scheduler = RoadmapScheduler()
+    scheduler.add_phase("a", 1, ["missing"])
+    with pytest.raises(ValueError, match="unknown phase"):
+        scheduler.schedule()
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from agent_population import TRAIT_NAMES, AgentPopulation
+from trait_index import TraitIndex
+
+ROLES = ("Backend Development", "Frontend Development", "Security Specialist")
+
+
+def _population(size, seed):
+    rng = np.random.default_rng(seed)
+    traits = rng.uniform(0.0, 1.0, (len(TRAIT_NAMES), size)).astype(np.float32)
+    return AgentPopulation.from_traits(traits, [ROLES[code] for code in rng.integers(0, len(ROLES), size)])
+
+
+@pytest.fixture
+def index():
+    # Small merge threshold, so queries see both a merged main segment and a delta
+    index = TraitIndex(merge_threshold=300)
+    for seed in range(6):
+        index.add_population(_population(100, seed))
+    return index
+
+
+def _all_agents(index):
+    return index.range_query(limit=None)
+
+
+def test_range_query_matches_a_linear_scan(index):
+    bounds = {"quality_obsession": (0.6, None), "risk_tolerance": (None, 0.4)}
+    expected = [agent for agent in _all_agents(index)
+                if agent.role == "Security Specialist"
+                and agent.genetic_traits["quality_obsession"] >= np.float32(0.6)
+                and agent.genetic_traits["risk_tolerance"] <= np.float32(0.4)]
+
+    found = index.range_query(roles="Security Specialist", limit=None, **bounds)
+
+    key = lambda agent: (agent.ecosystem_id, agent.agent_id)
+    assert sorted(map(key, found)) == sorted(map(key, expected))
+    assert index.count(roles="Security Specialist", **bounds) == len(expected)
+
+
+def test_inclusive_bounds_match_values_stored_as_float32():
+    index = TraitIndex()
+    index.add_population(AgentPopulation.from_traits(np.full((len(TRAIT_NAMES), 3), 0.9), "Backend Development"))
+    index.add_population(AgentPopulation.from_traits(np.full((len(TRAIT_NAMES), 3), 0.9), "Backend Development"))
+
+    assert index.count(quality_obsession=(0.9, 0.9)) == 6
+    assert index.count(quality_obsession=(np.float64(0.9), np.float64(0.9))) == 6
+    assert index.count(quality_obsession=(None, 0.9), risk_tolerance=(0.9, None)) == 6
+
+
+def test_nearest_matches_brute_force(index):
+    query = [0.2, 0.8, 0.5, 0.4]
+    agents = _all_agents(index)
+    distances = sorted(np.linalg.norm(np.array([agent.genetic_traits[name] for name in TRAIT_NAMES]) - query)
+                       for agent in agents)
+
+    nearest = index.nearest(query, k=7)
+
+    assert [agent.distance for agent in nearest] == pytest.approx(distances[:7])
+    assert all(agent.role == "Frontend Development" for agent in index.nearest(query, k=5, roles="Frontend Development"))
+
+
+def test_nearest_with_no_neighbors_requested(index):
+    assert index.nearest([0.5] * 4, k=0) == []
+    assert index.nearest([0.5] * 4, k=-1) == []
+
+
+def test_unknown_traits_are_rejected(index):
+    with pytest.raises(ValueError):
+        index.count(charisma=(0.5, None))